@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Run fast paths against the reference implementations and report agreement."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from prime_formulas.differential import run_differential  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=0, help="Seed for random inputs")
+    parser.add_argument("--count", type=int, default=200, help="Number of random inputs")
+    parser.add_argument("--bits", type=int, default=40, help="Bit size of random inputs")
+    parser.add_argument("--json", type=Path, help="Write the full report to this file")
+    args = parser.parse_args()
+
+    reports = run_differential(seed=args.seed, random_count=args.count, bits=args.bits)
+    failed = False
+    for group, items in reports.items():
+        print(f"[{group}]")
+        for report in items:
+            speedup = f"{report.speedup:8.3g}x" if report.speedup else "       -"
+            print(
+                f"  {report.name:<28} checked={report.checked:<5} skipped={report.skipped:<5} "
+                f"speedup={speedup} mismatches={len(report.mismatches)}"
+            )
+            for n, kind, expected, got in report.mismatches[:5]:
+                print(f"    {kind}: n={n} expected={expected} got={got}")
+            if group != "advisory" and report.mismatches:
+                failed = True
+
+    if args.json:
+        payload = {group: [r.to_dict() for r in items] for group, items in reports.items()}
+        args.json.write_text(json.dumps(payload, indent=2))
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,18 @@
 from __future__ import annotations
 
 import argparse
+import ast
+import hashlib
+import importlib
 import json
+import multiprocessing
+import os
+import signal
+import tempfile
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 import sys
 
@@ -17,7 +25,11 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from prime_formulas.catalog import load_all_algorithms  # noqa: E402
-from prime_formulas.registry import get, list_algorithms  # noqa: E402
+from prime_formulas.payload import MAX_POINTS, shape  # noqa: E402
+from prime_formulas.registry import get, get_metadata, list_algorithms  # noqa: E402
+from prime_formulas.results import json_default  # noqa: E402
+
+MANIFEST_NAME = ".manifest.json"
 
 
 def run_sample(name: str, sample_input: Dict[str, Any]) -> Dict[str, Any]:
@@ -25,6 +37,122 @@ def run_sample(name: str, sample_input: Dict[str, Any]) -> Dict[str, Any]:
     return algo.run(**sample_input)
 
 
+@lru_cache(maxsize=None)
+def _package_imports(module_name: str) -> FrozenSet[str]:
+    """``prime_formulas`` modules (and their parent packages) ``module_name`` imports."""
+
+    module = importlib.import_module(module_name)
+    path = Path(module.__file__)
+    package = module_name if path.name == "__init__.py" else module_name.rpartition(".")[0]
+    candidates = set()
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.Import):
+            candidates.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                base = importlib.util.resolve_name("." * node.level + base, package)
+            candidates.add(base)
+            # ``from .utils import primes`` imports a submodule, not a name.
+            candidates.update(f"{base}.{alias.name}" for alias in node.names)
+    found = set()
+    for name in candidates:
+        if name.split(".")[0] != "prime_formulas":
+            continue
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue  # an attribute, not a module
+        parts = name.split(".")
+        found.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    # Namespace packages have no source of their own.
+    found = {name for name in found if getattr(sys.modules[name], "__file__", None)}
+    found.discard(module_name)
+    return frozenset(found)
+
+
+def source_closure(module_name: str) -> Tuple[str, ...]:
+    """``module_name`` and every ``prime_formulas`` module it transitively imports."""
+
+    seen = {module_name}
+    stack = [module_name]
+    while stack:
+        for name in _package_imports(stack.pop()):
+            if name not in seen:
+                seen.add(name)
+                stack.append(name)
+    return tuple(sorted(seen))
+
+
+def sample_hash(name: str) -> str:
+    """Hash the metadata and the source of every package module the algorithm uses.
+
+    Shared helpers (sieves, modular arithmetic, ...) decide sample output as
+    much as the algorithm module itself, so the whole import closure counts.
+    """
+
+    digest = hashlib.sha256()
+    for module_name in source_closure(type(get(name)).__module__):
+        digest.update(module_name.encode() + b"\0")
+        digest.update(Path(sys.modules[module_name].__file__).read_bytes())
+    meta = json.dumps(asdict(get_metadata(name)), sort_keys=True, default=str)
+    digest.update(meta.encode())
+    return digest.hexdigest()
+
+
+def write_json_atomic(path: Path, payload: Any, **kwargs: Any) -> None:
+    """Stream JSON into a temporary sibling file, then rename it over ``path``."""
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            json.dump(payload, handle, default=json_default, **kwargs)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _on_alarm(signum: int, frame: Any) -> None:
+    raise TimeoutError("sample run exceeded timeout")
+
+
+def _export_sample(
+    name: str,
+    sample_input: Dict[str, Any],
+    digest: str,
+    path: Path,
+    timeout: Optional[float],
+    max_points: int = MAX_POINTS,
+) -> Tuple[str, str]:
+    """Run one sample in a worker and write its JSON file; returns (name, status).
+
+    With ``max_points`` the output is shaped for the webapp by the algorithm's
+    visualization mode (see :mod:`prime_formulas.payload`).
+    """
+
+    use_alarm = timeout and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    status = "ok"
+    try:
+        result = run_sample(name, sample_input)
+        if max_points:
+            result = shape(result, get_metadata(name).visualization.mode, budget=max_points)
+    except Exception as exc:  # noqa: BLE001
+        result = {"error": str(exc)}
+        status = "timeout" if isinstance(exc, TimeoutError) else "error"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    write_json_atomic(
+        path, {"input": sample_input, "hash": digest, "output": result}, indent=2
+    )
+    return name, status
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -44,6 +172,29 @@ def main() -> None:
         action="store_true",
         help="Generate sample runs for algorithms that define sample_input in metadata.",
     )
+    parser.add_argument(
+        "--jobs",
+        default=os.cpu_count() or 1,
+        type=int,
+        help="Worker processes for sample runs.",
+    )
+    parser.add_argument(
+        "--timeout",
+        default=60.0,
+        type=float,
+        help="Per-sample timeout in seconds (0 disables).",
+    )
+    parser.add_argument(
+        "--max-points",
+        default=MAX_POINTS,
+        type=int,
+        help="Summarize sample sequences longer than this for the webapp (0 keeps everything).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate samples even when their source/metadata hash is unchanged.",
+    )
     args = parser.parse_args()
 
     load_all_algorithms()
@@ -52,26 +203,52 @@ def main() -> None:
     args.output.parent.mkdir(parents=True, exist_ok=True)
     args.examples_dir.mkdir(parents=True, exist_ok=True)
 
-    json.dump([asdict(meta) for meta in metas], args.output.open("w"), indent=2)
-
-    if args.samples:
-        for meta in metas:
-            viz = meta.visualization
-            if viz and viz.sample_input:
-                try:
-                    result = run_sample(meta.name, viz.sample_input)
-                except Exception as exc:  # noqa: BLE001
-                    result = {"error": str(exc)}
-                sample_path = args.examples_dir / f"{meta.name}.json"
-                json.dump(
-                    {
-                        "input": viz.sample_input,
-                        "output": result,
-                    },
-                    sample_path.open("w"),
-                    indent=2,
-                )
+    write_json_atomic(args.output, [asdict(meta) for meta in metas], indent=2)
+
+    if not args.samples:
+        return
+
+    manifest_path = args.examples_dir / MANIFEST_NAME
+    try:
+        manifest: Dict[str, str] = json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    jobs = []
+    digests: Dict[str, str] = {}
+    up_to_date = 0
+    for meta in metas:
+        viz = meta.visualization
+        if not (viz and viz.sample_input):
+            continue
+        digest = sample_hash(meta.name)
+        sample_path = args.examples_dir / f"{meta.name}.json"
+        if not args.force and manifest.get(meta.name) == digest and sample_path.exists():
+            up_to_date += 1
+            continue
+        digests[meta.name] = digest
+        jobs.append(
+            (
+                meta.name,
+                viz.sample_input,
+                digest,
+                sample_path,
+                args.timeout or None,
+                args.max_points,
+            )
+        )
 
+    if jobs:
+        processes = max(1, min(args.jobs, len(jobs)))
+        with multiprocessing.Pool(processes, initializer=load_all_algorithms) as pool:
+            for name, status in pool.starmap(_export_sample, jobs):
+                if status == "ok":
+                    manifest[name] = digests[name]
+                else:
+                    manifest.pop(name, None)
+                    print(f"{name}: {status}", file=sys.stderr)
+        write_json_atomic(manifest_path, manifest, indent=2, sort_keys=True)
+    print(f"samples: {len(jobs)} regenerated, {up_to_date} up to date")
 
 if __name__ == "__main__":
     main()
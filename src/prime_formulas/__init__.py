@@ -1,5 +1,5 @@
 """PrimeNag package."""
 
-from .registry import get, list_algorithms
+from .registry import executor, get, list_algorithms
 
-__all__ = ["get", "list_algorithms"]
+__all__ = ["executor", "get", "list_algorithms"]
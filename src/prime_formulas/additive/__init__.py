@@ -0,0 +1 @@
+"""Additive problems: sums of primes (Goldbach)."""
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ..interfaces import PrimeAlgorithm
+from ..registry import register
+from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..utils.primes import iter_primes
+
+# Admissible constellations counted by offset pattern (all members prime).
+PATTERNS: Dict[str, Tuple[int, ...]] = {
+    "twin": (0, 2),
+    "cousin": (0, 4),
+    "sexy": (0, 6),
+    "triplet_a": (0, 2, 6),
+    "triplet_b": (0, 4, 6),
+    "quadruplet": (0, 2, 6, 8),
+}
+_PATTERN_ITEMS = tuple(PATTERNS.items())
+# Widest pattern span: the only history needed to detect a constellation.
+_SPAN = max(offsets[-1] for offsets in PATTERNS.values())
+
+
+class GapStatistics:
+    """One-pass, constant-memory summary of consecutive primes.
+
+    Keeps the gap histogram, the first prime preceding each gap size and the
+    constellation counts. Only primes within ``_SPAN`` of either end are
+    retained, which is all :meth:`merge` needs to join adjacent segments.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.first: Optional[int] = None
+        self.last: Optional[int] = None
+        self.histogram: Dict[int, int] = {}
+        self.first_occurrence: Dict[int, int] = {}
+        self.patterns: Dict[str, int] = dict.fromkeys(PATTERNS, 0)
+        self.head: List[int] = []
+        self.tail: Deque[int] = deque()
+
+    def _record_gap(self, before: int, gap: int) -> None:
+        self.histogram[gap] = self.histogram.get(gap, 0) + 1
+        seen = self.first_occurrence.get(gap)
+        if seen is None or before < seen:
+            self.first_occurrence[gap] = before
+
+    def add(self, p: int) -> None:
+        """Consume the next prime (primes must arrive in increasing order)."""
+
+        last = self.last
+        if last is None:
+            self.first = p
+        else:
+            gap = p - last
+            hits = self.histogram.get(gap)
+            if hits is None:
+                self.histogram[gap] = 1
+                self.first_occurrence[gap] = last
+            else:
+                self.histogram[gap] = hits + 1
+        if p - self.first <= _SPAN:
+            self.head.append(p)
+
+        tail = self.tail
+        while tail and tail[0] < p - _SPAN:
+            tail.popleft()
+        if tail:
+            # Constellations ending at p only involve primes within _SPAN of it.
+            patterns = self.patterns
+            for name, offsets in _PATTERN_ITEMS:
+                start = p - offsets[-1]
+                if all(start + o in tail for o in offsets[:-1]):
+                    patterns[name] += 1
+        tail.append(p)
+
+        self.last = p
+        self.count += 1
+
+    def extend(self, primes: Iterable[int]) -> "GapStatistics":
+        for p in primes:
+            self.add(p)
+        return self
+
+    def merge(self, other: "GapStatistics") -> "GapStatistics":
+        """Combine with statistics of the segment immediately following this one."""
+
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        merged = GapStatistics()
+        merged.count = self.count + other.count
+        merged.first = self.first
+        merged.last = other.last
+        merged.histogram = dict(self.histogram)
+        merged.first_occurrence = dict(self.first_occurrence)
+        for gap, hits in other.histogram.items():
+            merged.histogram[gap] = merged.histogram.get(gap, 0) + hits
+        for gap, before in other.first_occurrence.items():
+            seen = merged.first_occurrence.get(gap)
+            if seen is None or before < seen:
+                merged.first_occurrence[gap] = before
+        merged._record_gap(self.last, other.first - self.last)
+
+        # Constellations that start in this segment and end in the next one.
+        window = set(self.tail) | set(other.head)
+        for name, offsets in PATTERNS.items():
+            merged.patterns[name] = self.patterns[name] + other.patterns[name]
+            for start in self.tail:
+                if start + offsets[-1] > self.last and all(start + o in window for o in offsets):
+                    merged.patterns[name] += 1
+
+        merged.head = [p for p in self.head + other.head if p - merged.first <= _SPAN]
+        merged.tail = deque(
+            p for p in list(self.tail) + list(other.tail) if merged.last - p <= _SPAN
+        )
+        return merged
+
+    def maximal_gaps(self) -> List[Tuple[int, int]]:
+        """Return (gap, preceding prime) for every gap larger than all earlier ones."""
+
+        records: List[Tuple[int, int]] = []
+        for gap, before in sorted(self.first_occurrence.items(), key=lambda item: item[1]):
+            if not records or gap > records[-1][0]:
+                records.append((gap, before))
+        return records
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "first": self.first,
+            "last": self.last,
+            "histogram": dict(sorted(self.histogram.items())),
+            "max_gap": max(self.histogram, default=0),
+            "first_occurrence": dict(sorted(self.first_occurrence.items())),
+            "maximal_gaps": [{"gap": g, "after": p} for g, p in self.maximal_gaps()],
+            "pairs": {k: self.patterns[k] for k in ("twin", "cousin", "sexy")},
+            "triplets": self.patterns["triplet_a"] + self.patterns["triplet_b"],
+            "quadruplets": self.patterns["quadruplet"],
+        }
+
+
+def segment_gap_statistics(lo: int, hi: int) -> GapStatistics:
+    """Statistics for primes in [lo, hi) from a segmented sieve stream."""
+
+    return GapStatistics().extend(iter_primes(lo, hi))
+
+
+def prime_gap_statistics(
+    lo: int, hi: int, *, workers: int = 1, chunk_size: int = 1 << 22
+) -> GapStatistics:
+    """Statistics for primes in [lo, hi), optionally split across processes."""
+
+    bounds = [(s, min(s + chunk_size, hi)) for s in range(lo, hi, chunk_size)]
+    if workers <= 1 or len(bounds) <= 1:
+        parts = [segment_gap_statistics(a, b) for a, b in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(segment_gap_statistics, *zip(*bounds)))
+    return reduce(GapStatistics.merge, parts, GapStatistics())
+
+
+class PrimeGapStatisticsAlgo(PrimeAlgorithm):
+    name = "prime_gaps"
+    category = "analytic"
+
+    def run(self, n: int, *, lo: int = 2, workers: int = 1) -> Dict[str, Any]:
+        start = time.perf_counter()
+        stats = prime_gap_statistics(lo, n + 1, workers=workers)
+        return {
+            "result": stats.to_dict(),
+            "meta": {"time_ms": (time.perf_counter() - start) * 1000, "workers": workers},
+        }
+
+
+register(
+    PrimeGapStatisticsAlgo(),
+    AlgorithmMeta(
+        name=PrimeGapStatisticsAlgo.name,
+        category=PrimeGapStatisticsAlgo.category,
+        summary="Gap histogram, maximal gaps and twin/cousin/sexy prime counts up to n.",
+        description=(
+            "Streams primes from a segmented sieve and summarizes consecutive gaps in one pass: "
+            "histogram, first occurrence of each gap, record (maximal) gaps, prime pairs, "
+            "triplets and quadruplets. Segment summaries merge, so ranges can be split across "
+            "worker processes."
+        ),
+        complexity="O(n log log n) time, O(√n) memory",
+        parameters=[
+            Parameter(name="n", type="int", description="Upper bound (inclusive)."),
+            Parameter(name="lo", type="int", description="Lower bound.", default=2),
+            Parameter(
+                name="workers",
+                type="int",
+                description="Processes to split the range across.",
+                default=1,
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="bars",
+            steps="Plot the gap histogram and mark maximal gaps as they first occur.",
+            sample_input={"n": 1000},
+        ),
+    ),
+)
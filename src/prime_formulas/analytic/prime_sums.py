@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_right
+from fractions import Fraction
+from functools import lru_cache
+from itertools import compress
+from typing import Any, Dict, List, Tuple
+
+from ..interfaces import PrimeAlgorithm
+from ..registry import register
+from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..utils.primes import primes_up_to
+
+SEGMENT_SIZE = 1 << 18
+
+
+@lru_cache(maxsize=None)
+def _faulhaber(k: int) -> Tuple[Tuple[int, ...], int]:
+    """Integer coefficients c and denominator d with Σ_{i≤v} i^k = poly_c(v) / d."""
+
+    # Bernoulli numbers with B1 = +1/2, from Σ_{j<m} C(m+1, j) B_j = m + 1.
+    bernoulli: List[Fraction] = []
+    for m in range(k + 1):
+        acc = sum(math.comb(m + 1, j) * b for j, b in enumerate(bernoulli))
+        bernoulli.append(Fraction(m + 1 - acc) / (m + 1))
+    # Coefficients of v^(k+1), v^k, ..., v^0 for Horner evaluation.
+    coeffs = [Fraction(math.comb(k + 1, j)) * bernoulli[j] / (k + 1) for j in range(k + 1)]
+    coeffs.append(Fraction(0))
+    denominator = math.lcm(*(c.denominator for c in coeffs))
+    return tuple(int(c * denominator) for c in coeffs), denominator
+
+
+def power_sum(v: int, k: int) -> int:
+    """1^k + 2^k + ... + v^k in closed form."""
+
+    coeffs, denominator = _faulhaber(k)
+    total = 0
+    for c in coeffs:
+        total = total * v + c
+    return total // denominator
+
+
+def sample_points(n: int, samples: int) -> List[int]:
+    """Up to ``samples`` integers in [2, n], geometrically spaced and ending at n."""
+
+    if n < 2:
+        return []
+    if samples <= 1:
+        return [n]
+    ratio = (n / 2) ** (1 / (samples - 1))
+    points = {min(n, round(2 * ratio**j)) for j in range(samples - 1)}
+    points.add(n)
+    return sorted(points)
+
+
+class PrimePowerSums:
+    """Σ_{p ≤ v} p^k for every v of the form n // i, by the Lucy_Hedgehog method.
+
+    The values n // i take O(√n) distinct values; S(v) starts as Σ_{2≤i≤v} i^k
+    and each prime p ≤ √n removes the contribution of numbers whose smallest
+    prime factor is p, using that i ↦ i^k is completely multiplicative. Time is
+    O(n^(3/4) / log n), memory O(√n).
+    """
+
+    def __init__(self, n: int, k: int = 1) -> None:
+        self.n = n
+        self.k = k
+        r = self.root = math.isqrt(n)
+        # small[v] = S(v) for v ≤ r; large[i] = S(n // i) for 1 ≤ i ≤ r.
+        small = [max(power_sum(v, k) - 1, 0) for v in range(r + 1)]
+        large = [0] + [power_sum(n // i, k) - 1 for i in range(1, r + 1)]
+        for p in range(2, r + 1):
+            sp = small[p - 1]
+            if small[p] == sp:
+                continue  # p is composite
+            pk = p**k
+            p2 = p * p
+            last = min(r, n // p2)
+            split = min(last, r // p)
+            for i in range(1, split + 1):
+                large[i] -= pk * (large[i * p] - sp)
+            for i in range(split + 1, last + 1):
+                large[i] -= pk * (small[n // (i * p)] - sp)
+            for v in range(r, p2 - 1, -1):
+                small[v] -= pk * (small[v // p] - sp)
+        self._small = small
+        self._large = large
+
+    def __call__(self, v: int) -> int:
+        """S(v) for v ≤ √n or v = n // i; other v raise ValueError."""
+
+        if 0 <= v <= self.root:
+            return self._small[v]
+        i = self.n // v
+        if v <= self.n and self.n // i == v:
+            return self._large[i]
+        raise ValueError(f"{v} is not of the form n // i for n = {self.n}")
+
+    def snap(self, x: int) -> int:
+        """Smallest value available to :meth:`__call__` that is ≥ x."""
+
+        if x <= self.root:
+            return x
+        return self.n // (self.n // x)
+
+    def series(self, samples: int) -> List[Dict[str, int]]:
+        points = sorted({self.snap(x) for x in sample_points(self.n, samples)})
+        return [{"x": x, "value": self(x)} for x in points]
+
+
+def prime_power_sum(n: int, k: int = 1) -> int:
+    """Σ_{p ≤ n} p^k (k = 0 gives π(n)) in O(√n) memory."""
+
+    if n < 2:
+        return 0
+    return PrimePowerSums(n, k)(n)
+
+
+def _iroot(x: int, a: int) -> int:
+    """⌊x^(1/a)⌋."""
+
+    r = int(round(x ** (1.0 / a)))
+    while r**a > x:
+        r -= 1
+    while (r + 1) ** a <= x:
+        r += 1
+    return r
+
+
+def chebyshev(n: int, *, samples: int = 32, segment_size: int = SEGMENT_SIZE) -> Dict[str, Any]:
+    """θ(n) = Σ_{p≤n} log p and ψ(n) = Σ_{p^a≤n} log p with a sampled series.
+
+    log p is not multiplicative, so θ is a streaming segmented pass in
+    O(√n + segment) memory with the sample points as extra segment
+    boundaries; ψ(x) = Σ_a θ(x^(1/a)) then only needs θ below √x, which comes
+    from the base primes.
+    """
+
+    if n < 2:
+        return {"theta": 0.0, "psi": 0.0, "series": []}
+    root = math.isqrt(n)
+    base = primes_up_to(root)
+    # θ at every base prime, for the higher-power terms of ψ.
+    prefix: List[float] = []
+    running = 0.0
+    for p in base:
+        running += math.log(p)
+        prefix.append(running)
+
+    def theta_small(x: int) -> float:
+        i = bisect_right(base, x)
+        return prefix[i - 1] if i else 0.0
+
+    def psi_from(x: int, theta_x: float) -> float:
+        total = theta_x
+        a = 2
+        while 1 << a <= x:
+            total += theta_small(_iroot(x, a))
+            a += 1
+        return total
+
+    points = sample_points(n, samples)
+    bounds = sorted(set(range(2, n + 1, segment_size)) | {x + 1 for x in points})
+    partials: List[float] = []
+    series = []
+    checkpoints = set(points)
+    for lo, hi in zip(bounds, bounds[1:]):
+        flags = bytearray(b"\x01") * (hi - lo)
+        for p in base:
+            square = p * p
+            if square >= hi:
+                break
+            first = max(square, -(-lo // p) * p) - lo
+            flags[first::p] = bytes(len(range(first, hi - lo, p)))
+        partials.append(math.fsum(map(math.log, compress(range(lo, hi), flags))))
+        if hi - 1 in checkpoints:
+            theta = math.fsum(partials)
+            partials = [theta]
+            series.append({"x": hi - 1, "theta": theta, "psi": psi_from(hi - 1, theta)})
+    last = series[-1]
+    return {"theta": last["theta"], "psi": last["psi"], "series": series}
+
+
+class PrimePowerSum(PrimeAlgorithm):
+    name = "prime_power_sum"
+    category = "analytic"
+
+    def run(self, n: int, *, k: int = 1, samples: int = 32) -> Dict[str, Any]:
+        start = time.perf_counter()
+        if k < 0:
+            return {"result": None, "meta": {"time_ms": 0.0, "error": "k must be non-negative"}}
+        if n < 2:
+            return {"result": 0, "meta": {"time_ms": 0.0, "series": []}}
+        sums = PrimePowerSums(n, k)
+        return {
+            "result": sums(n),
+            "meta": {
+                "time_ms": (time.perf_counter() - start) * 1000,
+                "series": sums.series(samples),
+            },
+        }
+
+
+class ChebyshevFunctions(PrimeAlgorithm):
+    name = "chebyshev_functions"
+    category = "analytic"
+
+    def run(self, n: int, *, samples: int = 32) -> Dict[str, Any]:
+        start = time.perf_counter()
+        result = chebyshev(n, samples=samples)
+        series = result.pop("series")
+        return {
+            "result": result,
+            "meta": {"time_ms": (time.perf_counter() - start) * 1000, "series": series},
+        }
+
+
+register(
+    PrimePowerSum(),
+    AlgorithmMeta(
+        name=PrimePowerSum.name,
+        category=PrimePowerSum.category,
+        summary="Computes Σ p^k over primes p ≤ n (k = 0 gives π(n), k = 1 the sum of primes).",
+        description=(
+            "The Lucy_Hedgehog method sieves the power sums Σ i^k at the O(√n) values ⌊n/i⌋, "
+            "removing each prime's multiples with the complete multiplicativity of i^k. No "
+            "prime list is materialized; the same table gives the curve at ⌊n/i⌋ points."
+        ),
+        complexity="O(n^(3/4) / log n) time, O(√n) memory",
+        parameters=[
+            Parameter(name="n", type="int", description="Upper bound (inclusive)."),
+            Parameter(name="k", type="int", description="Exponent of p.", default=1),
+            Parameter(
+                name="samples",
+                type="int",
+                description="Number of (x, Σ p^k) points in the sampled curve.",
+                default=32,
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="curve",
+            steps="Plot the sampled Σ_{p≤x} p^k on a log x axis.",
+            sample_input={"n": 10**6, "k": 1},
+        ),
+    ),
+)
+
+register(
+    ChebyshevFunctions(),
+    AlgorithmMeta(
+        name=ChebyshevFunctions.name,
+        category=ChebyshevFunctions.category,
+        summary="Computes Chebyshev's θ(n) = Σ log p and ψ(n) = Σ log p over prime powers ≤ n.",
+        description=(
+            "θ is summed over a segmented sieve in O(√n + segment) memory; ψ(x) = Σ_a θ(x^(1/a)) "
+            "reuses the base primes for the higher powers. Both should track x (the prime "
+            "number theorem); the sampled series shows ψ(x) - x oscillating around zero."
+        ),
+        complexity="O(n log log n) time, O(√n + segment) memory",
+        parameters=[
+            Parameter(name="n", type="int", description="Upper bound (inclusive)."),
+            Parameter(
+                name="samples",
+                type="int",
+                description="Number of (x, θ, ψ) points in the sampled curve.",
+                default=32,
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="curve",
+            steps="Plot θ(x) and ψ(x) against the line y = x.",
+            sample_input={"n": 100000},
+        ),
+    ),
+)
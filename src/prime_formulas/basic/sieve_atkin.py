@@ -2,44 +2,61 @@ from __future__ import annotations
 
 import math
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
-from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..schemas import AlgorithmMeta, CostModel, Parameter, VisualizationHint
+from ..utils.prime_array import PrimeArray
+from ..utils.shared_table import active_table
+from ..utils.wheel import WheelBitset
 
 
 class SieveAtkin(PrimeAlgorithm):
     name = "sieve_atkin"
     category = "basic"
 
-    def run(self, n: int, **kwargs: Any) -> Dict[str, Any]:
+    def run(self, n: int, *, compact: bool = False) -> Dict[str, Any]:
         start = time.perf_counter()
         if n < 2:
-            return {"result": [], "meta": {"time_ms": 0.0}}
+            return {"result": PrimeArray() if compact else [], "meta": {"time_ms": 0.0}}
 
-        sieve = [False] * (n + 1)
+        table = active_table()
+        if table is not None and n <= table.limit:
+            listed = table.primes(n)
+            return {
+                "result": PrimeArray.for_limit(n, listed) if compact else listed,
+                "meta": {"time_ms": (time.perf_counter() - start) * 1000, "source": "shared_table"},
+            }
+
+        # Every candidate toggled below is prime to 6; skipping multiples of 5
+        # leaves exactly the residues the mod-30 wheel stores.
+        wheel = WheelBitset(n, fill=False)
+        toggle = wheel.toggle
         limit_sqrt = int(math.isqrt(n)) + 1
 
         for x in range(1, limit_sqrt):
             for y in range(1, limit_sqrt):
                 m = 4 * x * x + y * y
-                if m <= n and m % 12 in (1, 5):
-                    sieve[m] = not sieve[m]
+                if m <= n and m % 12 in (1, 5) and m % 5:
+                    toggle(m)
                 m = 3 * x * x + y * y
-                if m <= n and m % 12 == 7:
-                    sieve[m] = not sieve[m]
+                if m <= n and m % 12 == 7 and m % 5:
+                    toggle(m)
                 m = 3 * x * x - y * y
-                if x > y and m <= n and m % 12 == 11:
-                    sieve[m] = not sieve[m]
+                if x > y and m <= n and m % 12 == 11 and m % 5:
+                    toggle(m)
 
-        for r in range(5, limit_sqrt):
-            if sieve[r]:
-                square = r * r
-                for k in range(square, n + 1, square):
-                    sieve[k] = False
+        for r in wheel.members(limit_sqrt - 1):
+            if r in wheel:
+                wheel.clear_multiples(r * r)
 
-        primes = [2, 3] + [i for i in range(5, n + 1) if sieve[i]]
+        small = [p for p in (2, 3, 5) if p <= n]
+        if compact:
+            primes = PrimeArray.for_limit(n, small)
+            primes.extend(wheel.members())
+        else:
+            primes = small + wheel.members()
         return {
             "result": primes,
             "meta": {"time_ms": (time.perf_counter() - start) * 1000},
@@ -54,7 +71,8 @@ register(
         summary="Generates primes ≤ n using quadratic residue filters and toggling.",
         description=(
             "The sieve of Atkin is an optimized modern sieve using modular quadratic filters "
-            "to detect potential primes before removing higher powers."
+            "to detect potential primes before removing higher powers. Candidates are kept in "
+            "a mod-30 wheel bitset (8 bits per 30 integers)."
         ),
         complexity="O(n)",
         parameters=[
@@ -62,12 +80,19 @@ register(
                 name="n",
                 type="int",
                 description="Upper bound (inclusive) for prime generation.",
-            )
+            ),
+            Parameter(
+                name="compact",
+                type="bool",
+                description="Return a PrimeArray instead of a list of ints.",
+                default=False,
+            ),
         ],
         visualization=VisualizationHint(
             mode="grid",
             steps="Toggle cells based on quadratic forms, then remove multiples of squares.",
             sample_input={"n": 60},
         ),
+        cost=CostModel("n_loglogn", constant_ns=125.0, overhead_ns=30000.0),
     ),
 )
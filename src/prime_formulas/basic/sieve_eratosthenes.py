@@ -6,29 +6,52 @@ from typing import Any, Dict, List
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
-from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..schemas import AlgorithmMeta, CostModel, Parameter, VisualizationHint
+from ..utils.prime_array import PrimeArray
+from ..utils.shared_table import active_table
+from ..utils.wheel import WheelBitset
 
 
 class SieveEratosthenes(PrimeAlgorithm):
     name = "sieve_eratosthenes"
     category = "basic"
 
-    def run(self, n: int, **kwargs: Any) -> Dict[str, Any]:
+    def run(self, n: int, *, compact: bool = False) -> Dict[str, Any]:
         start = time.perf_counter()
         if n < 2:
-            return {"result": [], "meta": {"time_ms": 0.0, "frames": []}}
+            return {"result": PrimeArray() if compact else [], "meta": {"time_ms": 0.0, "frames": []}}
 
-        sieve = [True] * (n + 1)
-        sieve[0] = sieve[1] = False
-        frames: List[Dict[str, Any]] = []
+        table = active_table()
+        if table is not None and n <= table.limit:
+            listed = table.primes(n)
+            root = math.isqrt(n)
+            return {
+                "result": PrimeArray.for_limit(n, listed) if compact else listed,
+                "meta": {
+                    "time_ms": (time.perf_counter() - start) * 1000,
+                    "frames": [{"t": p, "payload": {"prime": p}} for p in listed if p <= root],
+                    "source": "shared_table",
+                },
+            }
 
-        for p in range(2, int(math.isqrt(n)) + 1):
-            if sieve[p]:
+        # Multiples of 2, 3 and 5 are never stored: the wheel keeps one bit
+        # per integer coprime to 30.
+        wheel = WheelBitset(n)
+        wheel.discard(1)
+        root = math.isqrt(n)
+        small = [p for p in (2, 3, 5) if p <= n]
+        frames: List[Dict[str, Any]] = [{"t": p, "payload": {"prime": p}} for p in small if p <= root]
+
+        for p in wheel.members(root):
+            if p in wheel:
                 frames.append({"t": p, "payload": {"prime": p}})
-                for multiple in range(p * p, n + 1, p):
-                    sieve[multiple] = False
+                wheel.clear_multiples(p, p)
 
-        primes = [i for i, is_prime in enumerate(sieve) if is_prime]
+        if compact:
+            primes = PrimeArray.for_limit(n, small)
+            primes.extend(wheel.members())
+        else:
+            primes = small + wheel.members()
         return {
             "result": primes,
             "meta": {
@@ -46,7 +69,8 @@ register(
         summary="Generates all primes ≤ n by iteratively marking multiples.",
         description=(
             "The sieve of Eratosthenes marks composites by iteratively striking multiples "
-            "of each discovered prime. Complexity O(n log log n)."
+            "of each discovered prime. Complexity O(n log log n). Flags live in a mod-30 "
+            "wheel bitset (8 bits per 30 integers), so only candidates coprime to 30 are stored."
         ),
         complexity="O(n log log n)",
         parameters=[
@@ -54,12 +78,19 @@ register(
                 name="n",
                 type="int",
                 description="Upper bound (inclusive) for prime generation.",
-            )
+            ),
+            Parameter(
+                name="compact",
+                type="bool",
+                description="Return a PrimeArray instead of a list of ints.",
+                default=False,
+            ),
         ],
         visualization=VisualizationHint(
             mode="grid",
             steps="Mark multiples of each prime starting from its square.",
             sample_input={"n": 50},
         ),
+        cost=CostModel("n_loglogn", constant_ns=4.5, overhead_ns=36000.0),
     ),
 )
@@ -2,19 +2,24 @@ from __future__ import annotations
 
 import math
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
-from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..schemas import AlgorithmMeta, CostModel, Parameter, VisualizationHint
+from ..utils.primes import sieve_window
 
 
 class TrialDivision(PrimeAlgorithm):
     name = "trial_division"
     category = "basic"
 
-    def run(self, n: int, *, return_factors: bool = False) -> Dict[str, Any]:
+    def run(
+        self, n: int, *, return_factors: bool = False, hi: Optional[int] = None
+    ) -> Dict[str, Any]:
         start = time.perf_counter()
+        if hi is not None:
+            return self._run_range(n, hi, return_factors, start)
         if n < 2:
             return {
                 "result": False,
@@ -62,6 +67,21 @@ class TrialDivision(PrimeAlgorithm):
             },
         }
 
+    def _run_range(self, lo: int, hi: int, return_factors: bool, start: float) -> Dict[str, Any]:
+        """Primality of every n in [lo, hi] from one segmented-sieve pass."""
+
+        flags, spf = sieve_window(lo, hi, factors=return_factors)
+        return {
+            "result": flags,
+            "meta": {
+                "time_ms": (time.perf_counter() - start) * 1000,
+                "lo": max(lo, 0),
+                "hi": hi,
+                "count": flags.count(1),
+                "smallest_factors": spf,
+            },
+        }
+
 
 register(
     TrialDivision(),
@@ -71,21 +91,32 @@ register(
         summary="Deterministic primality test by checking divisibility up to √n.",
         description=(
             "Trial division is the most fundamental primality test. "
-            "It checks divisibility of n by every odd number up to √n."
+            "It checks divisibility of n by every odd number up to √n. In range mode a "
+            "whole window [n, hi] is sieved at once with the primes up to √hi."
         ),
-        complexity="O(√n)",
+        complexity="O(√n) per n; O((hi - n) log log hi + √hi) in range mode",
         parameters=[
             Parameter(
                 name="return_factors",
                 type="bool",
                 description="Include found factors in metadata when composite.",
                 default=False,
-            )
+            ),
+            Parameter(
+                name="hi",
+                type="int",
+                description=(
+                    "Range mode: sieve the window [n, hi] and return a primality bitmap "
+                    "(smallest factors in metadata with return_factors)."
+                ),
+                default=None,
+            ),
         ],
         visualization=VisualizationHint(
             mode="bars",
             steps="Highlight each attempted divisor up to √n.",
             sample_input={"n": 221},
         ),
+        cost=CostModel("sqrt", constant_ns=26.0, overhead_ns=1200.0),
     ),
 )
@@ -3,32 +3,63 @@
 from __future__ import annotations
 
 import importlib
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
-MODULES: List[str] = [
+# Registered algorithm name -> module that registers it, so a single
+# algorithm can be loaded without importing the whole catalog.
+ALGORITHM_MODULES: Dict[str, str] = {
     # basic
-    "prime_formulas.basic.trial_division",
-    "prime_formulas.basic.sieve_eratosthenes",
-    "prime_formulas.basic.sieve_atkin",
+    "trial_division": "prime_formulas.basic.trial_division",
+    "sieve_eratosthenes": "prime_formulas.basic.sieve_eratosthenes",
+    "sieve_atkin": "prime_formulas.basic.sieve_atkin",
     # probabilistic
-    "prime_formulas.probabilistic.fermat",
-    "prime_formulas.probabilistic.miller_rabin",
+    "fermat_test": "prime_formulas.probabilistic.fermat",
+    "miller_rabin": "prime_formulas.probabilistic.miller_rabin",
     # deterministic
-    "prime_formulas.deterministic.lucas_lehmer",
-    "prime_formulas.deterministic.wilson",
+    "lucas_lehmer": "prime_formulas.deterministic.lucas_lehmer",
+    "wilson_test": "prime_formulas.deterministic.wilson",
+    "prove_prime": "prime_formulas.deterministic.pocklington",
     # generating
-    "prime_formulas.generating.euclid_mullin",
-    "prime_formulas.generating.mills",
+    "euclid_mullin_sequence": "prime_formulas.generating.euclid_mullin",
+    "mills_formula": "prime_formulas.generating.mills",
+    "next_prime": "prime_formulas.generating.prime_generation",
+    "prev_prime": "prime_formulas.generating.prime_generation",
+    "random_prime": "prime_formulas.generating.prime_generation",
     # specialized
-    "prime_formulas.specialized.mersenne",
-    "prime_formulas.specialized.sophie_germain",
+    "mersenne_candidate": "prime_formulas.specialized.mersenne",
+    "sophie_germain_test": "prime_formulas.specialized.sophie_germain",
+    "sophie_germain_range": "prime_formulas.specialized.sophie_germain",
     # modular
-    "prime_formulas.modular.legendre_symbol",
+    "legendre_symbol": "prime_formulas.modular.legendre_symbol",
+    "quadratic_residues": "prime_formulas.modular.legendre_symbol",
+    "modular_sqrt": "prime_formulas.modular.modular_sqrt",
     # analytic
-    "prime_formulas.analytic.prime_number_theorem",
-]
+    "prime_number_theorem": "prime_formulas.analytic.prime_number_theorem",
+    "prime_gaps": "prime_formulas.analytic.prime_gaps",
+    "primes_in_progressions": "prime_formulas.analytic.primes_in_progressions",
+    "prime_power_sum": "prime_formulas.analytic.prime_sums",
+    "chebyshev_functions": "prime_formulas.analytic.prime_sums",
+    # additive
+    "goldbach_partitions": "prime_formulas.additive.goldbach",
+    "goldbach_verify": "prime_formulas.additive.goldbach",
+}
+
+# Every algorithm module once, in registration order.
+MODULES: List[str] = list(dict.fromkeys(ALGORITHM_MODULES.values()))
 
 
 def load_all_algorithms() -> None:
     for module in MODULES:
         importlib.import_module(module)
+
+
+def load_algorithms(names: Optional[Iterable[str]] = None) -> None:
+    """Import only the modules registering ``names`` (everything when None)."""
+
+    if names is None:
+        load_all_algorithms()
+        return
+    for name in names:
+        if name not in ALGORITHM_MODULES:
+            raise KeyError(name)
+        importlib.import_module(ALGORITHM_MODULES[name])
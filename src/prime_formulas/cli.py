@@ -0,0 +1,225 @@
+"""Command-line runner: ``python -m prime_formulas ALGORITHM [N ...]``.
+
+Only the module registering ALGORITHM is imported. Inputs come from argv,
+a file (``--input``, ``-`` for stdin) or piped stdin, one integer per line,
+and are streamed in buffered chunks through the batch API. Results are
+written to stdout as NDJSON or fixed-width binary records; a timing and
+throughput summary goes to stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import os
+import struct
+import sys
+import time
+from itertools import tee
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from .catalog import ALGORITHM_MODULES, load_algorithms
+from .registry import get
+from .results import json_default, set_timing
+
+READ_CHUNK = 1 << 16
+
+# Binary record: input n (unsigned 64-bit), result (signed 64-bit; bools as
+# 0/1, None as -1).
+RECORD = struct.Struct("<Qq")
+
+
+class RecordError(ValueError):
+    """An input line or output record the CLI cannot handle."""
+
+
+def read_integers(handle: IO[str]) -> Iterator[int]:
+    """Integers from a text stream, one per line; blank and ``#`` lines skipped.
+
+    Malformed lines raise :class:`RecordError` naming the line number.
+    """
+
+    lineno = 0
+    for lines in iter(lambda: handle.readlines(READ_CHUNK), []):
+        for line in lines:
+            lineno += 1
+            line = line.strip()
+            if line and not line.startswith("#"):
+                try:
+                    yield int(line)
+                except ValueError:
+                    raise RecordError(f"line {lineno}: not an integer: {line!r}") from None
+
+
+def _param(text: str) -> tuple:
+    key, sep, raw = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    return key, value
+
+
+def _results(
+    name: str, inputs: Iterable[int], kwargs: Dict[str, Any], workers: int, chunk_size: int
+) -> Iterator[Mapping[str, Any]]:
+    if workers <= 1:
+        algo = get(name)
+        for n in inputs:
+            yield algo.run(n, **kwargs)
+        return
+    from .executor import AlgorithmExecutor
+
+    with AlgorithmExecutor(workers, algorithms=[name]) as pool:
+        yield from pool.map(name, inputs, chunk_size=chunk_size, **kwargs)
+
+
+def write_ndjson(
+    out: IO[bytes], inputs: Iterable[int], results: Iterable[Mapping[str, Any]], meta: bool
+) -> int:
+    encode = json.JSONEncoder(default=json_default, separators=(",", ":")).encode
+    count = 0
+    buffer: List[str] = []
+    try:
+        for n, res in zip(inputs, results):
+            record = {"n": n, "result": res["result"]}
+            if meta:
+                record["meta"] = res["meta"]
+            buffer.append(encode(record))
+            count += 1
+            if len(buffer) >= 1024:
+                out.write(("\n".join(buffer) + "\n").encode())
+                buffer.clear()
+    finally:
+        # Records before a failing input are still written.
+        if buffer:
+            out.write(("\n".join(buffer) + "\n").encode())
+    return count
+
+
+def write_binary(
+    out: IO[bytes], inputs: Iterable[int], results: Iterable[Mapping[str, Any]]
+) -> int:
+    pack = RECORD.pack
+    count = 0
+    buffer = bytearray()
+    try:
+        for n, res in zip(inputs, results):
+            value = res["result"]
+            if value is None:
+                value = -1
+            elif not isinstance(value, int):
+                kind = type(value).__name__
+                raise RecordError(f"binary output needs int or bool results, got {kind}")
+            try:
+                buffer += pack(n, value)
+            except struct.error:
+                raise RecordError(
+                    f"n={n}, result={value} does not fit a binary record (u64 n, i64 result)"
+                ) from None
+            count += 1
+            if len(buffer) >= READ_CHUNK:
+                out.write(buffer)
+                buffer.clear()
+    finally:
+        out.write(buffer)
+    return count
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m prime_formulas", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument("algorithm", nargs="?", help="Registered algorithm name.")
+    parser.add_argument("n", nargs="*", type=int, help="Inputs (default: --input or stdin).")
+    parser.add_argument("--list", action="store_true", help="List algorithm names and exit.")
+    parser.add_argument("--input", "-i", help="File of integers, one per line ('-' for stdin).")
+    parser.add_argument(
+        "--param",
+        "-p",
+        action="append",
+        type=_param,
+        default=[],
+        metavar="KEY=VALUE",
+        help="Keyword argument for run(); VALUE is parsed as JSON when possible.",
+    )
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Worker processes.")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Inputs per worker task.")
+    parser.add_argument(
+        "--format",
+        choices=("ndjson", "binary"),
+        default="ndjson",
+        help="Output format; binary writes <u64 n, i64 result> records.",
+    )
+    parser.add_argument("--meta", action="store_true", help="Include run metadata in NDJSON.")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Omit the summary on stderr.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list:
+        print("\n".join(sorted(ALGORITHM_MODULES)))
+        return 0
+    if args.algorithm is None:
+        parser.error("an algorithm name is required (see --list)")
+    if args.algorithm not in ALGORITHM_MODULES:
+        parser.error(f"unknown algorithm {args.algorithm!r} (see --list)")
+
+    started = time.perf_counter()
+    load_algorithms([args.algorithm])
+    params = dict(args.param)
+    try:
+        inspect.signature(get(args.algorithm).run).bind(0, **params)
+    except TypeError as exc:
+        parser.error(f"invalid --param for {args.algorithm}: {exc}")
+    if not args.meta:
+        # Per-call timings are only written out with --meta; the environment
+        # variable carries the setting into worker processes.
+        set_timing(False)
+        os.environ["PRIME_FORMULAS_TIMING"] = "0"
+
+    handle: Optional[IO[str]] = None
+    if args.n:
+        inputs: Iterable[int] = args.n
+    elif args.input and args.input != "-":
+        try:
+            handle = open(args.input)
+        except OSError as exc:
+            parser.error(f"cannot read --input {args.input!r}: {exc.strerror}")
+        inputs = read_integers(handle)
+    else:
+        inputs = read_integers(sys.stdin)
+
+    # Inputs are consumed twice (to run and to label the output), so tee them.
+    to_run, to_label = tee(inputs)
+    results = _results(args.algorithm, to_run, params, args.workers, args.chunk_size)
+    out = sys.stdout.buffer
+    try:
+        if args.format == "binary":
+            count = write_binary(out, to_label, results)
+        else:
+            count = write_ndjson(out, to_label, results, args.meta)
+        out.flush()
+    except RecordError as exc:
+        # Earlier records have already been written; errors raised by the
+        # algorithm itself propagate unchanged.
+        out.flush()
+        parser.error(str(exc))
+    finally:
+        if handle is not None:
+            handle.close()
+
+    elapsed = time.perf_counter() - started
+    if not args.quiet:
+        rate = count / elapsed if elapsed > 0 else float("inf")
+        print(
+            f"{args.algorithm}: {count} inputs in {elapsed:.3f} s "
+            f"({rate:,.0f}/s, workers={args.workers})",
+            file=sys.stderr,
+        )
+    return 0
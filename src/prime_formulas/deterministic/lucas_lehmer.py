@@ -6,6 +6,7 @@ from typing import Any, Dict
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
 from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..utils.modarith import fast_int
 
 
 class LucasLehmer(PrimeAlgorithm):
@@ -19,12 +20,12 @@ class LucasLehmer(PrimeAlgorithm):
         if p < 2:
             return {"result": False, "meta": {"time_ms": 0.0}}
 
-        M_p = (1 << p) - 1
+        M_p = fast_int((1 << p) - 1)
         s = 4
         frames = [{"t": 0, "payload": {"s": s}}]
         for i in range(p - 2):
             s = (s * s - 2) % M_p
-            frames.append({"t": i + 1, "payload": {"s": s}})
+            frames.append({"t": i + 1, "payload": {"s": int(s)}})
 
         return {
             "result": s == 0,
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..interfaces import PrimeAlgorithm
+from ..registry import register
+from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..utils.factorization import partial_factorization
+from ..utils.primes import is_probable_prime, is_strong_probable_prime
+
+# Miller–Rabin with the first 13 prime bases is a proof below this bound.
+LEAF_LIMIT = 3317044064679887385961981
+_LEAF_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Pollard rho budget per composite cofactor of N - 1.
+RHO_ITERATIONS = 1 << 18
+
+_CERTIFICATES: Dict[int, str] = {}
+
+
+class CertificateError(ValueError):
+    """Raised when N - 1 cannot be factored far enough to build a proof."""
+
+
+def _is_leaf_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for p in _LEAF_BASES:
+        if n % p == 0:
+            return n == p
+    return all(is_strong_probable_prime(n, a) for a in _LEAF_BASES)
+
+
+def _cubic_composite(n: int, f: int) -> bool:
+    """BLS cube-root check: with every prime factor of n ≡ 1 (mod f) and f³ ≥ n,
+    n is composite iff n = (af+1)(bf+1) for some a, b ≥ 1."""
+
+    r = (n - 1) // f
+    c2, c1 = divmod(r, f)
+    # r = ab·f + (a + b) with a + b ≤ f + 1, so (ab, a+b) is (c2, c1) or (c2-1, c1+f).
+    for t, s in ((c2, c1), (c2 - 1, c1 + f)):
+        if t < 1 or s < 2:
+            continue
+        disc = s * s - 4 * t
+        if disc >= 0 and math.isqrt(disc) ** 2 == disc:
+            return True
+    return False
+
+
+def _prove(n: int, steps: List[str], rho_iterations: int) -> None:
+    """Append proof steps for prime n (children first) to ``steps``."""
+
+    if n in _CERTIFICATES:
+        steps.extend(_CERTIFICATES[n].split(";"))
+        return
+    if n < LEAF_LIMIT:
+        steps.append(f"{n:x}")
+        return
+
+    factors, cofactor = partial_factorization(n - 1, rho_iterations=rho_iterations)
+    # Use the largest factored part F; only F³ ≥ n is required.
+    f = 1
+    used: List[Tuple[int, int]] = []
+    for q, e in sorted(factors.items()):
+        f *= q**e
+        used.append((q, e))
+    if f**3 < n:
+        raise CertificateError(f"factored part of N-1 is too small (cofactor {cofactor})")
+    if f * f <= n and _cubic_composite(n, f):
+        raise ValueError(f"{n} is composite")
+
+    witnesses: List[Tuple[int, int]] = []
+    for q, _ in used:
+        for a in range(2, 2 + 200):
+            if pow(a, n - 1, n) != 1:
+                raise ValueError(f"{n} is composite (Fermat witness {a})")
+            if math.gcd(pow(a, (n - 1) // q, n) - 1, n) == 1:
+                witnesses.append((q, a))
+                break
+        else:
+            # Not evidence of compositeness: n passed every Fermat check above.
+            raise CertificateError(f"no Pocklington witness for {q} among bases 2..201")
+
+    for q, _ in used:
+        _prove(q, steps, rho_iterations)
+    body = ",".join(f"{q:x}^{e:x}:{a:x}" for (q, e), (_, a) in zip(used, witnesses))
+    steps.append(f"{n:x}|{body}")
+
+
+def prove_prime(n: int, *, rho_iterations: int = RHO_ITERATIONS) -> str:
+    """Return a primality certificate for prime n.
+
+    The certificate is a ``;``-separated chain of steps in dependency order.
+    A step ``N`` (hex) is a leaf below :data:`LEAF_LIMIT`, checked by
+    deterministic Miller–Rabin. A step ``N|q^e:a,...`` is a Pocklington/BLS
+    proof: the listed prime powers multiply to F | N-1 with F³ ≥ N, and each
+    base a satisfies a^(N-1) ≡ 1 and gcd(a^((N-1)/q) - 1, N) = 1. Every q at or
+    above the leaf limit is proven by an earlier step.
+
+    Raises ``ValueError`` for composites and :class:`CertificateError` when
+    no proof was found: N - 1 could not be factored far enough within
+    ``rho_iterations`` per cofactor, or no Pocklington witness turned up.
+    """
+
+    if n < 2 or not is_probable_prime(n):
+        raise ValueError(f"{n} is not prime")
+    steps: List[str] = []
+    _prove(n, steps, rho_iterations)
+    # Drop duplicate steps while keeping the first (dependency) occurrence.
+    certificate = ";".join(dict.fromkeys(steps))
+    _CERTIFICATES[n] = certificate
+    return certificate
+
+
+def verify_certificate(certificate: str) -> Optional[int]:
+    """Check a certificate and return the number it proves prime, or None."""
+
+    try:
+        return _verify_steps(certificate)
+    except (ValueError, ZeroDivisionError):
+        return None  # malformed step
+
+
+def _verify_steps(certificate: str) -> Optional[int]:
+    proven = set()
+    n = None
+    for step in certificate.split(";"):
+        if "|" not in step:
+            n = int(step, 16)
+            if n >= LEAF_LIMIT or not _is_leaf_prime(n):
+                return None
+            proven.add(n)
+            continue
+        head, body = step.split("|", 1)
+        n = int(head, 16)
+        if n < 3:
+            return None
+        f = 1
+        for item in body.split(","):
+            power, base = item.split(":")
+            q_hex, e_hex = power.split("^")
+            q, e, a = int(q_hex, 16), int(e_hex, 16), int(base, 16)
+            if q not in proven and not (q < LEAF_LIMIT and _is_leaf_prime(q)):
+                return None
+            # q^e ≥ 2^(e·(bits(q) - 1)) must fit below n before it is computed,
+            # so a corrupted exponent cannot blow up the check.
+            if e < 1 or not 2 <= q < n or e * (q.bit_length() - 1) >= n.bit_length():
+                return None
+            qe = q**e
+            if (n - 1) % qe:
+                return None
+            f *= qe
+            if pow(a, n - 1, n) != 1 or math.gcd(pow(a, (n - 1) // q, n) - 1, n) != 1:
+                return None
+        if (n - 1) % f or f**3 < n:
+            return None
+        if f * f <= n and _cubic_composite(n, f):
+            return None
+        proven.add(n)
+    return n
+
+
+class ProvePrime(PrimeAlgorithm):
+    name = "prove_prime"
+    category = "deterministic"
+
+    def run(self, n: int, *, rho_iterations: int = RHO_ITERATIONS) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            certificate = prove_prime(n, rho_iterations=rho_iterations)
+        except CertificateError as exc:
+            return {
+                "result": None,
+                "meta": {"time_ms": (time.perf_counter() - start) * 1000, "error": str(exc)},
+            }
+        except ValueError:
+            return {
+                "result": False,
+                "meta": {"time_ms": (time.perf_counter() - start) * 1000},
+            }
+        return {
+            "result": True,
+            "meta": {
+                "time_ms": (time.perf_counter() - start) * 1000,
+                "certificate": certificate,
+                "steps": certificate.count(";") + 1,
+            },
+        }
+
+
+register(
+    ProvePrime(),
+    AlgorithmMeta(
+        name=ProvePrime.name,
+        category=ProvePrime.category,
+        summary="Proves primality with a recursive Pocklington/BLS N-1 certificate.",
+        description=(
+            "Factors N-1 until the factored part F satisfies F³ ≥ N, finds Pocklington "
+            "witnesses for each prime q | F and applies the Brillhart–Lehmer–Selfridge "
+            "cube-root test when F² ≤ N. Each large q is proven recursively; numbers below "
+            "3.3·10^24 are settled by deterministic Miller–Rabin. The certificate can be "
+            "re-checked independently with verify_certificate."
+        ),
+        complexity="Dominated by factoring N-1; verification is O(k log^3 N) for k steps",
+        parameters=[
+            Parameter(name="n", type="int", description="Candidate prime to prove."),
+            Parameter(
+                name="rho_iterations",
+                type="int",
+                description="Pollard rho budget per composite cofactor of N-1.",
+                default=RHO_ITERATIONS,
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="graph",
+            steps="Draw the proof tree: each N points to the prime factors of N-1 it relies on.",
+            sample_input={"n": 2**89 - 1},
+        ),
+    ),
+)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import math
 import time
 from typing import Any, Dict
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
-from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..schemas import AlgorithmMeta, CostModel, Parameter, VisualizationHint
+from ..utils.factorial import factorial_mod_method
 
 
 class WilsonTest(PrimeAlgorithm):
@@ -20,18 +20,13 @@ class WilsonTest(PrimeAlgorithm):
         if n == 2:
             return {"result": True, "meta": {"time_ms": 0.0}}
 
-        factorial_mod = 1
-        for i in range(2, n):
-            factorial_mod = (factorial_mod * i) % n
-            if factorial_mod == 0:
-                break
-
-        result = (factorial_mod + 1) % n == 0
+        factorial, method = factorial_mod_method(n - 1, n)
+        result = (factorial + 1) % n == 0
         return {
             "result": result,
             "meta": {
                 "time_ms": (time.perf_counter() - start) * 1000,
-                "iterations": n - 2,
+                "method": method,
             },
         }
 
@@ -44,9 +39,10 @@ register(
         summary="Deterministic primality test using Wilson's theorem.",
         description=(
             "Wilson's theorem states that n is prime iff (n-1)! ≡ -1 (mod n). "
-            "This implementation computes factorial modulo n."
+            "Factorials modulo n use a product tree for small n and subproduct-tree "
+            "multipoint evaluation of (x+1)…(x+√n) for large n."
         ),
-        complexity="O(n)",
+        complexity="O(√n · polylog n)",
         parameters=[
             Parameter(
                 name="n",
@@ -59,5 +55,6 @@ register(
             steps="Accumulate factorial modulo n and observe when it deviates.",
             sample_input={"n": 11},
         ),
+        cost=CostModel("n", constant_ns=77.0, overhead_ns=1800.0),
     ),
 )
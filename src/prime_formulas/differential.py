@@ -0,0 +1,331 @@
+"""Differential testing of fast paths against the reference implementations.
+
+Every fast primality path is run on random and adversarial inputs and
+compared with ``is_prime_basic`` (trial division); every range path is
+compared with ``sieve_eratosthenes``. Reports record mismatches together with
+the speedup over the reference, so optimizations ship with evidence.
+"""
+
+from __future__ import annotations
+
+import inspect
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .catalog import load_all_algorithms
+from .planner import COMPLEXITY
+from .registry import get, list_algorithms
+from .schemas import AlgorithmMeta
+from .utils.primes import (
+    _DETERMINISTIC_BASES,
+    _DETERMINISTIC_LIMIT,
+    is_prime_basic,
+    is_probable_prime,
+    iter_primes,
+    primes_up_to,
+)
+
+# Trial division is only used as the oracle up to this bound; larger cases need
+# a known answer.
+REFERENCE_LIMIT = 10**12
+RANGE_REFERENCE = "sieve_eratosthenes"
+
+# Carmichael numbers below 10^5, and strong pseudoprimes to the first k prime
+# bases (the smallest for each k, plus a few more to base 2).
+CARMICHAEL = (561, 1105, 1729, 2465, 2821, 6601, 8911, 10585, 15841, 29341, 41041,
+              46657, 52633, 62745, 63973, 75361)
+STRONG_PSEUDOPRIMES = (
+    2047, 3277, 4033, 4681, 8321, 15841, 29341, 42799, 49141, 52633, 65281, 74665,
+    1373653, 25326001, 3215031751, 2152302898747, 3474749660383, 341550071728321,
+    3825123056546413051, 318665857834031151167461, 3317044064679887385961981,
+)
+MERSENNE_EXPONENTS = (2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607)
+# Prime p with 2^p - 1 composite.
+COMPOSITE_MERSENNE_EXPONENTS = (11, 23, 29, 37, 41, 43, 47, 53, 59, 67, 71, 73)
+
+
+@dataclass(frozen=True)
+class Case:
+    n: int
+    kind: str
+    expected: Optional[bool] = None
+
+
+@dataclass
+class TargetReport:
+    name: str
+    checked: int = 0
+    skipped: int = 0
+    time_ms: float = 0.0
+    reference_ms: float = 0.0
+    mismatches: List[Tuple[int, str, object, object]] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Reference time over fast-path time on cases both ran."""
+
+        if self.time_ms <= 0 or self.reference_ms <= 0:
+            return None
+        return self.reference_ms / self.time_ms
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "checked": self.checked,
+            "skipped": self.skipped,
+            "time_ms": self.time_ms,
+            "reference_ms": self.reference_ms,
+            "speedup": self.speedup,
+            "mismatches": [
+                {"n": n, "kind": kind, "expected": want, "got": got}
+                for n, kind, want, got in self.mismatches
+            ],
+        }
+
+
+def _chernick_carmichaels(count: int) -> Iterator[int]:
+    """Carmichael numbers (6k+1)(12k+1)(18k+1) with all three factors prime."""
+
+    k = 1
+    while count:
+        a, b, c = 6 * k + 1, 12 * k + 1, 18 * k + 1
+        if is_probable_prime(a) and is_probable_prime(b) and is_probable_prime(c):
+            yield a * b * c
+            count -= 1
+        k += 1
+
+
+def adversarial_cases() -> List[Case]:
+    """Inputs that commonly break fast primality paths, with known answers."""
+
+    cases = [Case(n, "small") for n in range(-2, 64)]
+    cases += [Case(n, "carmichael", False) for n in CARMICHAEL]
+    cases += [Case(n, "carmichael", False) for n in _chernick_carmichaels(6)]
+    cases += [Case(n, "strong_pseudoprime", False) for n in STRONG_PSEUDOPRIMES]
+    cases += [Case((1 << p) - 1, "mersenne", True) for p in MERSENNE_EXPONENTS]
+    cases += [Case((1 << p) - 1, "mersenne", False) for p in COMPOSITE_MERSENNE_EXPONENTS]
+    for p in primes_up_to(1000)[::7] + [65521, 999983]:
+        # Boundaries where "p * p > n" loops must stop exactly.
+        cases += [Case(p * p + d, "near_square") for d in (-2, -1, 0, 1, 2)]
+        cases.append(Case(p * (p + 2), "near_square"))
+    return cases
+
+
+def random_cases(count: int, *, seed: int = 0, bits: int = 40) -> List[Case]:
+    """Random odd inputs up to ``bits`` bits plus random semiprimes of two primes."""
+
+    rng = random.Random(seed)
+    cases = [Case(rng.getrandbits(rng.randint(2, bits)) | 1, "random") for _ in range(count)]
+    half = max(bits // 2, 3)
+    for _ in range(count // 4):
+        p = next(iter_primes(rng.getrandbits(half) | 2, 1 << (half + 1)), 2)
+        q = next(iter_primes(rng.getrandbits(half) | 2, 1 << (half + 1)), 3)
+        cases.append(Case(p * q, "semiprime", False))
+    return cases
+
+
+# Per-call cost ceiling for registry targets with a cost model; inputs that
+# would exceed it (e.g. trial division on 600-bit numbers) are skipped.
+CASE_BUDGET_NS = 1e7
+
+# Categories whose algorithms take n and answer "is n prime?" exactly
+# (``basic`` algorithms accepting ``compact`` list primes instead).
+EXACT_CATEGORIES = ("basic", "deterministic")
+ADVISORY_CATEGORIES = ("probabilistic",)
+
+
+def _accepts(name: str, parameter: str) -> bool:
+    return parameter in inspect.signature(get(name).run).parameters
+
+
+def _affordable(meta: AlgorithmMeta, n: int) -> bool:
+    cost = meta.cost
+    if cost is None:
+        return True
+    return cost.overhead_ns + cost.constant_ns * COMPLEXITY[cost.complexity](n) <= CASE_BUDGET_NS
+
+
+def _registry_bool(meta: AlgorithmMeta, **kwargs: object) -> Callable[[int], Optional[bool]]:
+    algo = get(meta.name)
+
+    def check(n: int) -> Optional[bool]:
+        return algo.run(n, **kwargs)["result"] if _affordable(meta, n) else None
+
+    return check
+
+
+def _miller_rabin_check(n: int) -> Optional[bool]:
+    # The fixed prime bases are only a proof below the deterministic limit.
+    if n >= _DETERMINISTIC_LIMIT:
+        return None
+    return get("miller_rabin").run(n, bases=_DETERMINISTIC_BASES)["result"]
+
+
+def _next_prime_check(n: int) -> Optional[bool]:
+    if n < 2:
+        return False
+    return get("next_prime").run(n - 1)["result"] == n
+
+
+def _lucas_lehmer_check(n: int) -> Optional[bool]:
+    # Only defined on 2^p - 1 with p prime.
+    p = n.bit_length()
+    if n < 3 or n != (1 << p) - 1 or not is_prime_basic(p) or p > 1000:
+        return None
+    return get("lucas_lehmer").run(p)["result"]
+
+
+def _prove_prime_check(n: int) -> Optional[bool]:
+    if n.bit_length() > 128:
+        return None
+    # None (no certificate found) counts as not applicable.
+    return get("prove_prime").run(n)["result"]
+
+
+# Exact targets whose inputs need translating or bounding by hand; the rest
+# come from the registry.
+PRIMALITY_ADAPTERS: Dict[str, Callable[[int], Optional[bool]]] = {
+    "miller_rabin": _miller_rabin_check,
+    "next_prime": _next_prime_check,
+    "lucas_lehmer": _lucas_lehmer_check,
+    "prove_prime": _prove_prime_check,
+}
+
+
+def primality_targets() -> Dict[str, Callable[[int], Optional[bool]]]:
+    """Fast paths that must agree exactly with the reference on every input.
+
+    Every registered ``n -> bool`` algorithm in :data:`EXACT_CATEGORIES` is
+    included, plus the adapters and ``is_probable_prime``.
+    """
+
+    load_all_algorithms()
+    targets: Dict[str, Callable[[int], Optional[bool]]] = {
+        "is_probable_prime": is_probable_prime
+    }
+    for meta in list_algorithms():
+        if meta.name in PRIMALITY_ADAPTERS:
+            targets[meta.name] = PRIMALITY_ADAPTERS[meta.name]
+        elif (
+            meta.category in EXACT_CATEGORIES
+            and _accepts(meta.name, "n")
+            and not _accepts(meta.name, "compact")
+        ):
+            targets[meta.name] = _registry_bool(meta)
+    return targets
+
+
+def advisory_targets() -> Dict[str, Callable[[int], Optional[bool]]]:
+    """Probabilistic paths whose mismatches are reported but expected.
+
+    E.g. Fermat on Carmichael numbers; random bases are seeded so reports
+    are reproducible.
+    """
+
+    load_all_algorithms()
+    return {
+        meta.name: _registry_bool(meta, seed=0)
+        for category in ADVISORY_CATEGORIES
+        for meta in list_algorithms(category)
+    }
+
+
+def _registry_range(name: str, **kwargs: object) -> Callable[[int], List[int]]:
+    algo = get(name)
+    return lambda n: list(algo.run(n, **kwargs)["result"])
+
+
+def range_targets() -> Dict[str, Callable[[int], List[int]]]:
+    """Prime-listing paths: every registered sieve in both output forms."""
+
+    load_all_algorithms()
+    targets: Dict[str, Callable[[int], List[int]]] = {}
+    for meta in list_algorithms("basic"):
+        if not _accepts(meta.name, "compact"):
+            continue
+        if meta.name != RANGE_REFERENCE:
+            targets[meta.name] = _registry_range(meta.name)
+        targets[f"{meta.name}_compact"] = _registry_range(meta.name, compact=True)
+    targets["iter_primes"] = lambda n: list(iter_primes(0, n + 1, segment_size=1 << 10))
+    targets["primes_up_to"] = primes_up_to
+    return targets
+
+
+def _timed_call(fn: Callable, n: int) -> Tuple[object, float]:
+    start = time.perf_counter()
+    value = fn(n)
+    return value, (time.perf_counter() - start) * 1000
+
+
+def check_primality(
+    targets: Dict[str, Callable[[int], Optional[bool]]], cases: Iterable[Case]
+) -> List[TargetReport]:
+    """Compare each target with the reference (or known answer) on every case."""
+
+    reports = {name: TargetReport(name) for name in targets}
+    for case in cases:
+        expected, reference_ms = case.expected, 0.0
+        if case.n <= REFERENCE_LIMIT:
+            truth, reference_ms = _timed_call(is_prime_basic, case.n)
+            if expected is not None and truth != expected:
+                raise AssertionError(f"bad known answer for {case.n}")
+            expected = truth
+        if expected is None:
+            for report in reports.values():
+                report.skipped += 1
+            continue
+        for name, fn in targets.items():
+            report = reports[name]
+            got, elapsed = _timed_call(fn, case.n)
+            if got is None:
+                report.skipped += 1
+                continue
+            report.checked += 1
+            if reference_ms:
+                report.time_ms += elapsed
+                report.reference_ms += reference_ms
+            if got != expected:
+                report.mismatches.append((case.n, case.kind, expected, got))
+    return list(reports.values())
+
+
+def check_ranges(
+    targets: Dict[str, Callable[[int], List[int]]], limits: Iterable[int]
+) -> List[TargetReport]:
+    """Compare prime lists up to each limit with :data:`RANGE_REFERENCE`."""
+
+    reports = {name: TargetReport(name) for name in targets}
+    reference = get(RANGE_REFERENCE)
+    for n in limits:
+        expected, reference_ms = _timed_call(lambda m: list(reference.run(m)["result"]), n)
+        for name, fn in targets.items():
+            report = reports[name]
+            got, elapsed = _timed_call(fn, n)
+            report.checked += 1
+            report.time_ms += elapsed
+            report.reference_ms += reference_ms
+            if got != expected:
+                report.mismatches.append((n, "range", len(expected), len(got)))
+    return list(reports.values())
+
+
+def run_differential(
+    *, seed: int = 0, random_count: int = 200, bits: int = 40, advisory: bool = True
+) -> Dict[str, List[TargetReport]]:
+    """Run all registered fast paths against the references.
+
+    Returns reports grouped as ``exact`` (must have no mismatches),
+    ``advisory`` (probabilistic, mismatches expected) and ``ranges``.
+    """
+
+    load_all_algorithms()
+    cases = adversarial_cases() + random_cases(random_count, seed=seed, bits=bits)
+    rng = random.Random(seed)
+    limits = [0, 1, 2, 3, 10, 30, 1 << 10, 1 << 16] + [rng.randrange(1 << 17) for _ in range(8)]
+    return {
+        "exact": check_primality(primality_targets(), cases),
+        "advisory": check_primality(advisory_targets(), cases) if advisory else [],
+        "ranges": check_ranges(range_targets(), limits),
+    }
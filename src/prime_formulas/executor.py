@@ -0,0 +1,130 @@
+"""Process-pool execution of registered algorithms by name."""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import partial
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .catalog import ALGORITHM_MODULES, load_algorithms
+from .registry import get
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+def _run(name: str, n: Any, kwargs: Dict[str, Any]) -> Mapping[str, Any]:
+    return get(name).run(n, **kwargs)
+
+
+def _run_chunk(name: str, chunk: List[Any], kwargs: Dict[str, Any]) -> List[Mapping[str, Any]]:
+    algo = get(name)
+    return [algo.run(n, **kwargs) for n in chunk]
+
+
+class AlgorithmExecutor:
+    """Pool of worker processes with the catalog loaded once per worker.
+
+    Jobs are dispatched by algorithm name, so neither algorithm instances nor
+    the registry ever need to be pickled; this works with the ``spawn`` start
+    method as well as ``fork``. ``algorithms`` limits what each worker
+    imports to the named algorithms. Use as a context manager or call
+    :meth:`shutdown`.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        mp_context: Union[str, multiprocessing.context.BaseContext, None] = None,
+        prewarm: bool = True,
+        algorithms: Optional[Sequence[str]] = None,
+    ) -> None:
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.workers = workers or os.cpu_count() or 1
+        self.algorithms = None if algorithms is None else frozenset(algorithms)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=partial(load_algorithms, algorithms),
+        )
+        if prewarm:
+            # Start every worker (and import the catalog) before the first job.
+            for future in [self._pool.submit(_warm) for _ in range(self.workers)]:
+                future.result()
+
+    def _check(self, name: str) -> None:
+        """Fail fast in the caller's process on names the workers cannot run.
+
+        Only the catalog is consulted, so the caller never has to import
+        the algorithm modules itself.
+        """
+
+        if name not in ALGORITHM_MODULES:
+            raise KeyError(name)
+        if self.algorithms is not None and name not in self.algorithms:
+            raise KeyError(f"{name} is not loaded in this executor's workers")
+
+    def submit(self, name: str, n: Any, **kwargs: Any) -> "Future[Mapping[str, Any]]":
+        """Schedule ``get(name).run(n, **kwargs)`` and return its future."""
+
+        self._check(name)
+        return self._pool.submit(_run, name, n, kwargs)
+
+    def map(
+        self,
+        name: str,
+        inputs: Iterable[Any],
+        *,
+        chunk_size: int = 64,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Run ``name`` on every input, streaming results as chunks finish.
+
+        Inputs are consumed lazily and sent in chunks of ``chunk_size``, with
+        at most two chunks per worker in flight. With ``ordered=False``
+        results are yielded in completion order instead of input order.
+        """
+
+        self._check(name)
+        source = iter(inputs)
+        chunks = iter(lambda: list(itertools.islice(source, chunk_size)), [])
+        limit = 2 * self.workers
+
+        if ordered:
+            queue: Deque[Future] = deque()
+            for chunk in chunks:
+                queue.append(self._pool.submit(_run_chunk, name, chunk, kwargs))
+                if len(queue) >= limit:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+            return
+
+        pending = set()
+        for chunk in chunks:
+            pending.add(self._pool.submit(_run_chunk, name, chunk, kwargs))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> "AlgorithmExecutor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
@@ -7,10 +7,22 @@ from typing import Any, Dict, List
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
 from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
-from ..utils.primes import is_prime_basic
+from ..utils.primes import next_probable_prime
 
-# Approximate Mills' constant
-MILLS_CONSTANT = 1.3063778838630806904686144926
+# Terms found so far; each is the least prime in [p³, (p+1)³) of its predecessor.
+_MILLS_PRIMES: List[int] = [2]
+
+
+def mills_primes(k: int) -> List[int]:
+    """Return the first k Mills primes using exact integer arithmetic."""
+
+    while len(_MILLS_PRIMES) < k:
+        p = _MILLS_PRIMES[-1]
+        candidate = next_probable_prime(p**3 - 1)
+        if candidate >= (p + 1) ** 3:
+            raise ArithmeticError(f"no prime in [{p}^3, ({p}+1)^3)")
+        _MILLS_PRIMES.append(candidate)
+    return _MILLS_PRIMES[:k]
 
 
 class MillsFormula(PrimeAlgorithm):
@@ -22,18 +34,17 @@ class MillsFormula(PrimeAlgorithm):
         if k <= 0:
             return {"result": [], "meta": {"time_ms": 0.0}}
 
-        primes: List[int] = []
-        current = MILLS_CONSTANT ** 3  # corresponds to floor(A^(3^1))
-        for _ in range(k):
-            candidate = math.floor(current + 1e-12)
-            while not is_prime_basic(candidate):
-                candidate += 1
-            primes.append(candidate)
-            current = current ** 3
+        primes = mills_primes(k)
+        # A ≈ p_k^(3^-k); log() accepts arbitrarily large ints.
+        constant = math.exp(math.log(primes[-1]) / 3**k)
 
         return {
             "result": primes,
-            "meta": {"time_ms": (time.perf_counter() - start) * 1000},
+            "meta": {
+                "time_ms": (time.perf_counter() - start) * 1000,
+                "digits": [len(str(p)) for p in primes],
+                "constant_estimate": constant,
+            },
         }
 
 
@@ -45,9 +56,10 @@ register(
         summary="Generates primes using Mills' constant and repeated cubing.",
         description=(
             "Mills proved that floor(A^(3^n)) is prime for some constant A (~1.30637788). "
-            "Using an approximation yields a rapidly growing sequence of primes."
+            "Each term is found exactly as the least prime in [p³, (p+1)³) of the previous "
+            "term, using sieve-filtered strong probable-prime tests; terms are cached."
         ),
-        complexity="Dominated by primality checks for exponentially growing numbers.",
+        complexity="Dominated by probable-prime tests on numbers with ~3^k digits.",
         parameters=[
             Parameter(name="k", type="int", description="Number of primes to generate."),
         ],
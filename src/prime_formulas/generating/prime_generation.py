@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Dict, Optional
+
+from ..interfaces import PrimeAlgorithm
+from ..registry import register
+from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..utils.parallel import first_result
+from ..utils.primes import next_probable_prime, prev_probable_prime
+
+
+def next_prime(n: int) -> int:
+    """Smallest prime > n (BPSW above 3.3·10^24, deterministic below)."""
+
+    return next_probable_prime(n)
+
+
+def prev_prime(n: int) -> int:
+    """Largest prime < n; raises ValueError for n ≤ 2."""
+
+    return prev_probable_prime(n)
+
+
+def _search_random_prime(bits: int, seed: int, attempts: int) -> Optional[int]:
+    """Try ``attempts`` random starting points for a ``bits``-bit prime."""
+
+    rng = random.Random(seed)
+    for _ in range(attempts):
+        start = rng.getrandbits(bits - 1) | (1 << (bits - 1))
+        candidate = next_probable_prime(start - 1)
+        if candidate.bit_length() == bits:
+            return candidate
+    return None
+
+
+def random_prime(
+    bits: int,
+    *,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    workers: int = 1,
+) -> int:
+    """Return a random prime with exactly ``bits`` bits.
+
+    A random start is drawn and the next prime above it is found by sieving a
+    window against the small-prime table and running BPSW on survivors. With
+    ``workers > 1`` several starts are searched in a process pool and the
+    first hit wins. Pass ``seed`` or an explicit ``rng`` for reproducibility;
+    use ``random.SystemRandom()`` for key material.
+    """
+
+    if bits < 2:
+        raise ValueError("bits must be at least 2")
+    rng = rng or random.Random(seed)
+    if bits <= 16:
+        low, high = 1 << (bits - 1), (1 << bits) - 1
+        while True:
+            candidate = next_probable_prime(rng.randrange(low, high) - 1)
+            if candidate <= high:
+                return candidate
+    args = iter(lambda: (bits, rng.getrandbits(64), 1 if workers <= 1 else 2), None)
+    return first_result(_search_random_prime, args, workers)
+
+
+class NextPrime(PrimeAlgorithm):
+    name = "next_prime"
+    category = "generating"
+
+    def run(self, n: int, **kwargs: Any) -> Dict[str, Any]:
+        start = time.perf_counter()
+        p = next_prime(n)
+        return {
+            "result": p,
+            "meta": {"time_ms": (time.perf_counter() - start) * 1000, "gap": p - n},
+        }
+
+
+class PrevPrime(PrimeAlgorithm):
+    name = "prev_prime"
+    category = "generating"
+
+    def run(self, n: int, **kwargs: Any) -> Dict[str, Any]:
+        start = time.perf_counter()
+        if n <= 2:
+            return {"result": None, "meta": {"time_ms": 0.0, "error": "no prime below 2"}}
+        p = prev_prime(n)
+        return {
+            "result": p,
+            "meta": {"time_ms": (time.perf_counter() - start) * 1000, "gap": n - p},
+        }
+
+
+class RandomPrime(PrimeAlgorithm):
+    name = "random_prime"
+    category = "generating"
+
+    def run(
+        self, bits: int, *, seed: Optional[int] = None, workers: int = 1
+    ) -> Dict[str, Any]:
+        start = time.perf_counter()
+        if bits < 2:
+            return {"result": None, "meta": {"time_ms": 0.0, "error": "bits must be at least 2"}}
+        p = random_prime(bits, seed=seed, workers=workers)
+        return {
+            "result": p,
+            "meta": {"time_ms": (time.perf_counter() - start) * 1000, "bits": p.bit_length()},
+        }
+
+
+register(
+    NextPrime(),
+    AlgorithmMeta(
+        name=NextPrime.name,
+        category=NextPrime.category,
+        summary="Finds the smallest prime greater than n.",
+        description=(
+            "Sieves a window of odd candidates above n against a small-prime table and "
+            "runs Baillie–PSW (deterministic Miller–Rabin below 3.3·10^24) on survivors."
+        ),
+        complexity="O(log n) candidates × O(log^3 n) per probable-prime test",
+        parameters=[Parameter(name="n", type="int", description="Starting point.")],
+        visualization=VisualizationHint(
+            mode="bars",
+            steps="Show the sieved window above n and the first surviving prime.",
+            sample_input={"n": 10**12},
+        ),
+    ),
+)
+
+register(
+    PrevPrime(),
+    AlgorithmMeta(
+        name=PrevPrime.name,
+        category=PrevPrime.category,
+        summary="Finds the largest prime less than n.",
+        description=(
+            "Mirror of next_prime: sieves a window of odd candidates below n and tests "
+            "survivors from the top down."
+        ),
+        complexity="O(log n) candidates × O(log^3 n) per probable-prime test",
+        parameters=[Parameter(name="n", type="int", description="Starting point (n > 2).")],
+        visualization=VisualizationHint(
+            mode="bars",
+            steps="Show the sieved window below n and the first surviving prime.",
+            sample_input={"n": 10**12},
+        ),
+    ),
+)
+
+register(
+    RandomPrime(),
+    AlgorithmMeta(
+        name=RandomPrime.name,
+        category=RandomPrime.category,
+        summary="Generates a random prime with an exact bit length.",
+        description=(
+            "Draws a random start with the top bit set and returns the next prime via windowed "
+            "sieving and Baillie–PSW. Seedable, and optionally fans out over a process pool."
+        ),
+        complexity="O(bits) candidates × O(bits^3) per probable-prime test",
+        parameters=[
+            Parameter(name="bits", type="int", description="Bit length of the prime."),
+            Parameter(
+                name="seed",
+                type="Optional[int]",
+                description="Seed for reproducible output.",
+                default=None,
+            ),
+            Parameter(
+                name="workers",
+                type="int",
+                description="Processes searching independent starting points.",
+                default=1,
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="bars",
+            steps="Show the random start, the sieved window and the prime found.",
+            sample_input={"bits": 64, "seed": 1},
+        ),
+    ),
+)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Protocol
+from typing import Any, Mapping, Protocol
 
 
 class PrimeAlgorithm(Protocol):
@@ -9,6 +9,10 @@ class PrimeAlgorithm(Protocol):
     name: str
     category: str
 
-    def run(self, n: int, **kwargs: Any) -> Dict[str, Any]:
-        """Execute the algorithm on input ``n`` and return result + metadata."""
+    def run(self, n: int, **kwargs: Any) -> Mapping[str, Any]:
+        """Execute the algorithm on input ``n`` and return result + metadata.
+
+        Returns a ``{"result": ..., "meta": {...}}`` dict or an equivalent
+        :class:`~prime_formulas.results.RunResult`.
+        """
         ...
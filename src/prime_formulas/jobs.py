@@ -0,0 +1,263 @@
+"""Asynchronous jobs with progress, streamed partial results and cancellation.
+
+Jobs run in a process pool. Algorithms with a streaming implementation below
+report progress and partial results as they go (sieve segments, Lucas–Lehmer
+checkpoints); any other registered algorithm runs as a single step.
+Lucas–Lehmer state is checkpointed to disk, so a cancelled or crashed run
+resumes where it stopped when resubmitted with the same ``checkpoint_dir``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Mapping, Optional, Tuple, Union
+
+from .catalog import ALGORITHM_MODULES, load_all_algorithms
+from .registry import get
+from .utils.factorial import RANGE_PRODUCTS, choose_factorial_method, factorial_mod_method
+from .utils.modarith import fast_int
+from .utils.prime_array import PrimeArray
+from .utils.primes import iter_primes
+
+# A streaming job yields (progress in [0, 1], partial result or None) and
+# returns its final result mapping.
+Stream = Generator[Tuple[float, Optional[Dict[str, Any]]], None, Dict[str, Any]]
+
+_DONE = "__done__"
+
+
+def _checkpoint_path(checkpoint_dir: Optional[str], p: int) -> Optional[Path]:
+    return Path(checkpoint_dir) / f"lucas_lehmer-{p}.json" if checkpoint_dir else None
+
+
+def _write_checkpoint(path: Path, p: int, iteration: int, s: int) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    with os.fdopen(fd, "w") as handle:
+        json.dump({"p": p, "iteration": iteration, "s": f"{int(s):x}"}, handle)
+    os.replace(tmp_name, path)
+
+
+def _stream_lucas_lehmer(
+    p: int, *, checkpoint_dir: Optional[str] = None, checkpoint_every: int = 1000
+) -> Stream:
+    if p <= 2:
+        return {"result": p == 2, "meta": {"iterations": 0}}
+    path = _checkpoint_path(checkpoint_dir, p)
+    start, s = 0, 4
+    if path is not None and path.exists():
+        state = json.loads(path.read_text())
+        start, s = state["iteration"], int(state["s"], 16)
+    resumed_from = start
+
+    M_p = fast_int((1 << p) - 1)
+    total = p - 2
+    i = start
+    try:
+        while i < total:
+            for _ in range(min(checkpoint_every, total - i)):
+                s = (s * s - 2) % M_p
+            i = min(i + checkpoint_every, total)
+            if path is not None and i < total:
+                _write_checkpoint(path, p, i, s)
+            # Low 64 bits of the residue, as in the usual LL interim residues.
+            yield i / total, {"iteration": i, "residue": f"{int(s) & (2**64 - 1):016x}"}
+    finally:
+        # Also keep the state reached when the job is cancelled mid-run.
+        if path is not None and i < total:
+            _write_checkpoint(path, p, i, s)
+    if path is not None and path.exists():
+        path.unlink()
+    return {"result": s == 0, "meta": {"iterations": total, "resumed_from": resumed_from}}
+
+
+def _stream_sieve(n: int, *, compact: bool = False, segment_size: int = 1 << 18) -> Stream:
+    primes = PrimeArray.for_limit(n)
+    for lo in range(2, n + 1, segment_size):
+        hi = min(lo + segment_size, n + 1)
+        segment = list(iter_primes(lo, hi))
+        primes.extend(segment)
+        yield (hi - 2) / max(n - 1, 1), {"lo": lo, "hi": hi - 1, "primes": segment}
+    # Same result type as SieveEratosthenes.run.
+    return {"result": primes if compact else list(primes), "meta": {"count": len(primes)}}
+
+
+def _stream_wilson(n: int, *, chunks: int = 64) -> Stream:
+    if n < 2:
+        return {"result": False, "meta": {}}
+    # Same engine choice as wilson_test; range-product methods are streamed
+    # in chunks, multipoint evaluation runs as a single step.
+    method = choose_factorial_method(n - 1, n)
+    product = RANGE_PRODUCTS.get(method)
+    if product is None:
+        acc, method = factorial_mod_method(n - 1, n, method)
+        yield 1.0, None
+    else:
+        step = max(1, -(-(n - 1) // chunks))
+        acc = 1
+        for lo in range(1, n, step):
+            hi = min(lo + step, n)
+            acc = acc * product(lo, hi, n) % n
+            yield (hi - 1) / (n - 1), None
+    return {"result": (acc + 1) % n == 0, "meta": {"factorial_mod_n": acc, "method": method}}
+
+
+STREAMING: Dict[str, Callable[..., Stream]] = {
+    "lucas_lehmer": _stream_lucas_lehmer,
+    "sieve_eratosthenes": _stream_sieve,
+    "wilson_test": _stream_wilson,
+}
+
+
+def _execute(
+    name: str,
+    n: int,
+    kwargs: Dict[str, Any],
+    events: Any,
+    progress: Any,
+    cancelled: Any,
+    checkpoint_dir: Optional[str],
+) -> Mapping[str, Any]:
+    start = time.perf_counter()
+    try:
+        streamer = STREAMING.get(name)
+        if streamer is None:
+            result = get(name).run(n, **kwargs)
+            progress.value = 1.0
+            return result
+        if name == "lucas_lehmer":
+            kwargs = {"checkpoint_dir": checkpoint_dir, **kwargs}
+        stream = streamer(n, **kwargs)
+        try:
+            while True:
+                if cancelled.is_set():
+                    stream.close()
+                    elapsed = (time.perf_counter() - start) * 1000
+                    return {"result": None, "meta": {"time_ms": elapsed, "cancelled": True}}
+                fraction, partial = next(stream)
+                progress.value = fraction
+                if partial is not None:
+                    events.put(partial)
+        except StopIteration as stop:
+            final = stop.value
+        final["meta"]["time_ms"] = (time.perf_counter() - start) * 1000
+        progress.value = 1.0
+        return final
+    finally:
+        events.put(_DONE)
+
+
+class JobHandle:
+    """Handle for a submitted job.
+
+    ``async for partial in handle`` streams partial results; ``await
+    handle.result()`` gives the final ``{"result", "meta"}`` mapping.
+    """
+
+    def __init__(self, future: "Future[Mapping[str, Any]]", events: Any, progress: Any, cancelled: Any):
+        self._future = future
+        self._events = events
+        self._progress = progress
+        self._cancelled = cancelled
+        self._finished = False
+
+    def progress(self) -> float:
+        """Fraction of work completed, from 0.0 to 1.0."""
+
+        return float(self._progress.value)
+
+    def cancel(self) -> None:
+        """Stop the job at its next step (or before it starts)."""
+
+        self._cancelled.set()
+        if self._future.cancel():
+            self._events.put(_DONE)
+
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def _next_event(self) -> Any:
+        while True:
+            try:
+                return self._events.get(timeout=0.1)
+            except queue_module.Empty:
+                if self._future.done() and self._future.exception() is not None:
+                    return _DONE
+
+    def __aiter__(self) -> "JobHandle":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if self._finished:
+            raise StopAsyncIteration
+        event = await asyncio.to_thread(self._next_event)
+        if event == _DONE:
+            self._finished = True
+            raise StopAsyncIteration
+        return event
+
+    async def result(self) -> Mapping[str, Any]:
+        if self._future.cancelled():
+            return {"result": None, "meta": {"time_ms": 0.0, "cancelled": True}}
+        return await asyncio.wrap_future(self._future)
+
+    def wait(self, timeout: Optional[float] = None) -> Mapping[str, Any]:
+        """Block until the job finishes and return its result."""
+
+        if self._future.cancelled():
+            return {"result": None, "meta": {"time_ms": 0.0, "cancelled": True}}
+        return self._future.result(timeout)
+
+
+class JobManager:
+    """Process pool for :class:`JobHandle` jobs; use as a context manager."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        checkpoint_dir: Union[str, os.PathLike, None] = None,
+        mp_context: Union[str, multiprocessing.context.BaseContext, None] = None,
+    ) -> None:
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.checkpoint_dir = str(checkpoint_dir) if checkpoint_dir is not None else None
+        if self.checkpoint_dir is not None:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+        self._manager = (mp_context or multiprocessing).Manager()
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            mp_context=mp_context,
+            initializer=load_all_algorithms,
+        )
+
+    def submit(self, name: str, n: int, **kwargs: Any) -> JobHandle:
+        if name not in ALGORITHM_MODULES:  # fail fast without loading the catalog here
+            raise KeyError(name)
+        events = self._manager.Queue()
+        progress = self._manager.Value("d", 0.0)
+        cancelled = self._manager.Event()
+        future = self._pool.submit(
+            _execute, name, n, kwargs, events, progress, cancelled, self.checkpoint_dir
+        )
+        return JobHandle(future, events, progress, cancelled)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+        self._manager.shutdown()
+
+    def __enter__(self) -> "JobManager":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
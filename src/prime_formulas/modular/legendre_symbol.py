@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Union
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
+from ..results import RunResult, timed
 from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
-from ..utils.primes import is_prime_basic
+from ..utils.primes import is_probable_prime, jacobi_symbol
 
 
 def legendre_symbol(a: int, p: int) -> int:
@@ -22,37 +24,86 @@ def legendre_symbol(a: int, p: int) -> int:
     if a == p - 1:
         return -1 if p % 4 == 3 else 1
 
-    # Quadratic reciprocity
-    ls = 1
-    while a:
-        while a % 2 == 0:
-            a //= 2
-            if p % 8 in (3, 5):
-                ls = -ls
-        a, p = p, a
-        if a % 4 == 3 and p % 4 == 3:
-            ls = -ls
-        a %= p
-        if a > p // 2:
-            a -= p
-    return ls if p == 1 else 0
+    # For prime p the Legendre and Jacobi symbols coincide.
+    return jacobi_symbol(a, p)
+
+
+@lru_cache(maxsize=1024)
+def is_odd_prime(p: int) -> bool:
+    """Cached primality check for moduli queried repeatedly."""
+
+    return p > 2 and is_probable_prime(p)
+
+
+def jacobi_symbols(values: Iterable[int], n: int) -> List[int]:
+    """Compute (a|n) for every a in ``values`` against a single odd modulus."""
+
+    if n <= 0 or n % 2 == 0:
+        raise ValueError("n must be an odd positive integer")
+    return [jacobi_symbol(a, n) for a in values]
+
+
+def quadratic_residue_bitmap(n: int, *, method: str = "squares") -> bytearray:
+    """Return flags where ``bitmap[a] == 1`` iff a is a nonzero square modulo n.
+
+    ``"squares"`` marks x² mod n for 1 ≤ x ≤ n/2 using running differences and
+    works for any modulus. ``"euler"`` applies Euler's criterion and requires an
+    odd prime n.
+    """
+
+    if n < 2:
+        raise ValueError("n must be at least 2")
+    bitmap = bytearray(n)
+    if method == "squares":
+        square = 0
+        for x in range(1, n // 2 + 1):
+            # (x)^2 = (x-1)^2 + 2x - 1
+            square = (square + 2 * x - 1) % n
+            if square:
+                bitmap[square] = 1
+    elif method == "euler":
+        if not is_odd_prime(n):
+            raise ValueError("Euler's criterion requires an odd prime modulus")
+        exponent = (n - 1) // 2
+        for a in range(1, n):
+            if pow(a, exponent, n) == 1:
+                bitmap[a] = 1
+    else:
+        raise ValueError(f"Unknown method '{method}'")
+    return bitmap
 
 
 class LegendreSymbolAlgo(PrimeAlgorithm):
     name = "legendre_symbol"
     category = "modular"
 
-    def run(self, p: int, *, a: int) -> Dict[str, Any]:
+    @timed
+    def run(self, p: int, *, a: Union[int, Iterable[int]]) -> RunResult:
+        if not is_odd_prime(p):
+            return RunResult(None, {"error": "p must be an odd prime"})
+        if isinstance(a, int):
+            return RunResult(legendre_symbol(a, p))
+        return RunResult(jacobi_symbols(a, p))
+
+
+class QuadraticResidueTable(PrimeAlgorithm):
+    name = "quadratic_residues"
+    category = "modular"
+
+    def run(self, n: int, *, method: str = "squares") -> Dict[str, Any]:
         start = time.perf_counter()
-        if p <= 2 or not is_prime_basic(p):
-            return {
-                "result": None,
-                "meta": {"time_ms": 0.0, "error": "p must be an odd prime"},
-            }
-        result = legendre_symbol(a, p)
+        try:
+            bitmap = quadratic_residue_bitmap(n, method=method)
+        except ValueError as exc:
+            return {"result": None, "meta": {"time_ms": 0.0, "error": str(exc)}}
+        residues = [a for a, flag in enumerate(bitmap) if flag]
         return {
-            "result": result,
-            "meta": {"time_ms": (time.perf_counter() - start) * 1000},
+            "result": residues,
+            "meta": {
+                "time_ms": (time.perf_counter() - start) * 1000,
+                "modulus": n,
+                "residue_count": len(residues),
+            },
         }
 
 
@@ -68,7 +119,11 @@ register(
         complexity="O(log p)",
         parameters=[
             Parameter(name="p", type="int", description="Odd prime modulus."),
-            Parameter(name="a", type="int", description="Residue to test."),
+            Parameter(
+                name="a",
+                type="int | Iterable[int]",
+                description="Residue to test, or many residues to evaluate in one batch.",
+            ),
         ],
         visualization=VisualizationHint(
             mode="graph",
@@ -77,3 +132,31 @@ register(
         ),
     ),
 )
+
+register(
+    QuadraticResidueTable(),
+    AlgorithmMeta(
+        name=QuadraticResidueTable.name,
+        category=QuadraticResidueTable.category,
+        summary="Lists every nonzero quadratic residue modulo n.",
+        description=(
+            "Builds a residue bitmap by squaring 1..n/2 (any modulus) or by Euler's criterion "
+            "a^((p-1)/2) ≡ 1 (mod p) for an odd prime p."
+        ),
+        complexity="O(n) for squaring, O(n log n) for Euler's criterion",
+        parameters=[
+            Parameter(name="n", type="int", description="Modulus."),
+            Parameter(
+                name="method",
+                type="str",
+                description="'squares' or 'euler' (odd prime modulus only).",
+                default="squares",
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="graph",
+            steps="Place residues 0..n-1 on a circle and highlight the quadratic residues.",
+            sample_input={"n": 23},
+        ),
+    ),
+)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..interfaces import PrimeAlgorithm
+from ..registry import register
+from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from .legendre_symbol import is_odd_prime, jacobi_symbol
+
+
+def _cipolla_mul(x: Tuple[int, int], y: Tuple[int, int], w: int, p: int) -> Tuple[int, int]:
+    """Multiply x0 + x1·√w by y0 + y1·√w in F_p(√w)."""
+
+    return (
+        (x[0] * y[0] + x[1] * y[1] % p * w) % p,
+        (x[0] * y[1] + x[1] * y[0]) % p,
+    )
+
+
+class SqrtContext:
+    """Per-prime state reused across many square-root queries.
+
+    p - 1 = q·2^s and a quadratic non-residue z are found once. Tonelli–Shanks
+    costs O(log p + s²) multiplications per root, so moduli whose p - 1 has a
+    large 2-power are handed to Cipolla's O(log p) method instead.
+    """
+
+    def __init__(self, p: int) -> None:
+        if not is_odd_prime(p):
+            raise ValueError("p must be an odd prime")
+        self.p = p
+        q = p - 1
+        s = (q & -q).bit_length() - 1
+        self.q = q >> s
+        self.s = s
+        z = 2
+        while jacobi_symbol(z, p) != -1:
+            z += 1
+        self.z = z
+        self.c = pow(z, self.q, p)
+        if p % 4 == 3:
+            self.method = "p3mod4"
+        elif s * s > 2 * p.bit_length():
+            self.method = "cipolla"
+        else:
+            self.method = "tonelli_shanks"
+
+    def sqrt(self, a: int) -> Optional[int]:
+        """Return the smaller root r of r² ≡ a (mod p), or None for non-residues."""
+
+        p = self.p
+        a %= p
+        if a == 0:
+            return 0
+        if pow(a, (p - 1) // 2, p) != 1:
+            return None
+        if self.method == "p3mod4":
+            r = pow(a, (p + 1) // 4, p)
+        elif self.method == "cipolla":
+            r = self._cipolla(a)
+        else:
+            r = self._tonelli_shanks(a)
+        return min(r, p - r)
+
+    def _tonelli_shanks(self, a: int) -> int:
+        p = self.p
+        m = self.s
+        c = self.c
+        t = pow(a, self.q, p)
+        r = pow(a, (self.q + 1) // 2, p)
+        while t != 1:
+            # Least i with t^(2^i) = 1.
+            i = 0
+            t2 = t
+            while t2 != 1:
+                t2 = t2 * t2 % p
+                i += 1
+            b = pow(c, 1 << (m - i - 1), p)
+            m = i
+            c = b * b % p
+            t = t * c % p
+            r = r * b % p
+        return r
+
+    def _cipolla(self, a: int) -> int:
+        p = self.p
+        t = 0
+        while True:
+            w = (t * t - a) % p
+            if w and jacobi_symbol(w, p) == -1:
+                break
+            t += 1
+        result = (1, 0)
+        base = (t, 1)
+        e = (p + 1) // 2
+        while e:
+            if e & 1:
+                result = _cipolla_mul(result, base, w, p)
+            base = _cipolla_mul(base, base, w, p)
+            e >>= 1
+        return result[0]
+
+    def sqrt_prime_power(self, a: int, k: int) -> Optional[int]:
+        """Return a root of r² ≡ a (mod p^k) by Hensel lifting, or None."""
+
+        p = self.p
+        modulus = p**k
+        a %= modulus
+        if a == 0:
+            return 0
+        e = 0
+        while a % p == 0:
+            a //= p
+            e += 1
+        if e % 2:
+            return None
+        root = self.sqrt(a)
+        if root is None:
+            return None
+        # Newton steps double the precision: r ← r - (r² - a)/(2r).
+        precision = 1
+        target = k - e
+        while precision < target:
+            precision = min(2 * precision, target)
+            mod = p**precision
+            root = (root - (root * root - a) * pow(2 * root, -1, mod)) % mod
+        root = root * p ** (e // 2) % modulus
+        return min(root, modulus - root)
+
+
+def modular_sqrt(a: int, p: int, k: int = 1) -> Optional[int]:
+    """Return a square root of a modulo p^k for an odd prime p, or None."""
+
+    context = SqrtContext(p)
+    return context.sqrt(a) if k == 1 else context.sqrt_prime_power(a, k)
+
+
+def modular_sqrts(values: Iterable[int], p: int, k: int = 1) -> List[Optional[int]]:
+    """Batched :func:`modular_sqrt` sharing one :class:`SqrtContext`."""
+
+    context = SqrtContext(p)
+    if k == 1:
+        return [context.sqrt(a) for a in values]
+    return [context.sqrt_prime_power(a, k) for a in values]
+
+
+class ModularSqrt(PrimeAlgorithm):
+    name = "modular_sqrt"
+    category = "modular"
+
+    def run(self, p: int, *, a: Union[int, Iterable[int]], k: int = 1) -> Dict[str, Any]:
+        start = time.perf_counter()
+        if k < 1:
+            return {"result": None, "meta": {"time_ms": 0.0, "error": "k must be positive"}}
+        try:
+            context = SqrtContext(p)
+        except ValueError as exc:
+            return {"result": None, "meta": {"time_ms": 0.0, "error": str(exc)}}
+
+        solve = context.sqrt if k == 1 else lambda x: context.sqrt_prime_power(x, k)
+        if isinstance(a, int):
+            result: Union[Optional[int], List[Optional[int]]] = solve(a)
+        else:
+            result = [solve(x) for x in a]
+        return {
+            "result": result,
+            "meta": {
+                "time_ms": (time.perf_counter() - start) * 1000,
+                "modulus": p**k,
+                "method": context.method,
+                "two_adicity": context.s,
+            },
+        }
+
+
+register(
+    ModularSqrt(),
+    AlgorithmMeta(
+        name=ModularSqrt.name,
+        category=ModularSqrt.category,
+        summary="Computes square roots modulo an odd prime power p^k.",
+        description=(
+            "Uses a^((p+1)/4) when p ≡ 3 (mod 4), Tonelli–Shanks otherwise, and Cipolla's "
+            "method when p - 1 has a large power of two. Roots are Hensel-lifted to p^k. "
+            "Returns the smaller root, or None when a is a non-residue."
+        ),
+        complexity="O(log p + s²) multiplications per root, where p - 1 = q·2^s",
+        parameters=[
+            Parameter(name="p", type="int", description="Odd prime modulus."),
+            Parameter(
+                name="a",
+                type="int | Iterable[int]",
+                description="Value(s) whose square root is requested.",
+            ),
+            Parameter(name="k", type="int", description="Prime power exponent.", default=1),
+        ],
+        visualization=VisualizationHint(
+            mode="graph",
+            steps="Connect each residue x to x² mod p; roots are the preimages of a.",
+            sample_input={"p": 41, "a": 10},
+        ),
+    ),
+)
@@ -0,0 +1,234 @@
+"""Bounded-size visualization payloads shaped by ``VisualizationHint.mode``.
+
+:func:`shape` replaces every sequence longer than the point budget in a
+run's ``result`` and ``meta`` (top level and one dict level down) with a
+summary the webapp can draw directly:
+
+* ``grid`` and ``graph``: bucketed counts over the value range (or over
+  positions for byte flag arrays);
+* ``curve``: Largest-Triangle-Three-Buckets downsampling, which keeps the
+  visual shape of the curve;
+* ``bars``: fixed windows with count, min, max and mean;
+* ``graph`` step chains (non-numeric items): the first ``budget - 1``
+  nodes and the final one, so the chain keeps both endpoints;
+* anything else: the first page.
+
+Animation ``frames`` are thinned to an evenly strided subset in every
+mode. Each summary carries the original length and a cursor; :func:`page`
+resolves the cursor against the full payload to page into the detail.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+MAX_POINTS = 1000
+
+_X_KEYS = ("x", "t", "n")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _as_list(value: Any) -> Optional[List[Any]]:
+    """Sequence-like results (lists, tuples, PrimeArray, bytes) as a list, else None."""
+
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray)):
+        return list(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return None
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets (threshold ≥ 3).
+
+    The first and last points are always kept; from every bucket in between
+    the point forming the largest triangle with the previously kept point
+    and the average of the next bucket is chosen.
+    """
+
+    n = len(xs)
+    if threshold >= n:
+        return list(range(n))
+    kept = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        # Average of the following bucket (just the last point for the final one).
+        span = range(end, next_end)
+        avg_x = sum(xs[j] for j in span) / len(span)
+        avg_y = sum(ys[j] for j in span) / len(span)
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def bucket_counts(values: Sequence[float], buckets: int) -> Dict[str, Any]:
+    """Counts of values in ``buckets`` equal-width buckets over [min, max]."""
+
+    lo, hi = min(values), max(values)
+    width = max((hi - lo) / buckets, 1e-12) if hi > lo else 1.0
+    counts = [0] * buckets
+    for value in values:
+        counts[min(int((value - lo) / width), buckets - 1)] += 1
+    return {"kind": "buckets", "lo": lo, "hi": hi, "width": width, "counts": counts}
+
+
+def flag_buckets(flags: bytes, buckets: int) -> Dict[str, Any]:
+    """Number of nonzero flags per equal-width bucket of positions."""
+
+    width = -(-len(flags) // buckets)
+    counts = [
+        len(chunk) - chunk.count(0)
+        for chunk in (flags[i : i + width] for i in range(0, len(flags), width))
+    ]
+    return {"kind": "buckets", "lo": 0, "hi": len(flags) - 1, "width": width, "counts": counts}
+
+
+def windows(values: Sequence[float], count: int) -> Dict[str, Any]:
+    """Summaries of ``count`` consecutive equal-size windows of ``values``."""
+
+    size = -(-len(values) // count)
+    summary = []
+    for start in range(0, len(values), size):
+        window = values[start : start + size]
+        summary.append(
+            {
+                "start": start,
+                "count": len(window),
+                "min": min(window),
+                "max": max(window),
+                "mean": math.fsum(window) / len(window),
+            }
+        )
+    return {"kind": "windows", "size": size, "windows": summary}
+
+
+def _curve_axes(items: List[Any]) -> Optional[Tuple[List[float], List[float]]]:
+    if all(_is_number(v) for v in items):
+        return [float(i) for i in range(len(items))], [float(v) for v in items]
+    if not all(isinstance(v, Mapping) for v in items):
+        return None
+    first = items[0]
+    x_key = next((k for k in _X_KEYS if k in first), None)
+    y_key = next((k for k, v in first.items() if k != x_key and _is_number(v)), None)
+    if y_key is None:
+        return None
+    xs = [float(v[x_key]) if x_key else float(i) for i, v in enumerate(items)]
+    return xs, [float(v[y_key]) for v in items]
+
+
+def _stride(items: List[Any], budget: int) -> List[Any]:
+    step = len(items) / budget
+    indices = sorted({int(i * step) for i in range(budget - 1)} | {len(items) - 1})
+    return [items[i] for i in indices]
+
+
+def _chain(items: List[Any], budget: int) -> Dict[str, Any]:
+    """Head of a step chain plus its final node; consecutive items are the edges."""
+
+    head = items[: budget - 1] + items[-1:]
+    return {"kind": "chain", "items": head, "omitted": len(items) - budget}
+
+
+def _summarize(items: List[Any], mode: str, budget: int, path: str, raw: Any) -> Dict[str, Any]:
+    numeric = all(_is_number(v) for v in items)
+    summary: Dict[str, Any]
+    if path.endswith("frames"):
+        summary = {"kind": "stride", "items": _stride(items, budget)}
+    elif mode in ("grid", "graph") and numeric:
+        if isinstance(raw, (bytes, bytearray)):
+            summary = flag_buckets(raw, budget)
+        else:
+            summary = bucket_counts(items, budget)
+    elif mode == "curve" and (axes := _curve_axes(items)) is not None:
+        keep = lttb(axes[0], axes[1], budget)
+        summary = {"kind": "lttb", "items": [items[i] for i in keep]}
+        if numeric:
+            summary["x"] = keep
+    elif mode == "bars" and numeric:
+        summary = windows(items, budget)
+    elif mode == "graph":
+        summary = _chain(items, budget)
+    else:
+        summary = {"kind": "page", "items": items[:budget]}
+    summary["length"] = len(items)
+    summary["cursor"] = encode_cursor(path, 0)
+    return summary
+
+
+def encode_cursor(path: str, offset: int) -> str:
+    return f"{path}@{offset}"
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    path, sep, offset = cursor.rpartition("@")
+    if not sep or not offset.isdigit():
+        raise ValueError(f"invalid cursor {cursor!r}")
+    return path, int(offset)
+
+
+def _shape_value(value: Any, mode: str, budget: int, path: str) -> Any:
+    items = _as_list(value)
+    if items is not None:
+        return _summarize(items, mode, budget, path, value) if len(items) > budget else value
+    if isinstance(value, Mapping) and path.count(".") < 2:
+        return {k: _shape_value(v, mode, budget, f"{path}.{k}") for k, v in value.items()}
+    return value
+
+
+def shape(
+    payload: Mapping[str, Any], mode: Optional[str], *, budget: int = MAX_POINTS
+) -> Dict[str, Any]:
+    """Copy of a ``{"result", "meta"}`` payload with long sequences summarized.
+
+    Payloads whose sequences all fit in ``budget`` come back unchanged.
+    """
+
+    if budget < 3:
+        raise ValueError("budget must be at least 3")
+    mode = mode or "custom"
+    return {
+        "result": _shape_value(payload["result"], mode, budget, "result"),
+        "meta": _shape_value(dict(payload["meta"]), mode, budget, "meta"),
+    }
+
+
+def page(payload: Mapping[str, Any], cursor: str, *, limit: int = MAX_POINTS) -> Dict[str, Any]:
+    """Full-detail items at ``cursor`` from the unshaped payload, plus the next cursor."""
+
+    path, offset = decode_cursor(cursor)
+    value: Any = payload
+    for key in path.split("."):
+        if not isinstance(value, Mapping):
+            raise KeyError(path)
+        if key not in value and key.lstrip("-").isdigit():
+            key = int(key)  # type: ignore[assignment]  # e.g. histogram buckets
+        if key not in value:
+            raise KeyError(path)
+        value = value[key]
+    items = _as_list(value)
+    if items is None:
+        raise ValueError(f"{path} is not a sequence")
+    end = offset + limit
+    return {
+        "items": items[offset:end],
+        "offset": offset,
+        "length": len(items),
+        "next": encode_cursor(path, end) if end < len(items) else None,
+    }
@@ -0,0 +1,232 @@
+"""Cost-model driven choice of primality and prime-listing backends.
+
+Each backend's run time is estimated as ``overhead + constant * f(n)`` from
+the :class:`~prime_formulas.schemas.CostModel` in its algorithm metadata
+(or a host calibration from :func:`calibrate`); the shipped constants were
+fitted by :func:`calibrate` on a single-core CPython 3.11 host.
+:func:`is_prime` and :func:`primes` dispatch to the cheapest backend that is
+correct for ``n`` and log the decision on the ``prime_formulas.planner``
+logger.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .catalog import load_all_algorithms
+from .registry import get, get_metadata
+from .schemas import CostModel
+from .utils.primes import (
+    _DETERMINISTIC_BASES,
+    _DETERMINISTIC_LIMIT,
+    is_probable_prime,
+    iter_primes,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _loglog(n: int) -> float:
+    return math.log(math.log(max(n, 16)))
+
+
+def _float(x: int) -> float:
+    """x as a float, or inf where it would overflow (any such cost is unaffordable)."""
+
+    return float(x) if x.bit_length() < 1024 else math.inf
+
+
+COMPLEXITY: Dict[str, Callable[[int], float]] = {
+    "const": lambda n: 1.0,
+    "sqrt": lambda n: _float(math.isqrt(max(n, 0)) + 1),
+    "bits3": lambda n: float(max(n.bit_length(), 1) ** 3),
+    "n": lambda n: _float(max(n, 1)),
+    "n_loglogn": lambda n: _float(max(n, 1)) * _loglog(n),
+}
+
+
+@dataclass(frozen=True)
+class Backend:
+    """A way to answer a planner query.
+
+    ``algorithm`` names the registry entry whose metadata holds the cost
+    model; backends without one carry their own ``cost``. ``max_n`` bounds
+    where the backend is correct (or affordable in memory).
+    """
+
+    name: str
+    call: Callable[[int], Any]
+    algorithm: Optional[str] = None
+    cost: Optional[CostModel] = None
+    max_n: Optional[int] = None
+
+
+def _run_result(name: str, **kwargs: Any) -> Callable[[int], Any]:
+    def call(n: int) -> Any:
+        return get(name).run(n, **kwargs)["result"]
+
+    return call
+
+
+PRIMALITY_BACKENDS: Tuple[Backend, ...] = (
+    # Past 2^64 trial division needs over 2^32 divisions per prime.
+    Backend("trial_division", _run_result("trial_division"), "trial_division", max_n=1 << 64),
+    # Fixed prime bases make Miller–Rabin a proof below the deterministic limit.
+    Backend(
+        "miller_rabin",
+        _run_result("miller_rabin", bases=_DETERMINISTIC_BASES),
+        "miller_rabin",
+        max_n=_DETERMINISTIC_LIMIT,
+    ),
+    Backend("wilson_test", _run_result("wilson_test"), "wilson_test", max_n=1 << 20),
+    # is_probable_prime: exact below the deterministic limit, Baillie–PSW (no
+    # known counterexample) above it, where it is the only fast option.
+    Backend(
+        "bpsw",
+        is_probable_prime,
+        cost=CostModel("bits3", constant_ns=0.01, overhead_ns=70000.0),
+    ),
+)
+
+PRIMES_BACKENDS: Tuple[Backend, ...] = (
+    # The whole-range sieves hold flags for all of [0, n] at once.
+    Backend(
+        "sieve_eratosthenes",
+        _run_result("sieve_eratosthenes"),
+        "sieve_eratosthenes",
+        max_n=1 << 26,
+    ),
+    Backend("sieve_atkin", _run_result("sieve_atkin"), "sieve_atkin", max_n=1 << 26),
+    Backend(
+        "segmented_sieve",
+        lambda n: list(iter_primes(2, n + 1)),
+        cost=CostModel("n_loglogn", constant_ns=10.0, overhead_ns=37000.0),
+    ),
+)
+
+# Inputs timed by calibrate(); worst cases (primes) for the primality tests.
+CALIBRATION_INPUTS: Dict[str, Tuple[int, ...]] = {
+    "trial_division": (101, 10007, 1000003, 100000007),
+    "miller_rabin": (101, 2**31 - 1, 2**61 - 1, 2**89 - 1),
+    "wilson_test": (101, 10007, 100003),
+    "bpsw": (2**89 - 1, 2**127 - 1, 2**521 - 1),
+    "sieve_eratosthenes": (1000, 100000, 1000000),
+    "sieve_atkin": (1000, 100000, 1000000),
+    "segmented_sieve": (1000, 100000, 1000000),
+}
+
+_calibrated: Dict[str, CostModel] = {}
+
+
+def cost_model(backend: Backend) -> CostModel:
+    if backend.name in _calibrated:
+        return _calibrated[backend.name]
+    if backend.cost is not None:
+        return backend.cost
+    load_all_algorithms()
+    cost = get_metadata(backend.algorithm).cost
+    if cost is None:
+        raise ValueError(f"{backend.algorithm} has no cost model")
+    return cost
+
+
+def estimate_ns(backend: Backend, n: int) -> float:
+    cost = cost_model(backend)
+    return cost.overhead_ns + cost.constant_ns * COMPLEXITY[cost.complexity](n)
+
+
+def plan(backends: Sequence[Backend], n: int) -> Tuple[Backend, Dict[str, float]]:
+    """Return the cheapest backend usable for n and every candidate's estimate."""
+
+    estimates = {b.name: estimate_ns(b, n) for b in backends if b.max_n is None or n < b.max_n}
+    if not estimates:
+        raise ValueError(f"no backend can handle n={n}")
+    best = min(estimates, key=estimates.__getitem__)
+    return next(b for b in backends if b.name == best), estimates
+
+
+def _dispatch(query: str, backends: Sequence[Backend], n: int) -> Any:
+    load_all_algorithms()
+    backend, estimates = plan(backends, n)
+    if logger.isEnabledFor(logging.DEBUG):
+        ranked = ", ".join(
+            f"{name}={ns / 1000:.3g}us" for name, ns in sorted(estimates.items(), key=lambda kv: kv[1])
+        )
+        logger.debug("%s(n=%d, bits=%d) -> %s [%s]", query, n, n.bit_length(), backend.name, ranked)
+    return backend.call(n)
+
+
+def is_prime(n: int) -> bool:
+    """Primality of n using the cheapest correct backend."""
+
+    return bool(_dispatch("is_prime", PRIMALITY_BACKENDS, n))
+
+
+def primes(n: int) -> List[int]:
+    """All primes ≤ n using the cheapest backend."""
+
+    return list(_dispatch("primes", PRIMES_BACKENDS, n))
+
+
+def _fit(points: List[Tuple[float, float]]) -> Tuple[float, float]:
+    """Fit t ≈ a + c·f minimizing relative error; returns (c, a) with a, c ≥ 0."""
+
+    # Weighted least squares with weights 1/t² on the columns (1, f).
+    w = [1.0 / (t * t) for _, t in points]
+    s1 = sum(w)
+    sf = sum(wi * f for wi, (f, _) in zip(w, points))
+    sff = sum(wi * f * f for wi, (f, _) in zip(w, points))
+    st = sum(wi * t for wi, (_, t) in zip(w, points))
+    sft = sum(wi * f * t for wi, (f, t) in zip(w, points))
+    det = s1 * sff - sf * sf
+    if det > 0:
+        c = (s1 * sft - sf * st) / det
+        a = (st - c * sf) / s1
+        if a >= 0 and c > 0:
+            return c, a
+    return sft / sff, 0.0
+
+
+def calibrate(
+    *, repeat: int = 3, path: Union[str, os.PathLike, None] = None
+) -> Dict[str, CostModel]:
+    """Time every backend on this host and use the fitted constants from now on.
+
+    With ``path`` the calibration is also written as JSON for
+    :func:`load_calibration`.
+    """
+
+    load_all_algorithms()
+    fitted: Dict[str, CostModel] = {}
+    for backend in PRIMALITY_BACKENDS + PRIMES_BACKENDS:
+        complexity = cost_model(backend).complexity
+        points = []
+        for n in CALIBRATION_INPUTS[backend.name]:
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter_ns()
+                backend.call(n)
+                best = min(best, time.perf_counter_ns() - start)
+            points.append((COMPLEXITY[complexity](n), max(float(best), 1.0)))
+        constant, overhead = _fit(points)
+        fitted[backend.name] = CostModel(complexity, round(constant, 4), round(overhead, 1))
+    _calibrated.update(fitted)
+    if path is not None:
+        with open(path, "w") as handle:
+            json.dump({k: asdict(v) for k, v in fitted.items()}, handle, indent=2)
+    return fitted
+
+
+def load_calibration(path: Union[str, os.PathLike]) -> None:
+    with open(path) as handle:
+        _calibrated.update({k: CostModel(**v) for k, v in json.load(handle).items()})
+
+
+def reset_calibration() -> None:
+    _calibrated.clear()
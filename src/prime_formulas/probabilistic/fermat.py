@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import random
-import time
-from typing import Any, Dict, Iterable, Optional
+from typing import Iterable, Optional
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
-from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..results import RunResult, timed
+from ..schemas import AlgorithmMeta, CostModel, Parameter, VisualizationHint
+from ..utils.modarith import fermat_witness
 
 
 class FermatTest(PrimeAlgorithm):
     name = "fermat_test"
     category = "probabilistic"
 
+    @timed
     def run(
         self,
         n: int,
@@ -20,35 +22,25 @@ class FermatTest(PrimeAlgorithm):
         rounds: int = 5,
         bases: Optional[Iterable[int]] = None,
         seed: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        start = time.perf_counter()
+    ) -> RunResult:
         if n < 2:
-            return {"result": False, "meta": {"time_ms": 0.0}}
+            return RunResult(False)
         if n in (2, 3):
-            return {"result": True, "meta": {"time_ms": 0.0}}
+            return RunResult(True)
         if n % 2 == 0:
-            return {"result": False, "meta": {"time_ms": 0.0}}
+            return RunResult(False)
 
-        rng = random.Random(seed)
-        witnessed = False
         chosen_bases = list(bases) if bases is not None else []
         if not chosen_bases:
+            rng = random.Random(seed)
             chosen_bases = [rng.randrange(2, n - 1) for _ in range(rounds)]
 
-        for a in chosen_bases:
-            witnessed = pow(a, n - 1, n) != 1
-            if witnessed:
-                break
+        witnessed = fermat_witness(n, chosen_bases) is not None
 
-        return {
-            "result": not witnessed,
-            "meta": {
-                "time_ms": (time.perf_counter() - start) * 1000,
-                "rounds": len(chosen_bases),
-                "witness": witnessed,
-                "bases": chosen_bases,
-            },
-        }
+        return RunResult(
+            not witnessed,
+            {"rounds": len(chosen_bases), "witness": witnessed, "bases": chosen_bases},
+        )
 
 
 register(
@@ -87,5 +79,6 @@ register(
             steps="Plot pow(a, n-1, n) for each base and flag witnesses.",
             sample_input={"n": 341, "rounds": 5, "seed": 42},
         ),
+        cost=CostModel("bits3", constant_ns=0.22, overhead_ns=4800.0),
     ),
 )
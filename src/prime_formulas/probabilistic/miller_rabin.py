@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import random
-import time
-from typing import Any, Dict, Iterable, Optional
+from typing import Iterable, Optional
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
-from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
+from ..results import RunResult, timed
+from ..schemas import AlgorithmMeta, CostModel, Parameter, VisualizationHint
+from ..utils.modarith import split_power_of_two, strong_witness
 
 
 class MillerRabin(PrimeAlgorithm):
     name = "miller_rabin"
     category = "probabilistic"
 
+    @timed
     def run(
         self,
         n: int,
@@ -20,54 +22,34 @@ class MillerRabin(PrimeAlgorithm):
         rounds: int = 5,
         bases: Optional[Iterable[int]] = None,
         seed: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        start = time.perf_counter()
+    ) -> RunResult:
         if n < 2:
-            return {"result": False, "meta": {"time_ms": 0.0}}
+            return RunResult(False)
         if n in (2, 3):
-            return {"result": True, "meta": {"time_ms": 0.0}}
+            return RunResult(True)
         if n % 2 == 0:
-            return {"result": False, "meta": {"time_ms": 0.0}}
+            return RunResult(False)
 
         # write n-1 as d * 2^s with d odd
-        d = n - 1
-        s = 0
-        while d % 2 == 0:
-            d //= 2
-            s += 1
+        d, s = split_power_of_two(n - 1)
 
-        rng = random.Random(seed)
         chosen_bases = list(bases) if bases is not None else []
         if not chosen_bases:
+            rng = random.Random(seed)
             chosen_bases = [rng.randrange(2, n - 2) for _ in range(rounds)]
 
-        def check(a: int) -> bool:
-            x = pow(a, d, n)
-            if x in (1, n - 1):
-                return True
-            for _ in range(s - 1):
-                x = pow(x, 2, n)
-                if x == n - 1:
-                    return True
-            return False
+        witnessed = strong_witness(n, chosen_bases) is not None
 
-        witnessed = False
-        for a in chosen_bases:
-            if not check(a):
-                witnessed = True
-                break
-
-        return {
-            "result": not witnessed,
-            "meta": {
-                "time_ms": (time.perf_counter() - start) * 1000,
+        return RunResult(
+            not witnessed,
+            {
                 "rounds": len(chosen_bases),
                 "witness": witnessed,
                 "bases": chosen_bases,
                 "s": s,
                 "d": d,
             },
-        }
+        )
 
 
 register(
@@ -106,5 +88,6 @@ register(
             steps="Show modular exponentiation traces for each base; flag first witness.",
             sample_input={"n": 561, "rounds": 5, "seed": 7},
         ),
+        cost=CostModel("bits3", constant_ns=0.43, overhead_ns=9000.0),
     ),
 )
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from .interfaces import PrimeAlgorithm
 from .schemas import AlgorithmMeta
 
+if TYPE_CHECKING:
+    from .executor import AlgorithmExecutor
+
 _algorithms: Dict[str, PrimeAlgorithm] = {}
 _metadata: Dict[str, AlgorithmMeta] = {}
 
@@ -31,3 +34,14 @@ def list_algorithms(category: Optional[str] = None) -> Iterable[AlgorithmMeta]:
     if category is None:
         return tuple(metas)
     return tuple(meta for meta in metas if meta.category == category)
+
+
+def executor(workers: Optional[int] = None, **kwargs: Any) -> "AlgorithmExecutor":
+    """Return a pre-warmed :class:`~prime_formulas.executor.AlgorithmExecutor`.
+
+    This is the supported way to spread ``run`` calls over several cores.
+    """
+
+    from .executor import AlgorithmExecutor
+
+    return AlgorithmExecutor(workers, **kwargs)
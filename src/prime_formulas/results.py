@@ -0,0 +1,108 @@
+"""Lightweight run results and the shared timing wrapper."""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+_timing_enabled = os.environ.get("PRIME_FORMULAS_TIMING", "1") != "0"
+
+F = TypeVar("F", bound=Callable[..., "RunResult"])
+
+
+def set_timing(enabled: bool) -> None:
+    """Globally enable or disable ``time_ms`` measurement in :func:`timed` runs."""
+
+    global _timing_enabled
+    _timing_enabled = enabled
+
+
+def timing_enabled() -> bool:
+    return _timing_enabled
+
+
+class RunResult(Mapping):
+    """Result of ``PrimeAlgorithm.run`` with the ``{"result", "meta"}`` dict shape.
+
+    Extra metadata is stored as given and only merged with ``time_ms`` into a
+    ``meta`` dict when it is first read, so hot paths avoid building nested
+    dicts that callers never look at.
+    """
+
+    __slots__ = ("result", "time_ms", "_extra", "_meta")
+
+    def __init__(self, result: Any, extra: Optional[Dict[str, Any]] = None) -> None:
+        self.result = result
+        self.time_ms = 0.0
+        self._extra = extra
+        self._meta: Optional[Dict[str, Any]] = None
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        if self._meta is None:
+            meta = {"time_ms": self.time_ms}
+            if self._extra:
+                meta.update(self._extra)
+            self._meta = meta
+        return self._meta
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "result":
+            return self.result
+        if key == "meta":
+            return self.meta
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("result", "meta"))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __repr__(self) -> str:
+        return f"RunResult(result={self.result!r}, meta={self.meta!r})"
+
+    def __reduce__(self) -> Any:
+        return _rebuild, (self.result, self.time_ms, self._extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"result": self.result, "meta": dict(self.meta)}
+
+
+def json_default(value: Any) -> Any:
+    """``default=`` hook for :mod:`json` covering run results and their values."""
+
+    if hasattr(value, "to_dict"):  # RunResult
+        return value.to_dict()
+    if hasattr(value, "tolist"):  # PrimeArray and other array-like results
+        return value.tolist()
+    if isinstance(value, (bytes, bytearray)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _rebuild(result: Any, time_ms: float, extra: Optional[Dict[str, Any]]) -> RunResult:
+    rebuilt = RunResult(result, extra)
+    rebuilt.time_ms = time_ms
+    return rebuilt
+
+
+def timed(run: F) -> F:
+    """Decorate a ``run`` method returning :class:`RunResult` to fill ``time_ms``.
+
+    Measurement is skipped entirely while timing is disabled.
+    """
+
+    @functools.wraps(run)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> RunResult:
+        if not _timing_enabled:
+            return run(self, *args, **kwargs)
+        start = time.perf_counter()
+        res = run(self, *args, **kwargs)
+        res.time_ms = (time.perf_counter() - start) * 1000
+        return res
+
+    return wrapper  # type: ignore[return-value]
@@ -19,6 +19,19 @@ class VisualizationHint:
     sample_input: Optional[Dict[str, Any]] = None
 
 
+@dataclass(frozen=True)
+class CostModel:
+    """Machine-readable run time: ``overhead_ns + constant_ns * f(n)``.
+
+    ``complexity`` names ``f`` in :data:`prime_formulas.planner.COMPLEXITY`.
+    Constants are calibrated on a reference host; see ``planner.calibrate``.
+    """
+
+    complexity: str
+    constant_ns: float
+    overhead_ns: float = 0.0
+
+
 @dataclass(frozen=True)
 class AlgorithmMeta:
     name: str
@@ -29,3 +42,4 @@ class AlgorithmMeta:
     references: List[str] = field(default_factory=list)
     parameters: List[Parameter] = field(default_factory=list)
     visualization: Optional[VisualizationHint] = None
+    cost: Optional[CostModel] = None
@@ -1,28 +1,143 @@
 from __future__ import annotations
 
+import math
+import random
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from ..interfaces import PrimeAlgorithm
 from ..registry import register
+from ..results import RunResult, timed
 from ..schemas import AlgorithmMeta, Parameter, VisualizationHint
-from ..utils.primes import is_prime_basic
+from ..utils.parallel import first_result
+from ..utils.prime_array import PrimeArray
+from ..utils.primes import SMALL_PRIMES, is_probable_prime
+
+SEGMENT_SIZE = 1 << 16
+
+
+def sophie_germain_range(lo: int, hi: int, *, segment_size: int = SEGMENT_SIZE) -> Iterator[int]:
+    """Yield Sophie Germain primes p with lo ≤ p < hi in increasing order.
+
+    p and 2p+1 are sieved together: a candidate is dropped as soon as either
+    value is divisible by a small prime. Only survivors reach the strong
+    probable-prime test, and none is needed when the sieve bound covers √(2p+1).
+    """
+
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+
+    bound = min(SMALL_PRIMES[-1], math.isqrt(2 * hi + 1))
+    sieve_primes = [q for q in SMALL_PRIMES if q <= bound]
+
+    # Below the sieve bound p or 2p+1 may itself be a sieving prime.
+    direct_end = min(hi, bound + 1)
+    for p in range(lo, direct_end):
+        if is_probable_prime(p) and is_probable_prime(2 * p + 1):
+            yield p
+
+    exact_limit = (bound + 1) ** 2
+    for seg_start in range(max(lo, direct_end), hi, segment_size):
+        seg_end = min(seg_start + segment_size, hi)
+        length = seg_end - seg_start
+        flags = bytearray(b"\x01") * length
+        for q in sieve_primes:
+            # p ≡ 0 (mod q) makes p composite.
+            first = -seg_start % q
+            if first < length:
+                flags[first::q] = bytes(len(range(first, length, q)))
+            if q == 2:
+                continue
+            # p ≡ (q-1)/2 (mod q) makes 2p+1 ≡ 0 (mod q).
+            first = ((q - 1) // 2 - seg_start) % q
+            if first < length:
+                flags[first::q] = bytes(len(range(first, length, q)))
+
+        index = flags.find(1)
+        while index != -1:
+            p = seg_start + index
+            q = 2 * p + 1
+            if q < exact_limit or (is_probable_prime(p) and is_probable_prime(q)):
+                yield p
+            index = flags.find(1, index + 1)
+
+
+def _search_safe_prime(bits: int, seed: int, attempts: int, window: int) -> Optional[int]:
+    """Try ``attempts`` random windows for a ``bits``-bit safe prime."""
+
+    rng = random.Random(seed)
+    low = 1 << (bits - 2)
+    high = 1 << (bits - 1)
+    for _ in range(attempts):
+        start = rng.randrange(low, high)
+        for p in sophie_germain_range(start, min(start + window, high)):
+            return 2 * p + 1
+    return None
+
+
+def random_safe_prime(
+    bits: int,
+    *,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    attempts: int = 4,
+    window: int = 1 << 14,
+) -> int:
+    """Return a random safe prime q = 2p+1 with exactly ``bits`` bits.
+
+    Each task scans ``attempts`` random windows of ``window`` candidates for p.
+    With ``workers > 1`` tasks are spread across a process pool and the first
+    hit wins; tasks still running are left to finish their bounded windows.
+    """
+
+    if bits < 3:
+        raise ValueError("bits must be at least 3")
+    if bits <= 5:
+        # Too few candidates for windowed random search; enumerate instead.
+        candidates = [
+            2 * p + 1 for p in sophie_germain_range(1 << (bits - 2), 1 << (bits - 1))
+        ]
+        return random.Random(seed).choice(candidates)
+
+    rng = random.Random(seed)
+    args = iter(lambda: (bits, rng.getrandbits(64), attempts, window), None)
+    return first_result(_search_safe_prime, args, workers)
 
 
 class SophieGermainTest(PrimeAlgorithm):
     name = "sophie_germain_test"
     category = "specialized"
 
-    def run(self, p: int, **kwargs: Any) -> Dict[str, Any]:
-        start = time.perf_counter()
-        prime = is_prime_basic(p)
-        safe_prime = is_prime_basic(2 * p + 1) if prime else False
+    @timed
+    def run(self, p: int, **kwargs: Any) -> RunResult:
+        prime = is_probable_prime(p)
+        safe_prime = is_probable_prime(2 * p + 1) if prime else False
+        return RunResult(prime and safe_prime, {"safe_prime": 2 * p + 1 if safe_prime else None})
 
+
+class SophieGermainRange(PrimeAlgorithm):
+    name = "sophie_germain_range"
+    category = "specialized"
+
+    def run(self, n: int, *, lo: int = 2, compact: bool = False) -> Dict[str, Any]:
+        start = time.perf_counter()
+        found = sophie_germain_range(lo, n + 1)
+        primes: Union[List[int], PrimeArray]
+        if compact:
+            primes = PrimeArray.for_limit(2 * n + 1, found)
+            safe: Union[List[int], PrimeArray] = PrimeArray.for_limit(
+                2 * n + 1, (2 * p + 1 for p in primes)
+            )
+        else:
+            primes = list(found)
+            safe = [2 * p + 1 for p in primes]
         return {
-            "result": prime and safe_prime,
+            "result": primes,
             "meta": {
                 "time_ms": (time.perf_counter() - start) * 1000,
-                "safe_prime": 2 * p + 1 if safe_prime else None,
+                "count": len(primes),
+                "safe_primes": safe,
             },
         }
 
@@ -37,7 +152,7 @@ register(
             "Checks primality of p and its associated safe prime q = 2p+1. "
             "Important for cryptography (safe primes)."
         ),
-        complexity="O(√(2p+1)) using basic primality checks",
+        complexity="O(log^3 p) using strong probable-prime tests",
         parameters=[
             Parameter(
                 name="p",
@@ -52,3 +167,32 @@ register(
         ),
     ),
 )
+
+register(
+    SophieGermainRange(),
+    AlgorithmMeta(
+        name=SophieGermainRange.name,
+        category=SophieGermainRange.category,
+        summary="Lists Sophie Germain primes in [lo, n] with a combined p / 2p+1 sieve.",
+        description=(
+            "Sieves each segment for p and 2p+1 at once, discarding p whenever either value "
+            "has a small prime factor, then confirms survivors with strong probable-prime tests."
+        ),
+        complexity="O(n log log n) sieving + probable-prime tests on survivors",
+        parameters=[
+            Parameter(name="n", type="int", description="Upper bound (inclusive) for p."),
+            Parameter(name="lo", type="int", description="Lower bound for p.", default=2),
+            Parameter(
+                name="compact",
+                type="bool",
+                description="Return PrimeArray results instead of lists.",
+                default=False,
+            ),
+        ],
+        visualization=VisualizationHint(
+            mode="grid",
+            steps="Strike p and (q-1)/2 residues for each small prime q; survivors are tested.",
+            sample_input={"n": 200},
+        ),
+    ),
+)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, Optional, Tuple
+
+from .polynomial import multipoint_eval, product_of_linears
+
+try:  # optional acceleration for moderate moduli
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+# Below this many factors a balanced product tree is cheaper than multipoint evaluation.
+MULTIPOINT_THRESHOLD = 1 << 20
+# NumPy path: products of two residues must fit in int64.
+NUMPY_MODULUS_LIMIT = 1 << 31
+NUMPY_CHUNK = 1 << 20
+
+
+def product_range_mod(lo: int, hi: int, n: int) -> int:
+    """Return lo·(lo+1)·…·(hi-1) mod n using a balanced product tree."""
+
+    if hi - lo <= 64:
+        result = 1
+        for i in range(lo, hi):
+            result = result * i % n
+        return result
+    mid = (lo + hi) // 2
+    return product_range_mod(lo, mid, n) * product_range_mod(mid, hi, n) % n
+
+
+def _product_range_numpy(lo: int, hi: int, n: int) -> int:
+    result = 1
+    for chunk_lo in range(lo, hi, NUMPY_CHUNK):
+        values = np.arange(chunk_lo, min(chunk_lo + NUMPY_CHUNK, hi), dtype=np.int64) % n
+        while len(values) > 1:
+            if len(values) % 2:
+                result = result * int(values[-1]) % n
+                values = values[:-1]
+            half = len(values) // 2
+            values = values[:half] * values[half:] % n
+        result = result * int(values[0]) % n
+        if result == 0:
+            break
+    return result
+
+
+def _factorial_multipoint(m: int, n: int) -> int:
+    """Return (m²)! mod n as ∏ f(j·m) for f(x) = (x+1)(x+2)…(x+m)."""
+
+    f = product_of_linears(range(1, m + 1), n)
+    result = 1
+    for value in multipoint_eval(f, [j * m for j in range(m)], n):
+        result = result * value % n
+    return result
+
+
+FACTORIAL_METHODS = ("product_tree", "numpy", "multipoint")
+
+# Methods that are a plain product over [lo, hi), so k! can be accumulated in
+# consecutive chunks; multipoint evaluation only works on the whole range.
+RANGE_PRODUCTS: Dict[str, Callable[[int, int, int], int]] = {
+    "product_tree": product_range_mod,
+    "numpy": _product_range_numpy,
+}
+
+
+def choose_factorial_method(k: int, n: int, method: Optional[str] = None) -> str:
+    """Strategy :func:`factorial_mod_method` uses for k! mod n.
+
+    ``method`` forces one of :data:`FACTORIAL_METHODS`; by default it is
+    chosen from k, n and whether NumPy is installed.
+    """
+
+    if method is not None and method not in FACTORIAL_METHODS:
+        raise ValueError(f"unknown factorial method {method!r}")
+    if method == "numpy" and (np is None or n >= NUMPY_MODULUS_LIMIT):
+        raise ValueError("the numpy method needs NumPy and n < 2^31")
+    if n == 1 or k >= n:
+        return "trivial"
+    if method is not None:
+        return method
+    if k >= MULTIPOINT_THRESHOLD:
+        return "multipoint"
+    if np is not None and n < NUMPY_MODULUS_LIMIT and 1 << 16 < k:
+        return "numpy"
+    return "product_tree"
+
+
+def factorial_mod_method(k: int, n: int, method: Optional[str] = None) -> Tuple[int, str]:
+    """Return (k! mod n, strategy name); see :func:`choose_factorial_method`."""
+
+    method = choose_factorial_method(k, n, method)
+    if method == "trivial":
+        return 0, method
+    if method in RANGE_PRODUCTS:
+        return RANGE_PRODUCTS[method](2, k + 1, n), method
+    # Baby-step/giant-step over √k blocks: O(√k · polylog k) big-int work.
+    m = math.isqrt(k)
+    result = _factorial_multipoint(m, n)
+    result = result * product_range_mod(m * m + 1, k + 1, n) % n
+    return result, "multipoint"
+
+
+def factorial_mod(k: int, n: int, method: Optional[str] = None) -> int:
+    """Return k! mod n.
+
+    Small k use a balanced product tree, or pairwise-reduced NumPy chunks for
+    moderate k when NumPy is installed and n < 2^31. k ≥ 2^20 evaluate
+    f(x) = (x+1)…(x+m), m = ⌊√k⌋, at x = 0, m, …, (m-1)m with a subproduct
+    remainder tree, so only O(√k) values are multiplied directly.
+    """
+
+    return factorial_mod_method(k, n, method)[0]
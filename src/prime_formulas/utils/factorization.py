@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+
+from .primes import SMALL_PRIMES, is_probable_prime
+from .spf import SPF_FACTOR_LIMIT, spf_table
+
+# Trial division covers primes below this bound before Pollard rho takes over.
+TRIAL_BOUND = 1 << 12
+_TRIAL_PRIMES = [p for p in SMALL_PRIMES if p < TRIAL_BOUND]
+
+
+def pollard_brent(n: int, *, seed: int = 1, max_iterations: Optional[int] = None) -> Optional[int]:
+    """Return a non-trivial factor of odd composite n, or None if the budget runs out.
+
+    Brent's cycle detection with products of differences batched between gcds.
+    """
+
+    rng = random.Random(seed)
+    batch = 128
+    iterations = 0
+    while True:
+        y = rng.randrange(1, n)
+        c = rng.randrange(1, n)
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            iterations += r
+            r *= 2
+            if max_iterations is not None and iterations > max_iterations and g == 1:
+                return None
+        if g == n:
+            # Batch overshot; step back one value at a time.
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def partial_factorization(
+    n: int, *, rho_iterations: Optional[int] = None
+) -> Tuple[Dict[int, int], int]:
+    """Factor n as far as the budget allows.
+
+    Returns ``(factors, cofactor)``: ``factors`` maps (probable) primes to
+    exponents and ``cofactor`` is the unfactored composite part (1 when the
+    factorization is complete).
+    """
+
+    if n < 1:
+        raise ValueError("n must be positive")
+    factors: Dict[int, int] = {}
+    for p in _TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    stack: List[int] = [n] if n > 1 else []
+    cofactor = 1
+    while stack:
+        m = stack.pop()
+        if is_probable_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            stack.extend((root, root))
+            continue
+        d = pollard_brent(m, max_iterations=rho_iterations)
+        if d is None:
+            cofactor *= m
+            continue
+        stack.extend((d, m // d))
+    return dict(sorted(factors.items())), cofactor
+
+
+def factorize(n: int) -> Dict[int, int]:
+    """Return the complete prime factorization of n as {prime: exponent}."""
+
+    if 1 <= n <= SPF_FACTOR_LIMIT:
+        return spf_table().factorize(n)
+    factors, cofactor = partial_factorization(n)
+    if cofactor != 1:
+        raise ArithmeticError(f"could not factor cofactor {cofactor} of {n}")
+    return factors
@@ -0,0 +1,85 @@
+"""Shared modular-exponentiation kernel for the probable-prime tests.
+
+Fermat, Miller–Rabin and the Lucas-style tests all go through these helpers.
+Moduli below 2^64 stay plain ints (CPython's small-int ``pow`` is already
+the fastest option there); larger moduli switch to gmpy2 ``mpz`` arithmetic
+when gmpy2 is installed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import gmpy2
+except ImportError:  # pragma: no cover - gmpy2 is optional
+    gmpy2 = None
+
+HAS_GMPY2 = gmpy2 is not None
+
+# Fixed-width fast path: moduli below this never leave builtin ints.
+WORD_LIMIT = 1 << 64
+
+
+def fast_int(n: int) -> Any:
+    """Return n in the fastest integer type for repeated modular arithmetic."""
+
+    if gmpy2 is not None and n >= WORD_LIMIT:
+        return gmpy2.mpz(n)
+    return n
+
+
+def powmod(a: int, e: int, n: int) -> int:
+    """Return a^e mod n using gmpy2 for large moduli when available."""
+
+    if gmpy2 is not None and n >= WORD_LIMIT:
+        return int(gmpy2.powmod(a, e, n))
+    return pow(a, e, n)
+
+
+def split_power_of_two(m: int) -> Tuple[int, int]:
+    """Write m > 0 as d · 2^s with d odd and return (d, s)."""
+
+    s = (m & -m).bit_length() - 1
+    return m >> s, s
+
+
+def fermat_witness(n: int, bases: Iterable[int]) -> Optional[int]:
+    """Return the first base a with a^(n-1) ≢ 1 (mod n), or None.
+
+    Bases that are multiples of n carry no information and are skipped.
+    """
+
+    m = fast_int(n)
+    e = m - 1
+    for a in bases:
+        a %= n
+        if a and powmod(a, e, m) != 1:
+            return a
+    return None
+
+
+def strong_witness(n: int, bases: Iterable[int]) -> Optional[int]:
+    """Return the first base proving odd n > 3 composite (Miller–Rabin), or None.
+
+    n - 1 = d · 2^s is decomposed once for all bases, and the squaring chain
+    uses plain multiplication instead of a ``pow`` call per step.
+    """
+
+    m = fast_int(n)
+    minus_one = m - 1
+    d, s = split_power_of_two(n - 1)
+    for a in bases:
+        a %= n
+        if not a:
+            continue
+        x = powmod(a, d, m)
+        if x == 1 or x == minus_one:
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == minus_one:
+                break
+        else:
+            return a
+    return None
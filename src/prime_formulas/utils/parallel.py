@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def first_result(
+    task: Callable[..., Optional[T]], args: Iterator[Tuple], workers: int
+) -> T:
+    """Run ``task(*next(args))`` until one call returns a non-None value.
+
+    Tasks should do a bounded amount of work and return None on a miss. With
+    ``workers > 1`` up to ``workers`` tasks run at once in a process pool; the
+    first hit wins and queued tasks are cancelled (running ones finish their
+    bounded work in the background).
+    """
+
+    if workers <= 1:
+        while True:
+            found = task(*next(args))
+            if found is not None:
+                return found
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = {executor.submit(task, *next(args)) for _ in range(workers)}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found = future.result()
+                if found is not None:
+                    return found
+                pending.add(executor.submit(task, *next(args)))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
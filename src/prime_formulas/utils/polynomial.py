@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import decimal
+from typing import List, Optional, Sequence
+
+# Coefficient lists are little-endian: poly[i] is the coefficient of x^i.
+Poly = List[int]
+
+# Below this degree schoolbook arithmetic beats packing overhead.
+_SCHOOLBOOK_DEGREE = 24
+
+# Flag byte (0 or 1) -> ASCII digit.
+_DIGIT = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _pack(coeffs: Sequence[int], width: int) -> int:
+    return int.from_bytes(b"".join(c.to_bytes(width, "little") for c in coeffs), "little")
+
+
+def _unpack(value: int, width: int, count: int) -> Poly:
+    raw = value.to_bytes(width * count, "little")
+    return [int.from_bytes(raw[i : i + width], "little") for i in range(0, width * count, width)]
+
+
+def poly_mul(a: Sequence[int], b: Sequence[int], modulus: Optional[int] = None) -> Poly:
+    """Multiply polynomials with non-negative coefficients.
+
+    Uses Kronecker substitution: both operands are packed into one big integer
+    each, so a single CPython (Karatsuba) multiplication does the convolution.
+    Coefficients are reduced modulo ``modulus`` when given.
+    """
+
+    if not a or not b:
+        return []
+    count = len(a) + len(b) - 1
+    if min(len(a), len(b)) <= _SCHOOLBOOK_DEGREE:
+        result = [0] * count
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    result[i + j] += x * y
+    else:
+        bound = max(a) * max(b) * min(len(a), len(b))
+        if bound == 0:
+            # One operand is zero; packing the other at width 1 could overflow.
+            return [0] * count
+        width = (bound.bit_length() + 8) // 8
+        result = _unpack(_pack(a, width) * _pack(b, width), width, count)
+    if modulus is not None:
+        result = [c % modulus for c in result]
+    return result
+
+
+def _inverse_series(f: Sequence[int], precision: int, modulus: int) -> Poly:
+    """Return g with f·g ≡ 1 (mod x^precision); f[0] must be 1."""
+
+    g = [1]
+    current = 1
+    while current < precision:
+        current = min(2 * current, precision)
+        # g ← g·(2 - f·g) mod x^current
+        fg = poly_mul(f[:current], g, modulus)[:current]
+        correction = [(-c) % modulus for c in fg]
+        correction[0] = (correction[0] + 2) % modulus
+        g = poly_mul(g, correction, modulus)[:current]
+    return g
+
+
+def poly_rem_monic(f: Sequence[int], g: Sequence[int], modulus: int) -> Poly:
+    """Return f mod g for monic g, with coefficients reduced modulo ``modulus``.
+
+    Monic divisors need no modular inverses, so ``modulus`` may be composite.
+    """
+
+    deg_f = len(f) - 1
+    deg_g = len(g) - 1
+    if deg_f < deg_g:
+        return [c % modulus for c in f]
+    if deg_g <= _SCHOOLBOOK_DEGREE:
+        rem = [c % modulus for c in f]
+        for i in range(deg_f, deg_g - 1, -1):
+            lead = rem[i]
+            if lead:
+                shift = i - deg_g
+                for j in range(deg_g):
+                    rem[shift + j] = (rem[shift + j] - lead * g[j]) % modulus
+        return rem[:deg_g]
+    # Newton division on reversed polynomials.
+    q_len = deg_f - deg_g + 1
+    inv = _inverse_series(g[::-1], q_len, modulus)
+    q = poly_mul(list(f[::-1])[:q_len], inv, modulus)[:q_len][::-1]
+    qg = poly_mul(q, g, modulus)
+    return [(f[i] - qg[i]) % modulus for i in range(deg_g)]
+
+
+def subproduct_tree(points: Sequence[int], modulus: int) -> List[List[Poly]]:
+    """Return levels of products of (x - point); level 0 holds the linear factors."""
+
+    level = [[(-x) % modulus, 1] for x in points]
+    tree = [level]
+    while len(level) > 1:
+        nxt = [poly_mul(level[i], level[i + 1], modulus) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        tree.append(nxt)
+        level = nxt
+    return tree
+
+
+def multipoint_eval(f: Sequence[int], points: Sequence[int], modulus: int) -> List[int]:
+    """Evaluate f at every point modulo ``modulus`` with a remainder tree."""
+
+    if not points:
+        return []
+    tree = subproduct_tree(points, modulus)
+    remainders = [poly_rem_monic(f, tree[-1][0], modulus)]
+    for level in reversed(tree[:-1]):
+        nxt: List[Poly] = []
+        for i, rem in enumerate(remainders):
+            left = 2 * i
+            nxt.append(poly_rem_monic(rem, level[left], modulus))
+            if left + 1 < len(level):
+                nxt.append(poly_rem_monic(rem, level[left + 1], modulus))
+        remainders = nxt
+    return [rem[0] if rem else 0 for rem in remainders]
+
+
+def product_of_linears(roots: Sequence[int], modulus: int) -> Poly:
+    """Return ∏ (x + r) for r in ``roots`` modulo ``modulus`` via a product tree."""
+
+    level = [[r % modulus, 1] for r in roots] or [[1]]
+    while len(level) > 1:
+        nxt = [poly_mul(level[i], level[i + 1], modulus) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return level[0]
+
+
+def indicator_square(flags: bytes) -> Poly:
+    """Coefficients of f(x)² for f with 0/1 coefficients f[i] = flags[i].
+
+    Kronecker substitution in base 10: f is written as a decimal string with
+    a fixed number of digits per coefficient, so the squaring runs in
+    libmpdec, whose number-theoretic-transform multiplication is far faster
+    than CPython's Karatsuba for operands of millions of digits.
+    """
+
+    count = 2 * len(flags) - 1
+    if count <= 0:
+        return []
+    # Coefficients of f² are at most len(flags); one spare digit keeps them apart.
+    width = len(str(len(flags))) + 1
+    digits = bytearray(b"0") * (len(flags) * width)
+    # Most significant digits first: coefficient 0 leads, so the product's
+    # coefficient m sits in the m-th group of ``width`` digits.
+    digits[width - 1 :: width] = bytes(flags).translate(_DIGIT)
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    value = context.create_decimal(digits.decode())
+    text = str(context.multiply(value, value)).rjust(count * width, "0")
+    return list(map(int, (text[i : i + width] for i in range(0, count * width, width))))
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import sys
+import zlib
+from array import array
+from typing import Any, Iterable, List, Tuple, Union
+
+MAGIC = b"PRA1"
+
+# Payload encodings
+_RAW = 0  # little-endian uint64 values
+_BYTE_DELTAS = 1  # first value as varint, then one byte per difference
+_HALF_DELTAS = 2  # first two values as varints, then one byte per halved (even) difference
+_VARINT = 3  # zigzag varint differences
+
+_FLAG_ZLIB = 0x80
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    shift = 0
+    value = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _rebuild(typecode: str, raw: bytes) -> "PrimeArray":
+    result = PrimeArray((), typecode)
+    result.frombytes(raw)
+    return result
+
+
+class PrimeArray(array):
+    """Compact sequence of non-negative integers (typically primes).
+
+    A thin ``array.array`` subclass: storage is one machine word per value
+    (``'I'`` or ``'Q'``), it supports the buffer protocol, ``len``, indexing,
+    slicing and iteration, and serializes to a delta-encoded binary form.
+    """
+
+    def __new__(cls, data: Iterable[int] = (), typecode: str = "Q") -> "PrimeArray":
+        if typecode not in ("I", "Q"):
+            raise ValueError("typecode must be 'I' or 'Q'")
+        return super().__new__(cls, typecode, data)
+
+    @classmethod
+    def for_limit(cls, limit: int, data: Iterable[int] = ()) -> "PrimeArray":
+        """Create an array using the narrowest typecode able to hold ``limit``."""
+
+        return cls(data, "I" if limit < 1 << 32 else "Q")
+
+    def __getitem__(self, index: Any) -> Any:  # type: ignore[override]
+        value = super().__getitem__(index)
+        if isinstance(index, slice):
+            return PrimeArray(value, self.typecode)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PrimeArray({self.tolist()!r}, typecode={self.typecode!r})"
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return _rebuild, (self.typecode, self.tobytes())
+
+    def to_bytes(self, *, compress: bool = False, level: int = 6) -> bytes:
+        """Serialize to ``MAGIC | flags | varint count | payload``."""
+
+        values = self.tolist()
+        deltas = [b - a for a, b in zip(values, values[1:])]
+        payload = bytearray()
+        if deltas and min(deltas) >= 0 and max(deltas) <= 0xFF:
+            encoding = _BYTE_DELTAS
+            _write_varint(payload, values[0])
+            payload += bytes(deltas)
+        elif (
+            len(deltas) > 1
+            and min(deltas) >= 0
+            and max(deltas[1:]) <= 0x1FE
+            and not any(d & 1 for d in deltas[1:])
+        ):
+            # Prime gaps after 2 are even, so halving keeps them in one byte far longer.
+            encoding = _HALF_DELTAS
+            _write_varint(payload, values[0])
+            _write_varint(payload, values[1])
+            payload += bytes(d >> 1 for d in deltas[1:])
+        elif len(values) <= 1:
+            encoding = _RAW
+            raw = array("Q", values)
+            if sys.byteorder == "big":
+                raw.byteswap()
+            payload += raw.tobytes()
+        else:
+            encoding = _VARINT
+            _write_varint(payload, values[0])
+            for d in deltas:
+                _write_varint(payload, (d << 1) if d >= 0 else ((-d << 1) - 1))
+
+        flags = encoding
+        body = bytes(payload)
+        if compress:
+            flags |= _FLAG_ZLIB
+            body = zlib.compress(body, level)
+        header = bytearray(MAGIC)
+        header.append(flags)
+        header.append(ord(self.typecode))
+        _write_varint(header, len(values))
+        return bytes(header) + body
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> "PrimeArray":
+        """Inverse of :meth:`to_bytes`."""
+
+        buf = bytes(data)
+        if buf[:4] != MAGIC:
+            raise ValueError("not a PrimeArray buffer")
+        flags = buf[4]
+        typecode = chr(buf[5])
+        count, pos = _read_varint(buf, 6)
+        body = buf[pos:]
+        if flags & _FLAG_ZLIB:
+            body = zlib.decompress(body)
+        encoding = flags & 0x7F
+
+        values: List[int]
+        if count == 0:
+            values = []
+        elif encoding == _RAW:
+            raw = array("Q")
+            raw.frombytes(body)
+            if sys.byteorder == "big":
+                raw.byteswap()
+            values = raw.tolist()
+        elif encoding in (_BYTE_DELTAS, _HALF_DELTAS):
+            first, pos = _read_varint(body, 0)
+            values = [first]
+            if encoding == _HALF_DELTAS:
+                second, pos = _read_varint(body, pos)
+                values.append(second)
+                gaps: Iterable[int] = (g << 1 for g in body[pos:])
+            else:
+                gaps = body[pos:]
+            current = values[-1]
+            append = values.append
+            for gap in gaps:
+                current += gap
+                append(current)
+        elif encoding == _VARINT:
+            current, pos = _read_varint(body, 0)
+            values = [current]
+            for _ in range(count - 1):
+                z, pos = _read_varint(body, pos)
+                current += (z >> 1) if not z & 1 else -((z + 1) >> 1)
+                values.append(current)
+        else:
+            raise ValueError(f"unknown PrimeArray encoding {encoding}")
+        if len(values) != count:
+            raise ValueError("truncated PrimeArray buffer")
+        return cls(values, typecode)
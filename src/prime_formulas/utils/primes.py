@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable
+from itertools import compress
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .modarith import fast_int, split_power_of_two, strong_witness
+from .shared_table import active_table
+from .wheel import wheel_primes
 
 
 def is_prime_basic(n: int) -> bool:
@@ -9,6 +14,9 @@ def is_prime_basic(n: int) -> bool:
 
     if n < 2:
         return False
+    table = active_table()
+    if table is not None and n <= table.limit:
+        return table.is_prime(n)
     if n in (2, 3):
         return True
     if n % 2 == 0:
@@ -26,21 +34,239 @@ def smallest_prime_factor(n: int) -> int:
     if n % 2 == 0:
         return 2
     limit = int(math.isqrt(n))
-    for divisor in range(3, limit + 1, 2):
+    table = active_table()
+    if table is not None and limit <= table.limit:
+        # Only prime divisors need trying.
+        if n <= table.limit and table.is_prime(n):
+            return n
+        divisors: Iterable[int] = table.primes(limit, 3)
+    else:
+        divisors = range(3, limit + 1, 2)
+    for divisor in divisors:
         if n % divisor == 0:
             return divisor
     return n  # n is prime
 
 
 def primes_up_to(limit: int) -> Iterable[int]:
-    """Simple sieve returning primes up to limit inclusive."""
+    """Primes up to limit inclusive, from the mod-30 wheel sieve."""
 
     if limit < 2:
         return []
-    sieve = [True] * (limit + 1)
-    sieve[0] = sieve[1] = False
-    for p in range(2, int(math.isqrt(limit)) + 1):
-        if sieve[p]:
-            for multiple in range(p * p, limit + 1, p):
-                sieve[multiple] = False
-    return [i for i, flag in enumerate(sieve) if flag]
+    table = active_table()
+    if table is not None and limit <= table.limit:
+        return table.primes(limit)
+    return wheel_primes(limit)
+
+
+def iter_primes(lo: int, hi: int, *, segment_size: int = 1 << 18) -> Iterator[int]:
+    """Yield primes p with lo ≤ p < hi from a segmented sieve.
+
+    Memory is O(√hi + segment_size) regardless of the range length.
+    """
+
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+    base = primes_up_to(math.isqrt(hi - 1))
+    for seg_start in range(lo, hi, segment_size):
+        seg_end = min(seg_start + segment_size, hi)
+        length = seg_end - seg_start
+        flags = bytearray(b"\x01") * length
+        for p in base:
+            square = p * p
+            if square >= seg_end:
+                break
+            first = max(square, -(-seg_start // p) * p) - seg_start
+            flags[first::p] = bytes(len(range(first, length, p)))
+        yield from compress(range(seg_start, seg_end), flags)
+
+
+def sieve_window(
+    lo: int, hi: int, *, factors: bool = False
+) -> Tuple[bytearray, Optional[List[int]]]:
+    """Sieve the window [lo, hi] (inclusive) with base primes up to √hi.
+
+    Returns ``(flags, spf)`` where ``flags[i]`` is 1 iff ``lo + i`` is prime.
+    With ``factors=True``, ``spf[i]`` is the smallest prime factor of
+    ``lo + i`` (the number itself when prime, 0 below 2), otherwise None.
+    """
+
+    lo = max(lo, 0)
+    length = hi - lo + 1
+    if length <= 0:
+        return bytearray(), [] if factors else None
+    flags = bytearray(b"\x01") * length
+    below_two = max(0, min(2 - lo, length))
+    flags[:below_two] = bytes(below_two)
+    base = primes_up_to(math.isqrt(hi))
+    spf: Optional[List[int]] = [0] * length if factors else None
+    # Descending order lets smaller primes overwrite larger ones, so each slot
+    # ends up holding its smallest prime factor without per-element checks.
+    for p in reversed(base):
+        first = max(p * p, -(-lo // p) * p) - lo
+        if first >= length:
+            continue
+        count = len(range(first, length, p))
+        flags[first::p] = bytes(count)
+        if spf is not None:
+            spf[first::p] = [p] * count
+    if spf is not None:
+        for i in compress(range(length), flags):
+            spf[i] = lo + i
+    return flags, spf
+
+
+SMALL_PRIMES = primes_up_to(1 << 16)
+
+# Miller–Rabin with these bases is deterministic for n < 3.3 * 10^24.
+_DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+
+def is_strong_probable_prime(n: int, a: int) -> bool:
+    """Return True if odd n > 2 is a strong probable prime to base a."""
+
+    return strong_witness(n, (a,)) is None
+
+
+def jacobi_symbol(a: int, n: int) -> int:
+    """Compute the Jacobi symbol (a|n) for odd n > 0."""
+
+    if n <= 0 or n % 2 == 0:
+        raise ValueError("n must be an odd positive integer")
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def is_strong_lucas_probable_prime(n: int) -> bool:
+    """Strong Lucas probable-prime test with Selfridge parameters (odd n > 2)."""
+
+    root = math.isqrt(n)
+    if root * root == n:
+        return False
+    # Selfridge: first D in 5, -7, 9, -11, ... with (D|n) = -1.
+    d_param = 5
+    while True:
+        j = jacobi_symbol(d_param, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d_param) != n:
+            return False
+        d_param = -d_param - 2 if d_param > 0 else -d_param + 2
+    q_param = (1 - d_param) // 4
+
+    d, s = split_power_of_two(n + 1)
+    n = fast_int(n)
+
+    def halve(x: int) -> int:
+        return (x if x % 2 == 0 else x + n) // 2 % n
+
+    # Binary ladder for U_d, V_d, Q^d with P = 1.
+    u, v, qk = 1, 1, q_param % n
+    for bit in bin(d)[3:]:
+        u = u * v % n
+        v = (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == "1":
+            u, v = halve(u + v), halve(d_param * u + v)
+            qk = qk * q_param % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if v == 0:
+            return True
+    return False
+
+
+def is_probable_prime(n: int) -> bool:
+    """Primality test for arbitrary n.
+
+    Deterministic Miller–Rabin below 3.3 * 10^24; above that, Baillie–PSW
+    (base-2 strong test plus strong Lucas test), for which no counterexample
+    is known.
+    """
+
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:64]:
+        if n % p == 0:
+            return n == p
+    if n < 311 * 311:
+        return True
+    if n < _DETERMINISTIC_LIMIT:
+        return strong_witness(n, _DETERMINISTIC_BASES) is None
+    return strong_witness(n, (2,)) is None and is_strong_lucas_probable_prime(n)
+
+
+def _window_candidates(start: int, step: int, window: int, bits: int) -> Iterator[int]:
+    """Yield start + step·i (i < window, step = ±2) that survive small-prime sieving."""
+
+    sieve_primes = SMALL_PRIMES[1 : min(len(SMALL_PRIMES), 2 * bits + 64)]
+    flags = bytearray(b"\x01") * window
+    for p in sieve_primes:
+        # start + step·i ≡ 0 (mod p)  ⇔  i ≡ -start / step (mod p)
+        first = (-start * pow(step, -1, p)) % p
+        if first < window:
+            flags[first::p] = bytes(len(range(first, window, p)))
+    index = flags.find(1)
+    while index != -1:
+        yield start + step * index
+        index = flags.find(1, index + 1)
+
+
+def next_probable_prime(n: int) -> int:
+    """Return the smallest probable prime strictly greater than n.
+
+    Candidates are taken from windows sieved against the small-prime table,
+    so only survivors pay for a probable-prime test.
+    """
+
+    if n < 2:
+        return 2
+    if n < SMALL_PRIMES[-1]:
+        for p in SMALL_PRIMES:
+            if p > n:
+                return p
+    bits = n.bit_length()
+    window = max(256, 4 * bits)
+    start = n + 1 + (n % 2)  # first odd candidate above n
+    while True:
+        for candidate in _window_candidates(start, 2, window, bits):
+            if is_probable_prime(candidate):
+                return candidate
+        start += 2 * window
+
+
+def prev_probable_prime(n: int) -> int:
+    """Return the largest probable prime strictly less than n (n > 2)."""
+
+    if n <= 2:
+        raise ValueError("no prime below 2")
+    if n <= SMALL_PRIMES[-1] + 1:
+        for p in reversed(SMALL_PRIMES):
+            if p < n:
+                return p
+    bits = n.bit_length()
+    window = max(256, 4 * bits)
+    start = n - 1 - (n % 2)  # first odd candidate below n
+    while True:
+        count = min(window, (start - SMALL_PRIMES[-1]) // 2)
+        for candidate in _window_candidates(start, -2, count, bits):
+            if is_probable_prime(candidate):
+                return candidate
+        start -= 2 * count
+        if start <= SMALL_PRIMES[-1]:
+            return prev_probable_prime(start + 1)
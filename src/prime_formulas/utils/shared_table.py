@@ -0,0 +1,266 @@
+"""Prime table in shared memory, built once and attached by name from workers.
+
+The table is an odd-only bitset (bit i ↔ 2i + 1, so N/16 bytes for limit N)
+behind a small header holding a reference count. One process publishes it;
+workers attach read-only by name, either explicitly or through the
+``PRIME_FORMULAS_SHARED_TABLE`` environment variable that :meth:`publish`
+exports to child processes. The segment is unlinked when the last reference
+is closed. The reference count is guarded by a lock file in a private
+directory the publisher creates with ``mkdtemp``; its path is stored in the
+header so attaching processes find it. While a table is active,
+``is_prime_basic``, ``smallest_prime_factor`` and the sieves answer from it.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
+from contextlib import contextmanager, suppress
+from itertools import compress
+from multiprocessing import resource_tracker, shared_memory, util
+from typing import Iterator, List, Optional
+
+try:  # POSIX advisory locks
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:  # Windows byte-range locks
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX
+    msvcrt = None
+
+ENV_VAR = "PRIME_FORMULAS_SHARED_TABLE"
+
+_MAGIC = b"SPT2"
+# magic, reference count, limit, number of primes ≤ limit, lock directory
+_HEADER = struct.Struct("<4sIQQ256s")
+_REFCOUNT = struct.Struct("<I")
+# Segments are only registered with the resource tracker on POSIX.
+_TRACKED = os.name == "posix"
+
+# Byte value -> 8 bytes of 0/1 flags, one per bit (least significant first).
+_EXPAND = [bytes((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+
+
+def _odd_bitset(limit: int) -> bytes:
+    """Bit i set iff 2i + 1 is an odd prime ≤ limit."""
+
+    size = limit // 2 + 1
+    flags = bytearray(b"\x01") * size
+    flags[0] = 0  # 1 is not prime
+    i = 1
+    while (2 * i + 1) ** 2 <= limit:
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+        i += 1
+    if limit % 2 == 0:
+        flags[size - 1] = 0  # 2i + 1 = limit + 1 is out of range
+    # Pack one flag per byte into bits via a binary-string round trip.
+    digits = flags.translate(bytes.maketrans(b"\x00\x01", b"01")).decode()[::-1]
+    return int(digits, 2).to_bytes((size + 7) // 8, "little")
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    # Lifetime follows the reference count rather than the resource tracker,
+    # which would unlink the segment when the first attached process exits.
+    if _TRACKED:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+
+
+def _lock_path(lock_dir: str) -> str:
+    return os.path.join(lock_dir, "refcount.lock")
+
+
+@contextmanager
+def _locked(lock_dir: str) -> Iterator[None]:
+    """Exclusive lock across processes; FileNotFoundError once the table is gone."""
+
+    with open(_lock_path(lock_dir), "a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        elif msvcrt is not None:  # pragma: no cover - Windows
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            elif msvcrt is not None:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _remove_lock(lock_dir: str) -> None:
+    with suppress(FileNotFoundError):
+        os.unlink(_lock_path(lock_dir))
+    with suppress(OSError):
+        os.rmdir(lock_dir)
+
+
+def _release(shm: shared_memory.SharedMemory, bits: memoryview, lock_dir: str) -> None:
+    """Drop one reference to the segment; the last one unlinks it.
+
+    Only takes the handles, never the table, so a finalizer holding these
+    arguments does not keep the table object alive.
+    """
+
+    bits.release()
+    with _locked(lock_dir):
+        refs = _REFCOUNT.unpack_from(shm.buf, 4)[0] - 1
+        _REFCOUNT.pack_into(shm.buf, 4, refs)
+        shm.close()
+        if refs == 0:
+            if _TRACKED:
+                # unlink() unregisters from the tracker; balance _untrack().
+                resource_tracker.register(shm._name, "shared_memory")  # type: ignore[attr-defined]
+            shm.unlink()
+    if refs == 0:
+        _remove_lock(lock_dir)
+
+
+class SharedPrimeTable:
+    """Read-only view of a published prime bitset; see the module docstring."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        _, _, limit, count, lock_dir = _HEADER.unpack_from(shm.buf)
+        self._shm = shm
+        self.name = shm.name
+        self.limit = limit
+        self.count = count
+        self.owner = owner
+        self._lock_dir = os.fsdecode(lock_dir.rstrip(b"\0"))
+        self.bits = shm.buf[_HEADER.size : _HEADER.size + (limit // 2 + 8) // 8].toreadonly()
+        # Release our reference when the table is collected or at interpreter
+        # (or worker process) exit; the finalizer only holds a weak reference
+        # to the table itself.
+        self._finalizer = util.Finalize(
+            self, _release, args=(shm, self.bits, self._lock_dir), exitpriority=10
+        )
+
+    @classmethod
+    def publish(
+        cls, limit: int, *, name: Optional[str] = None, activate: bool = True
+    ) -> "SharedPrimeTable":
+        """Build the table for primes ≤ limit and publish it under ``name``.
+
+        With ``activate`` the table becomes the active table in this process
+        and its name is exported to child processes via :data:`ENV_VAR`.
+        """
+
+        bits = _odd_bitset(max(limit, 2))
+        count = (1 if limit >= 2 else 0) + sum(bin(b).count("1") for b in bits)
+        # mkdtemp creates the directory readable by this user only.
+        lock_dir = tempfile.mkdtemp(prefix="prime_formulas-")
+        encoded = os.fsencode(lock_dir)
+        if len(encoded) > 256:
+            os.rmdir(lock_dir)
+            raise ValueError(f"temporary directory path too long: {lock_dir!r}")
+        try:
+            shm = shared_memory.SharedMemory(
+                name=name, create=True, size=_HEADER.size + len(bits)
+            )
+        except OSError:
+            os.rmdir(lock_dir)
+            raise
+        _untrack(shm)
+        shm.buf[: _HEADER.size] = _HEADER.pack(_MAGIC, 1, limit, count, encoded)
+        shm.buf[_HEADER.size : _HEADER.size + len(bits)] = bits
+        table = cls(shm, owner=True)
+        if activate:
+            set_active_table(table)
+            os.environ[ENV_VAR] = table.name
+        return table
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedPrimeTable":
+        """Attach to a published table by name and take a reference to it."""
+
+        shm = shared_memory.SharedMemory(name=name)
+        _untrack(shm)
+        if shm.size < _HEADER.size or bytes(shm.buf[:4]) != _MAGIC:
+            shm.close()
+            raise ValueError(f"shared memory {name!r} is not a prime table")
+        lock_dir = _HEADER.unpack_from(shm.buf)[4]
+        try:
+            # The lock directory disappears with the last reference.
+            with _locked(os.fsdecode(lock_dir.rstrip(b"\0"))):
+                (refs,) = _REFCOUNT.unpack_from(shm.buf, 4)
+                if refs == 0:
+                    raise FileNotFoundError(name)
+                _REFCOUNT.pack_into(shm.buf, 4, refs + 1)
+        except FileNotFoundError:
+            # The last reference was dropped after we opened the segment.
+            shm.close()
+            raise
+        return cls(shm, owner=False)
+
+    @property
+    def refcount(self) -> int:
+        return _REFCOUNT.unpack_from(self._shm.buf, 4)[0]
+
+    def is_prime(self, n: int) -> bool:
+        """Primality of 0 ≤ n ≤ limit from the bitset."""
+
+        if n & 1 == 0:
+            return n == 2
+        return bool(self.bits[n >> 4] >> ((n >> 1) & 7) & 1)
+
+    def primes(self, hi: int, lo: int = 2) -> List[int]:
+        """Primes p with lo ≤ p ≤ min(hi, limit)."""
+
+        hi = min(hi, self.limit)
+        if hi < max(lo, 2):
+            return []
+        first, last = max(lo, 1) // 16, hi // 16
+        flags = b"".join(map(_EXPAND.__getitem__, self.bits[first : last + 1]))
+        odd = compress(range(16 * first + 1, 16 * (last + 1), 2), flags)
+        result = [2] if lo <= 2 else []
+        result.extend(p for p in odd if lo <= p <= hi)
+        return result
+
+    def close(self) -> None:
+        """Drop this reference; the last one unlinks the shared memory."""
+
+        if not self._finalizer.still_active():
+            return
+        if _active is self:
+            set_active_table(None)
+            if self.owner and os.environ.get(ENV_VAR) == self.name:
+                del os.environ[ENV_VAR]
+        self._finalizer()
+
+    def __enter__(self) -> "SharedPrimeTable":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+_active: Optional[SharedPrimeTable] = None
+_env_checked = False
+
+
+def set_active_table(table: Optional[SharedPrimeTable]) -> None:
+    global _active, _env_checked
+    _active = table
+    _env_checked = True
+
+
+def active_table() -> Optional[SharedPrimeTable]:
+    """The table consulted by the prime helpers, attaching via :data:`ENV_VAR` once."""
+
+    global _active, _env_checked
+    if _active is None and not _env_checked:
+        _env_checked = True
+        name = os.environ.get(ENV_VAR)
+        if name:
+            try:
+                _active = SharedPrimeTable.attach(name)
+            except (FileNotFoundError, ValueError):
+                _active = None
+    return _active
@@ -0,0 +1,238 @@
+"""Smallest-prime-factor tables, fast factorization and multiplicative functions."""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from .primes import primes_up_to
+
+_MAGIC = b"SPF1"
+_HEADER = struct.Struct("<4sQ")
+# Table entries are stored little-endian whatever the host byte order.
+_BIG_ENDIAN = sys.byteorder == "big"
+
+# factorize() answers from a shared table up to this bound.
+SPF_FACTOR_LIMIT = 1 << 20
+
+
+class SPFTable:
+    """``spf[n]`` is the smallest prime factor of n for 2 ≤ n ≤ limit.
+
+    Entries are stored as ``array('I')`` (4 bytes each, limit < 2^32), or as a
+    read-only ``memoryview`` over a memory-mapped file from :meth:`load`.
+    """
+
+    def __init__(self, limit: int, spf: Optional[Sequence[int]] = None) -> None:
+        if not 1 <= limit < 1 << 32:
+            raise ValueError("limit must be in [1, 2^32)")
+        self.limit = limit
+        self.spf = spf if spf is not None else _build(limit)
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return self.limit + 1
+
+    def __getitem__(self, n: int) -> int:
+        return self.spf[n]
+
+    def __contains__(self, n: int) -> bool:
+        return 2 <= n <= self.limit
+
+    def is_prime(self, n: int) -> bool:
+        return 2 <= n and self.spf[n] == n
+
+    def factorize(self, n: int) -> Dict[int, int]:
+        """Return {prime: exponent} for 1 ≤ n ≤ limit in O(log n) lookups."""
+
+        if not 1 <= n <= self.limit:
+            raise ValueError(f"n must be in [1, {self.limit}]")
+        spf = self.spf
+        factors: Dict[int, int] = {}
+        while n > 1:
+            p = spf[n]
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            factors[p] = e
+        return factors
+
+    def _multiplicative(
+        self,
+        lo: int,
+        hi: int,
+        at_prime_power: Callable[[int, int, int], int],
+        additive: bool = False,
+    ) -> List[int]:
+        """Evaluate a multiplicative (or additive) function on [lo, hi].
+
+        ``at_prime_power(p, e, p^e)`` gives the value on prime powers. Windows
+        covering at least half of [1, hi] use one pass over the table; narrower
+        ones a segmented sieve whose cost does not grow with hi.
+        """
+
+        if hi > self.limit:
+            raise ValueError(f"hi must be at most {self.limit}")
+        lo = max(lo, 1)
+        if hi < lo:
+            return []
+        if 2 * (hi - lo + 1) >= hi:
+            return self._multiplicative_prefix(hi, at_prime_power, additive)[lo:]
+        return _multiplicative_window(lo, hi, at_prime_power, additive)
+
+    def _multiplicative_prefix(
+        self, hi: int, at_prime_power: Callable[[int, int, int], int], additive: bool
+    ) -> List[int]:
+        """Values on [0, hi] in O(hi) from the table.
+
+        Each n = p^e · m with p = spf(n) and gcd(p, m) = 1, so values follow
+        from smaller ones in a single pass.
+        """
+
+        spf = self.spf
+        values = [0] * (hi + 1)
+        values[1] = 0 if additive else 1
+        # power[n] = p^e, the full power of spf(n) dividing n, and exponent[n] = e.
+        power = [0] * (hi + 1)
+        exponent = [0] * (hi + 1)
+        for n in range(2, hi + 1):
+            p = spf[n]
+            m = n // p
+            if m > 1 and spf[m] == p:
+                pe, e = power[m] * p, exponent[m] + 1
+            else:
+                pe, e = p, 1
+            power[n] = pe
+            exponent[n] = e
+            rest = values[n // pe]
+            value = at_prime_power(p, e, pe)
+            values[n] = rest + value if additive else rest * value
+        return values
+
+    def phi_range(self, lo: int, hi: int) -> List[int]:
+        """Euler's totient φ(n) for lo ≤ n ≤ hi."""
+
+        return self._multiplicative(lo, hi, lambda p, e, pe: pe - pe // p)
+
+    def mobius_range(self, lo: int, hi: int) -> List[int]:
+        """Möbius μ(n) for lo ≤ n ≤ hi."""
+
+        return self._multiplicative(lo, hi, lambda p, e, pe: -1 if e == 1 else 0)
+
+    def sigma_range(self, lo: int, hi: int, k: int = 1) -> List[int]:
+        """Divisor sum σ_k(n) = Σ_{d | n} d^k for lo ≤ n ≤ hi."""
+
+        if k == 0:
+            return self._multiplicative(lo, hi, lambda p, e, pe: e + 1)
+        return self._multiplicative(
+            lo, hi, lambda p, e, pe: ((pe * p) ** k - 1) // (p**k - 1)
+        )
+
+    def omega_range(self, lo: int, hi: int) -> List[int]:
+        """Number of distinct prime factors ω(n) for lo ≤ n ≤ hi."""
+
+        return self._multiplicative(lo, hi, lambda p, e, pe: 1, additive=True)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the table as a small header followed by raw little-endian uint32s."""
+
+        data = array("I", self.spf)
+        if data.itemsize != 4:
+            raise ValueError("platform has no 4-byte unsigned int array type")
+        if _BIG_ENDIAN:
+            data.byteswap()
+        with open(path, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, self.limit))
+            data.tofile(handle)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], *, use_mmap: bool = True) -> "SPFTable":
+        """Read a table written by :meth:`save`, memory-mapping it by default.
+
+        Big-endian hosts cannot use the little-endian file in place, so they
+        always read (and byteswap) a copy.
+        """
+
+        with open(path, "rb") as handle:
+            magic, limit = _HEADER.unpack(handle.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError("not an SPF table file")
+            if not use_mmap or _BIG_ENDIAN:
+                spf = array("I")
+                spf.fromfile(handle, limit + 1)
+                if _BIG_ENDIAN:
+                    spf.byteswap()
+                return cls(limit, spf)
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        table = cls(limit, memoryview(mapped)[_HEADER.size :].cast("I"))
+        table._mmap = mapped
+        return table
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self.spf.release()  # type: ignore[union-attr]
+            self._mmap.close()
+            self._mmap = None
+
+
+def _multiplicative_window(
+    lo: int, hi: int, at_prime_power: Callable[[int, int, int], int], additive: bool
+) -> List[int]:
+    """Values on [lo, hi] in O((hi - lo) log log hi + √hi) by a segmented sieve.
+
+    Each prime p ≤ √hi is divided out of its multiples in the window; the
+    cofactor left over is 1 or a single prime above √hi.
+    """
+
+    rest = list(range(lo, hi + 1))
+    values = [0 if additive else 1] * len(rest)
+    for p in primes_up_to(math.isqrt(hi)):
+        single = at_prime_power(p, 1, p)
+        for i in range(-lo % p, len(rest), p):
+            m = rest[i] // p
+            if m % p:
+                value = single
+            else:
+                e, pe = 1, p
+                while m % p == 0:
+                    m //= p
+                    e += 1
+                    pe *= p
+                value = at_prime_power(p, e, pe)
+            rest[i] = m
+            values[i] = values[i] + value if additive else values[i] * value
+    for i, m in enumerate(rest):
+        if m > 1:
+            value = at_prime_power(m, 1, m)
+            values[i] = values[i] + value if additive else values[i] * value
+    return values
+
+
+def _build(limit: int) -> array:
+    spf = array("I", range(limit + 1))
+    # Larger primes first so that smaller ones overwrite them: the surviving
+    # entry for each n is its smallest prime factor. Multiples of p below p²
+    # already have a smaller factor, and entries left as n are primes.
+    for p in reversed(primes_up_to(math.isqrt(limit))):
+        count = len(range(p * p, limit + 1, p))
+        spf[p * p :: p] = array("I", [p]) * count
+    return spf
+
+
+_SHARED: Optional[SPFTable] = None
+
+
+def spf_table(limit: int = SPF_FACTOR_LIMIT) -> SPFTable:
+    """Return a process-wide table covering at least ``limit``, built on demand."""
+
+    global _SHARED
+    if _SHARED is None or _SHARED.limit < limit:
+        size = max(limit, 2 * _SHARED.limit if _SHARED is not None else limit)
+        _SHARED = SPFTable(min(size, (1 << 32) - 1))
+    return _SHARED
@@ -0,0 +1,118 @@
+"""Mod-30 wheel bitset: 8 bits per 30 integers for sieve storage.
+
+Bit k of byte i stands for n = 30·i + RESIDUES[k]; multiples of 2, 3 and 5
+are never stored. Crossing off the multiples of f in one residue class is a
+single strided slice rewritten through a ``bytes.translate`` table, counting
+is a popcount, and enumeration expands each bit class with ``translate`` and
+``itertools.compress`` before a C-level merge.
+"""
+
+from __future__ import annotations
+
+import math
+from itertools import chain, compress
+from typing import List
+
+RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+_INDEX = {r: k for k, r in enumerate(RESIDUES)}
+
+# _CLEAR[k]: translate table that clears bit k of every byte.
+_CLEAR = [bytes(b & ~(1 << k) for b in range(256)) for k in range(8)]
+# _BIT[k]: translate table mapping a byte to 1 if bit k is set, else 0.
+_BIT = [bytes((b >> k) & 1 for b in range(256)) for k in range(8)]
+# _STEP[a][k]: residue m (mod 30) with a·m ≡ RESIDUES[k] (mod 30), for a in RESIDUES.
+_STEP = [[RESIDUES[k] * pow(a, -1, 30) % 30 for k in range(8)] for a in RESIDUES]
+
+
+def _clear_multiples(bits: bytearray, f: int, start: int) -> None:
+    """Clear f·m for every m ≥ start coprime to 30 (f coprime to 30)."""
+
+    steps = _STEP[_INDEX[f % 30]]
+    for k in range(8):
+        m = start + (steps[k] - start) % 30
+        first = f * m // 30
+        if first < len(bits):
+            bits[first::f] = bits[first::f].translate(_CLEAR[k])
+
+
+class WheelBitset:
+    """Flags for the integers coprime to 30 in [0, limit]."""
+
+    def __init__(self, limit: int, fill: bool = True) -> None:
+        self.limit = limit
+        self.bits = bytearray(b"\xff" if fill else b"\x00") * (limit // 30 + 1)
+        self._trim()
+
+    def _trim(self) -> None:
+        # Drop bit positions above the limit in the last byte.
+        base = 30 * (len(self.bits) - 1)
+        for k, r in enumerate(RESIDUES):
+            if base + r > self.limit:
+                self.bits[-1] &= ~(1 << k) & 0xFF
+
+    def __contains__(self, n: int) -> bool:
+        k = _INDEX.get(n % 30)
+        return k is not None and 0 <= n <= self.limit and bool(self.bits[n // 30] >> k & 1)
+
+    def toggle(self, n: int) -> None:
+        self.bits[n // 30] ^= 1 << _INDEX[n % 30]
+
+    def discard(self, n: int) -> None:
+        if n in self:
+            self.toggle(n)
+
+    def clear_multiples(self, f: int, start: int = 1) -> None:
+        """Clear f·m for m ≥ start, m coprime to 30 (f must be coprime to 30)."""
+
+        _clear_multiples(self.bits, f, start)
+
+    def count(self) -> int:
+        """Number of set bits (popcount over the whole buffer)."""
+
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    def members(self, hi: int = -1) -> List[int]:
+        """Set members in increasing order, optionally only those ≤ hi."""
+
+        hi = self.limit if hi < 0 else min(hi, self.limit)
+        size = hi // 30 + 1
+        bits = self.bits[:size]
+        classes = [
+            compress(range(r, 30 * size, 30), bits.translate(_BIT[k]))
+            for k, r in enumerate(RESIDUES)
+        ]
+        merged = sorted(chain.from_iterable(classes))
+        while merged and merged[-1] > hi:
+            merged.pop()
+        return merged
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+
+def wheel_sieve(limit: int) -> WheelBitset:
+    """Eratosthenes sieve on the mod-30 wheel: bits set for primes > 5 up to limit."""
+
+    wheel = WheelBitset(limit)
+    wheel.discard(1)
+    for p in wheel.members(math.isqrt(limit)):
+        if p in wheel:
+            wheel.clear_multiples(p, p)
+    return wheel
+
+
+def wheel_primes(limit: int) -> List[int]:
+    """All primes ≤ limit via :func:`wheel_sieve`."""
+
+    if limit < 2:
+        return []
+    return [p for p in (2, 3, 5) if p <= limit] + wheel_sieve(limit).members()
+
+
+def wheel_prime_count(limit: int) -> int:
+    """π(limit) from a popcount of the wheel sieve."""
+
+    if limit < 2:
+        return 0
+    return sum(1 for p in (2, 3, 5) if p <= limit) + wheel_sieve(limit).count()
@@ -1,4 +1,15 @@
+import asyncio
+import gc
 import importlib
+import json
+import logging
+import math
+import os
+import pickle
+import re
+import struct
+import subprocess
+import sys
 
 import pytest
 
@@ -11,12 +22,67 @@ MODULES = [
     "prime_formulas.probabilistic.miller_rabin",
     "prime_formulas.deterministic.lucas_lehmer",
     "prime_formulas.deterministic.wilson",
+    "prime_formulas.deterministic.pocklington",
+    "prime_formulas.specialized.sophie_germain",
+    "prime_formulas.modular.legendre_symbol",
+    "prime_formulas.modular.modular_sqrt",
+    "prime_formulas.generating.mills",
+    "prime_formulas.generating.prime_generation",
+    "prime_formulas.analytic.prime_gaps",
+    "prime_formulas.analytic.primes_in_progressions",
+    "prime_formulas.analytic.prime_sums",
+    "prime_formulas.additive.goldbach",
 ]
 
 for module in MODULES:
     importlib.import_module(module)
 
-from prime_formulas.registry import get
+from prime_formulas import cli
+from prime_formulas.additive.goldbach import representation_counts
+from prime_formulas.analytic.prime_gaps import prime_gap_statistics
+from prime_formulas.analytic.prime_number_theorem import logarithmic_integral
+from prime_formulas.analytic.prime_sums import prime_power_sum
+from prime_formulas.analytic.primes_in_progressions import count_chunk
+from prime_formulas.deterministic.pocklington import verify_certificate
+from prime_formulas.differential import (
+    advisory_targets,
+    adversarial_cases,
+    check_primality,
+    primality_targets,
+    random_cases,
+    range_targets,
+)
+from prime_formulas.catalog import ALGORITHM_MODULES, load_all_algorithms
+from prime_formulas.jobs import JobManager, _stream_lucas_lehmer
+from prime_formulas.modular.legendre_symbol import jacobi_symbol, quadratic_residue_bitmap
+from prime_formulas.payload import lttb, page, shape
+from prime_formulas.planner import (
+    PRIMALITY_BACKENDS,
+    calibrate,
+    is_prime,
+    plan,
+    primes,
+    reset_calibration,
+)
+from prime_formulas.registry import executor, get, get_metadata, list_algorithms
+from prime_formulas.results import RunResult, set_timing
+from prime_formulas.specialized.sophie_germain import random_safe_prime
+from prime_formulas.utils.factorial import factorial_mod_method, product_range_mod
+from prime_formulas.utils.factorization import factorize
+from prime_formulas.utils.modarith import fermat_witness, strong_witness
+from prime_formulas.utils.prime_array import PrimeArray
+from prime_formulas.utils.shared_table import SharedPrimeTable, active_table
+from prime_formulas.utils.spf import SPFTable
+from prime_formulas.utils.wheel import WheelBitset, wheel_prime_count, wheel_sieve
+from prime_formulas.utils.primes import (
+    is_prime_basic,
+    smallest_prime_factor,
+    is_probable_prime,
+    iter_primes,
+    is_strong_lucas_probable_prime,
+    next_probable_prime,
+    primes_up_to,
+)
 
 
 def test_trial_division():
@@ -27,6 +93,16 @@ def test_trial_division():
     assert res["meta"]["factors"] == [13]
 
 
+def test_trial_division_range_mode():
+    res = get("trial_division").run(10**9, hi=10**9 + 100, return_factors=True)
+    single = [get("trial_division").run(n)["result"] for n in range(10**9, 10**9 + 101)]
+    assert list(map(bool, res["result"])) == single
+    assert res["meta"]["count"] == sum(single)
+    spf = res["meta"]["smallest_factors"]
+    assert spf[0] == 2 and spf[7] == 10**9 + 7 and spf[13] == 7699
+    assert list(get("trial_division").run(0, hi=3)["result"]) == [0, 0, 1, 1]
+
+
 def test_sieve_eratosthenes():
     algo = get("sieve_eratosthenes")
     assert algo.run(20)["result"] == [2, 3, 5, 7, 11, 13, 17, 19]
@@ -36,6 +112,43 @@ def test_sieve_atkin_matches_sieve():
     erat = get("sieve_eratosthenes").run(100)["result"]
     atkin = get("sieve_atkin").run(100)["result"]
     assert atkin == erat
+    assert get("sieve_atkin").run(2)["result"] == [2]
+
+
+def test_compact_prime_array_results():
+    expected = get("sieve_eratosthenes").run(10_000)["result"]
+    for name in ("sieve_eratosthenes", "sieve_atkin"):
+        primes = get(name).run(10_000, compact=True)["result"]
+        assert isinstance(primes, PrimeArray)
+        assert primes.typecode == "I"
+        assert primes == expected
+        assert primes[:4] == [2, 3, 5, 7] and isinstance(primes[:4], PrimeArray)
+        assert memoryview(primes).nbytes == 4 * len(expected)
+    for compress in (False, True):
+        blob = primes.to_bytes(compress=compress)
+        assert len(blob) < len(expected) + 16
+        assert PrimeArray.from_bytes(blob) == expected
+    mixed = PrimeArray([10, 3, 2**63, 0])
+    assert PrimeArray.from_bytes(mixed.to_bytes()) == [10, 3, 2**63, 0]
+
+
+def test_wheel_bitset_storage():
+    for limit in range(200):
+        expected = [p for p in range(limit + 1) if is_prime_basic(p)]
+        assert primes_up_to(limit) == expected
+        assert wheel_prime_count(limit) == len(expected)
+        for name in ("sieve_eratosthenes", "sieve_atkin"):
+            assert get(name).run(limit)["result"] == expected
+    wheel = wheel_sieve(10**6)
+    assert wheel.nbytes == 10**6 // 30 + 1
+    assert wheel.count() + 3 == 78498 and wheel_prime_count(10**6) == 78498
+    assert 999983 in wheel and 999981 not in wheel and 10**6 + 3 not in wheel
+    assert wheel.members(100) == [p for p in primes_up_to(100) if p > 5]
+    empty = WheelBitset(59, fill=False)
+    empty.toggle(49)
+    assert empty.members() == [49] and empty.count() == 1
+    frames = get("sieve_eratosthenes").run(100)["meta"]["frames"]
+    assert [f["t"] for f in frames] == [2, 3, 5, 7]
 
 
 def test_fermat_detects_composite():
@@ -60,3 +173,473 @@ def test_wilson():
     algo = get("wilson_test")
     assert algo.run(13)["result"] is True
     assert algo.run(15)["result"] is False
+
+
+def test_factorial_mod_multipoint_matches_product():
+    for k, n in ((1 << 20, 1048583), ((1 << 20) + 5, 3 * 1048583), (1 << 17, 1 << 24)):
+        value, method = factorial_mod_method(k, n, "multipoint")
+        assert method == "multipoint"
+        assert value == factorial_mod_method(k, n, "product_tree")[0]
+        assert value == product_range_mod(2, k + 1, n)
+    # Zero remainders inside the multipoint tree (a poly_mul operand of all zeros).
+    k = 1 << 24
+    assert factorial_mod_method(k, k + 1031, "multipoint")[0] == 0
+    with pytest.raises(ValueError):
+        factorial_mod_method(10, 11, "fft")
+    assert get("wilson_test").run(1048583)["result"] is True
+
+
+def test_sophie_germain_range_matches_pointwise_test():
+    algo = get("sophie_germain_test")
+    expected = [p for p in range(2, 3000) if algo.run(p)["result"]]
+    assert get("sophie_germain_range").run(2999)["result"] == expected
+    assert get("sophie_germain_range").run(2999, lo=1000)["result"] == [
+        p for p in expected if p >= 1000
+    ]
+
+
+def test_random_safe_prime():
+    q = random_safe_prime(96, seed=5)
+    assert q.bit_length() == 96
+    assert is_probable_prime(q) and is_probable_prime((q - 1) // 2)
+    assert random_safe_prime(96, seed=5) == q
+    assert is_prime_basic(random_safe_prime(4, seed=1))
+
+
+def test_legendre_symbol_batch_matches_residues():
+    algo = get("legendre_symbol")
+    squares = {x * x % 23 for x in range(1, 23)}
+    expected = [1 if a in squares else -1 for a in range(1, 23)]
+    assert algo.run(23, a=list(range(1, 23)))["result"] == expected
+    assert algo.run(11, a=7)["result"] == -1
+    assert algo.run(21, a=2)["result"] is None
+    assert jacobi_symbol(8, 21) == -1
+
+
+def test_quadratic_residue_bitmap():
+    for method in ("squares", "euler"):
+        bitmap = quadratic_residue_bitmap(23, method=method)
+        assert [a for a, flag in enumerate(bitmap) if flag] == [1, 2, 3, 4, 6, 8, 9, 12, 13, 16, 18]
+    assert get("quadratic_residues").run(8)["result"] == [1, 4]
+
+
+def test_modular_sqrt_methods_and_batch():
+    algo = get("modular_sqrt")
+    res = algo.run(41, a=10)
+    assert res["result"] ** 2 % 41 == 10
+    assert res["meta"]["method"] == "tonelli_shanks"
+    assert algo.run(41, a=3)["result"] is None
+    roots = algo.run(998244353, a=[4, 9, 16])
+    assert roots["meta"]["method"] == "cipolla"
+    assert roots["result"] == [2, 3, 4]
+    lifted = algo.run(7, a=2, k=4)["result"]
+    assert lifted * lifted % 7**4 == 2
+
+
+def test_mills_formula_exact_terms():
+    res = get("mills_formula").run(6)
+    assert res["result"][:4] == [2, 11, 1361, 2521008887]
+    assert res["meta"]["digits"] == [1, 2, 4, 10, 29, 85]
+    assert abs(res["meta"]["constant_estimate"] - 1.3063778838630806) < 1e-12
+    for prev, nxt in zip(res["result"], res["result"][1:]):
+        assert prev**3 <= nxt < (prev + 1) ** 3
+
+
+def test_next_probable_prime():
+    assert [next_probable_prime(n) for n in (0, 2, 13, 89)] == [2, 3, 17, 97]
+    assert next_probable_prime(65521) == 65537
+    assert next_probable_prime(10**18) == 10**18 + 3
+
+
+def test_iter_primes_segments():
+    assert list(iter_primes(0, 10_001, segment_size=97)) == primes_up_to(10_000)
+    assert list(iter_primes(9_000, 9_100)) == [p for p in primes_up_to(9_100) if p >= 9_000]
+
+
+def test_prime_gap_statistics_merge_and_counts():
+    res = get("prime_gaps").run(1000)["result"]
+    assert res["count"] == 168
+    assert res["pairs"] == {"twin": 35, "cousin": 41, "sexy": 74}
+    assert res["max_gap"] == 20
+    assert [g["gap"] for g in res["maximal_gaps"]] == [1, 2, 4, 6, 8, 14, 18, 20]
+    whole = prime_gap_statistics(2, 100_001).to_dict()
+    assert prime_gap_statistics(2, 100_001, chunk_size=333).to_dict() == whole
+    assert whole["pairs"]["twin"] == 1224
+
+
+def test_factorize():
+    assert factorize(2**4 * 3**2 * 1000003 * 1000033) == {2: 4, 3: 2, 1000003: 1, 1000033: 1}
+    assert factorize(1) == {}
+
+
+def test_prove_prime_certificate_roundtrip():
+    algo = get("prove_prime")
+    n = 2**127 - 1
+    res = algo.run(n)
+    assert res["result"] is True
+    certificate = res["meta"]["certificate"]
+    assert verify_certificate(certificate) == n
+    forged = certificate.replace(f"{n:x}|", f"{n + 2:x}|")
+    assert verify_certificate(forged) is None
+    for malformed in ("", "zz", f"{n:x}|", f"{n:x}|3^1", f"{n:x}|0^1:2"):
+        assert verify_certificate(malformed) is None
+    # A tampered exponent is rejected before q^e is ever computed.
+    tampered = re.sub(r"\^[0-9a-f]+(:[0-9a-f]+)$", r"^fffffffff\1", certificate)
+    assert tampered != certificate and verify_certificate(tampered) is None
+    assert algo.run(2**127 + 1)["result"] is False
+
+
+def test_bpsw_rejects_lucas_and_mr_pseudoprimes():
+    for n in (5459, 5777, 10877, 16109, 18971):  # strong Lucas pseudoprimes
+        assert is_strong_lucas_probable_prime(n)
+        assert not is_probable_prime(n)
+    assert is_probable_prime(2**521 - 1)
+    assert not is_probable_prime((2**89 - 1) * (2**107 - 1))
+
+
+def test_next_prev_random_prime():
+    assert get("next_prime").run(10**12)["result"] == 10**12 + 39
+    assert get("prev_prime").run(10**12)["result"] == 10**12 - 11
+    assert get("prev_prime").run(2)["result"] is None
+    res = get("random_prime").run(256, seed=11)
+    assert res["meta"]["bits"] == 256 and is_probable_prime(res["result"])
+    assert get("random_prime").run(256, seed=11)["result"] == res["result"]
+    assert all(get("random_prime").run(b, seed=b)["result"].bit_length() == b for b in (2, 3, 8, 17))
+
+
+def test_run_result_behaves_like_result_dict():
+    res = get("miller_rabin").run(97, bases=[2, 3])
+    assert isinstance(res, RunResult)
+    assert res["result"] is True and res.result is True
+    assert set(res) == {"result", "meta"}
+    assert res["meta"]["bases"] == [2, 3] and res["meta"]["time_ms"] >= 0
+    assert dict(res) == {"result": True, "meta": res["meta"]}
+    assert pickle.loads(pickle.dumps(res)).to_dict() == res.to_dict()
+    set_timing(False)
+    try:
+        assert get("legendre_symbol").run(11, a=7)["meta"] == {"time_ms": 0.0}
+    finally:
+        set_timing(True)
+
+
+def test_differential_fast_paths_agree_with_reference():
+    exact = primality_targets()
+    assert {"trial_division", "wilson_test", "prove_prime", "lucas_lehmer"} <= set(exact)
+    assert "fermat_test" not in exact and "sieve_atkin" not in exact
+    names = ("is_probable_prime", "miller_rabin", "next_prime", "trial_division")
+    cases = adversarial_cases() + random_cases(50, seed=3)
+    reports = check_primality({k: exact[k] for k in names}, cases)
+    assert all(r.checked > 300 and not r.mismatches for r in reports)
+    advisory = advisory_targets()
+    assert set(advisory) == {"fermat_test", "miller_rabin"}
+    assert {"sieve_atkin", "sieve_atkin_compact", "sieve_eratosthenes_compact"} <= set(range_targets())
+    (fermat,) = check_primality({"fermat_test": advisory["fermat_test"]}, adversarial_cases())
+    assert "carmichael" in {kind for _, kind, _, _ in fermat.mismatches}
+    assert get("miller_rabin").run(5, bases=[2, 5, 7])["result"] is True
+
+
+def test_executor_dispatches_by_name_under_spawn():
+    with executor(workers=2, mp_context="spawn") as pool:
+        assert pool.submit("next_prime", 100).result()["result"] == 101
+        results = list(pool.map("miller_rabin", range(200), chunk_size=16, bases=[2, 3]))
+        assert [n for n, r in zip(range(200), results) if r["result"]] == primes_up_to(199)
+        unordered = pool.map("trial_division", range(50), chunk_size=7, ordered=False)
+        assert sum(r["result"] for r in unordered) == 15
+        with pytest.raises(KeyError):
+            pool.submit("no_such_algorithm", 1)
+
+
+def test_executor_and_jobs_work_without_preloading_the_catalog():
+    # A fresh interpreter: only the workers import the algorithm modules.
+    script = (
+        "import sys\n"
+        "from prime_formulas import executor\n"
+        "with executor(2, algorithms=['miller_rabin']) as ex:\n"
+        "    assert ex.submit('miller_rabin', 97).result()['result'] is True\n"
+        "    assert [r['result'] for r in ex.map('miller_rabin', [4, 5])] == [False, True]\n"
+        "    try:\n"
+        "        ex.submit('trial_division', 97)\n"
+        "    except KeyError:\n"
+        "        pass\n"
+        "    else:\n"
+        "        raise AssertionError('trial_division is not loaded in the workers')\n"
+        "from prime_formulas.jobs import JobManager\n"
+        "with JobManager(1) as jobs:\n"
+        "    assert jobs.submit('wilson_test', 10007).wait()['result'] is True\n"
+        "assert 'prime_formulas.probabilistic.miller_rabin' not in sys.modules\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=60)
+
+
+def test_spf_table_factorization_and_multiplicative_functions(tmp_path):
+    table = SPFTable(10_000)
+    assert table.factorize(9240) == {2: 3, 3: 1, 5: 1, 7: 1, 11: 1}
+    assert table.phi_range(1, 10) == [1, 1, 2, 2, 4, 2, 6, 4, 6, 4]
+    assert table.mobius_range(1, 10) == [1, -1, -1, 0, -1, 1, -1, 0, 0, 1]
+    assert table.sigma_range(9, 12) == [13, 18, 12, 28]
+    assert table.omega_range(28, 30) == [2, 1, 3]
+    assert factorize(9991) == {97: 1, 103: 1}
+    # Narrow windows take the segmented path; it must agree with the full pass.
+    for lo, hi in ((8180, 8200), (9973, 10_000), (4090, 4100)):
+        assert table.phi_range(lo, hi) == table.phi_range(1, hi)[lo - 1 :]
+        assert table.sigma_range(lo, hi, 0) == table.sigma_range(1, hi, 0)[lo - 1 :]
+        assert table.mobius_range(lo, hi) == table.mobius_range(1, hi)[lo - 1 :]
+    assert table.sigma_range(8192, 8192, 0) == [14]
+
+    table.save(tmp_path / "spf.bin")
+    # Entries are little-endian on disk regardless of the host: spf[9] = 3.
+    assert (tmp_path / "spf.bin").read_bytes()[12 + 4 * 9 : 12 + 4 * 10] == b"\x03\0\0\0"
+    mapped = SPFTable.load(tmp_path / "spf.bin")
+    try:
+        assert mapped.limit == 10_000 and mapped.factorize(9240) == table.factorize(9240)
+        assert all(mapped[n] == table[n] for n in range(2, 10_001))
+    finally:
+        mapped.close()
+
+
+def test_modarith_kernel():
+    big = 2**127 - 1
+    assert fermat_witness(561, [2, 5, 7]) is None  # Carmichael number
+    assert strong_witness(561, [2]) == 2
+    assert strong_witness(2047, [2]) is None and strong_witness(2047, [2, 3]) == 3
+    assert strong_witness(big, [2, 3, 5, 7, big + 2]) is None
+
+
+def test_jobs_stream_cancel_and_resume(tmp_path):
+    expected_30 = primes_up_to(30)
+
+    async def scenario():
+        with JobManager(1, checkpoint_dir=tmp_path) as jobs:
+            sieve = jobs.submit("sieve_eratosthenes", 100_000, segment_size=1 << 14)
+            segments = [part async for part in sieve]
+            final = await sieve.result()
+            assert sum(len(s["primes"]) for s in segments) == len(final["result"]) == 9592
+            assert sieve.progress() == 1.0
+
+            wilson = await jobs.submit("wilson_test", 100_003, chunks=8).result()
+            assert wilson["result"] is True
+            assert wilson["meta"]["method"] in {"product_tree", "numpy"}
+
+            # Jobs return what run() returns and reject the arguments it rejects.
+            for name, n in (("sieve_eratosthenes", 30), ("wilson_test", 31), ("lucas_lehmer", 13)):
+                expected = get(name).run(n)["result"]
+                got = (await jobs.submit(name, n).result())["result"]
+                assert got == expected and type(got) is type(expected)
+            compact = await jobs.submit("sieve_eratosthenes", 30, compact=True).result()
+            assert isinstance(compact["result"], PrimeArray)
+            assert list(compact["result"]) == expected_30
+            with pytest.raises(TypeError):
+                get("sieve_eratosthenes").run(30, bogus=1)
+            with pytest.raises(TypeError):
+                jobs.submit("sieve_eratosthenes", 30, bogus=1).wait()
+
+            ll = jobs.submit("lucas_lehmer", 9689, checkpoint_every=100)
+            async for part in ll:
+                assert part["iteration"] == 100
+                break
+            ll.cancel()
+            assert (await ll.result())["meta"]["cancelled"] is True
+            assert (tmp_path / "lucas_lehmer-9689.json").exists()
+
+            # A run interrupted after one step leaves a checkpoint to resume from.
+            partial = _stream_lucas_lehmer(4423, checkpoint_dir=str(tmp_path), checkpoint_every=100)
+            next(partial)
+            partial.close()
+            resumed = await jobs.submit("lucas_lehmer", 4423, checkpoint_every=100).result()
+            assert resumed["result"] is True and resumed["meta"]["resumed_from"] == 100
+            assert not (tmp_path / "lucas_lehmer-4423.json").exists()
+
+    asyncio.run(scenario())
+
+
+def test_planner_dispatch_and_calibration(tmp_path, caplog):
+    assert get_metadata("trial_division").cost.complexity == "sqrt"
+    assert plan(PRIMALITY_BACKENDS, 97)[0].name == "trial_division"
+    assert plan(PRIMALITY_BACKENDS, 10**15 + 37)[0].name in ("miller_rabin", "bpsw")
+    assert plan(PRIMALITY_BACKENDS, 2**200)[0].name == "bpsw"
+    # Cost models past float range must not overflow (2^2203 - 1 is a Mersenne prime).
+    assert is_prime(2**2203 - 1) and not is_prime(2**2203 + 1)
+    assert set(plan(PRIMALITY_BACKENDS, 2**4000)[1]) == {"bpsw"}
+    with caplog.at_level(logging.DEBUG, logger="prime_formulas.planner"):
+        assert [n for n in range(60) if is_prime(n)] == primes(59)
+    assert "is_prime(n=59" in caplog.text and "primes(n=59" in caplog.text
+    try:
+        fitted = calibrate(repeat=1, path=tmp_path / "calibration.json")
+        assert set(fitted) >= {"trial_division", "miller_rabin", "sieve_eratosthenes"}
+        assert all(model.constant_ns > 0 for model in fitted.values())
+        assert is_prime(2**61 - 1)
+    finally:
+        reset_calibration()
+
+
+def test_shared_prime_table_publish_attach_and_consult():
+    expected = primes_up_to(10_000)
+    table = SharedPrimeTable.publish(10_000)
+    try:
+        assert active_table() is table and table.count == len(expected)
+        worker = SharedPrimeTable.attach(table.name)
+        assert table.refcount == 2
+        assert worker.primes(10_000) == expected and worker.primes(120, 100) == [101, 103, 107, 109, 113]
+        worker.close()
+        assert table.refcount == 1
+        # A table dropped without close() still releases its reference.
+        SharedPrimeTable.attach(table.name)
+        gc.collect()
+        assert table.refcount == 1
+        lock_dir = table._lock_dir
+        assert os.stat(lock_dir).st_mode & 0o777 == 0o700
+
+        assert primes_up_to(10_000) == expected
+        assert is_prime_basic(9973) and not is_prime_basic(9971)
+        assert smallest_prime_factor(9973 * 9967) == 9967
+        res = get("sieve_eratosthenes").run(100)
+        assert res["meta"]["source"] == "shared_table" and res["result"] == expected[:25]
+    finally:
+        table.close()
+    assert active_table() is None
+    assert not os.path.exists(lock_dir)
+    with pytest.raises(FileNotFoundError):
+        SharedPrimeTable.attach(table.name)
+
+
+def test_primes_in_progressions_counts_and_bias():
+    res = get("primes_in_progressions").run(100_000, q=4)["result"]
+    assert res["counts"] == {1: 4783, 3: 4808} and res["dividing_q"] == 1
+    assert res["series"][-1]["counts"] == res["counts"] and res["series"][-1]["x"] == 100_000
+    assert abs(res["expected"] - logarithmic_integral(100_000) / 2) < 1e-9
+    assert abs(logarithmic_integral(10**10) - 455055614.586623) < 1e-4
+
+    ten = get("primes_in_progressions").run(1000, q=10, samples=1)["result"]
+    primes = primes_up_to(1000)
+    assert ten["counts"] == {a: sum(1 for p in primes if p % 10 == a) for a in (1, 3, 7, 9)}
+    # Counts hold φ(q) slots in coprime-residue order; q far above n is rejected.
+    assert count_chunk(2, 1001, 10) == [40, 42, 46, 38]
+    assert "error" in get("primes_in_progressions").run(1000, q=3 * 10**6)["meta"]
+
+
+def test_prime_power_sums_and_chebyshev_functions():
+    primes = primes_up_to(20_000)
+    for k in (0, 1, 2, 3):
+        assert prime_power_sum(20_000, k) == sum(p**k for p in primes)
+    assert prime_power_sum(10**9, 0) == 50847534
+    res = get("prime_power_sum").run(10**6, samples=12)
+    assert res["result"] == 37550402023
+    series = res["meta"]["series"]
+    assert series[-1] == {"x": 10**6, "value": 37550402023} and len(series) <= 12
+    for point in series[:6]:
+        assert point["value"] == sum(p for p in primes if p <= point["x"])
+
+    cheb = get("chebyshev_functions").run(20_000, samples=8)
+    theta = math.fsum(map(math.log, primes))
+    powers = [p**a for p in primes for a in range(2, 15) if p**a <= 20_000]
+    psi = theta + math.fsum(math.log(min(d for d in primes if q % d == 0)) for q in powers)
+    assert math.isclose(cheb["result"]["theta"], theta) and math.isclose(cheb["result"]["psi"], psi)
+    assert cheb["meta"]["series"][-1]["x"] == 20_000
+    assert get("prime_number_theorem").run(10**6)["result"]["actual"] == 78498
+
+
+def test_payload_shaping_by_mode_with_cursor_paging():
+    full = get("sieve_eratosthenes").run(10**6)
+    grid = shape(full, "grid", budget=100)
+    assert grid["result"]["kind"] == "buckets" and grid["result"]["length"] == 78498
+    assert sum(grid["result"]["counts"]) == 78498 and len(grid["result"]["counts"]) == 100
+    assert len(json.dumps(grid)) < 10_000
+    bars = shape(full, "bars", budget=100)["result"]
+    assert sum(w["count"] for w in bars["windows"]) == 78498 and bars["windows"][0]["min"] == 2
+
+    first = page(full, grid["result"]["cursor"], limit=4)
+    assert first["items"] == [2, 3, 5, 7] and page(full, first["next"], limit=2)["items"] == [11, 13]
+    assert page(full, "result@78496", limit=4)["next"] is None
+
+    cheb = get("chebyshev_functions").run(10**5, samples=400)
+    series = shape(cheb, "curve", budget=50)["meta"]["series"]
+    assert series["kind"] == "lttb" and len(series["items"]) == 50
+    assert series["items"][0] == cheb["meta"]["series"][0]
+    assert series["items"][-1] == cheb["meta"]["series"][-1]
+
+    xs = list(range(2000))
+    peak = lttb(xs, [math.exp(-((x - 1234) ** 2) / 50) for x in xs], 40)
+    assert 1234 in peak and len(peak) == 40
+    small = get("sieve_eratosthenes").run(100)
+    assert shape(small, "grid")["result"] == small["result"]
+
+    # graph: byte bitmaps become flag buckets, step chains keep both endpoints.
+    bitmap = quadratic_residue_bitmap(10_007)
+    residues = shape({"result": bitmap, "meta": {}}, "graph", budget=100)["result"]
+    assert residues["kind"] == "buckets" and sum(residues["counts"]) == sum(bitmap)
+    steps = [{"node": i, "next": i + 1} for i in range(500)]
+    chain = shape({"result": None, "meta": {"steps": steps}}, "graph", budget=50)["meta"]["steps"]
+    assert chain["kind"] == "chain" and len(chain["items"]) == 50 and chain["omitted"] == 450
+    assert chain["items"][0] == steps[0] and chain["items"][-1] == steps[-1]
+
+
+def test_goldbach_partitions_and_segmented_verification():
+    primes = set(primes_up_to(1000))
+    assert representation_counts(1000) == [
+        sum(1 for p in primes if n - p in primes) for n in range(1001)
+    ]
+    partitions = get("goldbach_partitions").run(1000)["result"]
+    assert partitions[:11] == [0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2]
+    assert partitions[100] == 6 and partitions[1000] == 28
+    assert get("goldbach_partitions").run(10, backend="fft")["result"] is None
+
+    res = get("goldbach_verify").run(10**7)
+    assert res["result"] is True and res["meta"]["checked"] == 4999999
+    assert (res["meta"]["max_min_prime"], res["meta"]["max_min_prime_at"]) == (751, 3807404)
+    window = get("goldbach_verify").run(100_000, lo=60_000, segment_size=1000)["meta"]
+    assert window["max_min_prime_at"] == 63274 and window["max_min_prime"] == 293
+    odd = get("goldbach_verify").run(100, segment_size=7)
+    assert odd["result"] is True and odd["meta"]["checked"] == 49
+    assert "error" in get("goldbach_verify").run(100, segment_size=0)["meta"]
+
+
+def test_cli_runs_batches_from_argv_and_files(tmp_path, capsysbinary, monkeypatch):
+    # The CLI turns timing off for the process; restore both settings afterwards.
+    monkeypatch.setenv("PRIME_FORMULAS_TIMING", "1")
+    monkeypatch.setattr("prime_formulas.results._timing_enabled", True)
+
+    load_all_algorithms()
+    for name, module in ALGORITHM_MODULES.items():
+        assert type(get(name)).__module__ == module
+    assert set(ALGORITHM_MODULES) == {meta.name for meta in list_algorithms()}
+
+    assert cli.main(["miller_rabin", "97", "561", "-p", "bases=[2, 3]"]) == 0
+    out, err = capsysbinary.readouterr()
+    records = [json.loads(line) for line in out.decode().splitlines()]
+    assert records == [{"n": 97, "result": True}, {"n": 561, "result": False}]
+    assert b"2 inputs" in err
+
+    source = tmp_path / "inputs.txt"
+    source.write_text("# header\n" + "\n".join(map(str, range(1000))) + "\n\n")
+    assert cli.main(["trial_division", "-i", str(source), "--format", "binary", "-q"]) == 0
+    out, err = capsysbinary.readouterr()
+    assert err == b"" and len(out) == 1000 * cli.RECORD.size
+    flags = [value for _, value in struct.iter_unpack("<Qq", out)]
+    assert [n for n, flag in enumerate(flags) if flag] == primes_up_to(999)
+
+    # Unrepresentable binary records and malformed lines are usage errors.
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["next_prime", str(2**64 - 1), "--format", "binary", "-q"])
+    assert exit_info.value.code == 2 and b"does not fit" in capsysbinary.readouterr().err
+    source.write_text("7\nx\n")
+    with pytest.raises(SystemExit):
+        cli.main(["trial_division", "-i", str(source), "-q"])
+    out, err = capsysbinary.readouterr()
+    assert out == b'{"n":7,"result":true}\n' and b"line 2: not an integer: 'x'" in err
+
+    # Unreadable inputs and unknown --param names are rejected before any run.
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["trial_division", "-i", str(tmp_path / "missing.txt"), "-q"])
+    assert exit_info.value.code == 2 and b"cannot read --input" in capsysbinary.readouterr().err
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["miller_rabin", "97", "-p", "bogus=1", "-q"])
+    assert exit_info.value.code == 2 and b"invalid --param" in capsysbinary.readouterr().err
+
+    # Errors raised by the algorithm itself are not reported as usage errors.
+    def failing_run(n):
+        raise ValueError("algorithm failure")
+
+    monkeypatch.setattr(get("trial_division"), "run", failing_run)
+    with pytest.raises(ValueError, match="algorithm failure"):
+        cli.main(["trial_division", "7", "-q"])